@@ -11,7 +11,7 @@ from alembic import context
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.utils.database import Base
-from app.models import player, game, lineup, lineup_player
+from app.models import player, game, lineup, lineup_player, team, venue, user, refresh_token
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -19,9 +19,14 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# 앱 시작 단계에서 호출할 때는 앱 로깅 설정을 덮어쓰지 않음
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
+# alembic.ini의 로컬 주소 대신 실행 환경의 DATABASE_URL 사용
+if os.getenv("DATABASE_URL"):
+    config.set_main_option("sqlalchemy.url", os.getenv("DATABASE_URL").replace("%", "%%"))
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 target_metadata = Base.metadata
@@ -63,6 +68,19 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # 앱이 잠금을 잡은 연결을 넘겨준 경우 그 연결로 실행 (app/utils/migrations.py)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection, target_metadata=target_metadata,
+            # SQLite는 ALTER를 거의 지원하지 않으므로 테이블을 다시 만드는 batch 모드로 생성/실행
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -71,7 +89,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata,
+            # SQLite는 ALTER를 거의 지원하지 않으므로 테이블을 다시 만드는 batch 모드로 생성/실행
+            render_as_batch=connection.dialect.name == "sqlite",
         )
 
         with context.begin_transaction():
@@ -0,0 +1,29 @@
+"""add_user_token_epoch
+
+Revision ID: c4d2e8a1b7f3
+Revises: change_player_number_to_string
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d2e8a1b7f3'
+down_revision: Union[str, Sequence[str], None] = 'change_player_number_to_string'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 비밀번호 변경/비활성화 때 증가시켜 이전에 발급한 토큰을 무효화
+    op.add_column('users', sa.Column('token_epoch', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_epoch')
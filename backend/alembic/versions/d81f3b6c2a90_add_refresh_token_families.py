@@ -0,0 +1,42 @@
+"""add_refresh_token_families
+
+Revision ID: d81f3b6c2a90
+Revises: c4d2e8a1b7f3
+Create Date: 2026-10-19 11:03:27.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f3b6c2a90'
+down_revision: Union[str, Sequence[str], None] = 'c4d2e8a1b7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('refresh_token_families',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('generation', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('revoked', sa.Boolean(), nullable=False, server_default=sa.false()),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_refresh_token_families_user_id'), 'refresh_token_families', ['user_id'], unique=False)
+    op.create_index(op.f('ix_refresh_token_families_expires_at'), 'refresh_token_families', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_refresh_token_families_expires_at'), table_name='refresh_token_families')
+    op.drop_index(op.f('ix_refresh_token_families_user_id'), table_name='refresh_token_families')
+    op.drop_table('refresh_token_families')
@@ -0,0 +1,59 @@
+"""add_hot_query_indexes
+
+Revision ID: e5a7c91d3f24
+Revises: d81f3b6c2a90
+Create Date: 2026-10-19 15:02:17.604391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c91d3f24'
+down_revision: Union[str, Sequence[str], None] = 'd81f3b6c2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스 이름, 테이블, 컬럼) - 모델 정의와 같은 이름 (benchmarks/index_check.py로 실행 계획 확인)
+INDEXES = [
+    ('ix_lineups_game_id', 'lineups', ['game_id']),
+    ('ix_lineup_players_lineup_id_batting_order', 'lineup_players', ['lineup_id', 'batting_order']),
+    ('ix_lineup_players_player_id', 'lineup_players', ['player_id']),
+    ('ix_players_created_at', 'players', ['created_at']),
+    ('ix_players_is_active_created_at', 'players', ['is_active', 'created_at']),
+    ('ix_players_role_created_at', 'players', ['role', 'created_at']),
+    ('ix_games_game_date', 'games', ['game_date']),
+    ('ix_games_status_game_date', 'games', ['status', 'game_date']),
+    ('ix_teams_is_our_team', 'teams', ['is_our_team']),
+]
+
+
+def _existing_indexes(inspector, table):
+    """테이블의 인덱스/유니크 제약 이름 -> 컬럼 목록"""
+    existing = {index['name']: index['column_names'] for index in inspector.get_indexes(table)}
+    for constraint in inspector.get_unique_constraints(table):
+        existing[constraint['name']] = constraint['column_names']
+    return existing
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing = _existing_indexes(inspector, table)
+        # 같은 컬럼으로 시작하는 인덱스가 이미 있으면 건너뜀 (예: uq_lineup_game_id)
+        if name in existing or any(cols[:len(columns)] == columns for cols in existing.values()):
+            continue
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in reversed(INDEXES):
+        if name in _existing_indexes(inspector, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,34 @@
+"""add_row_version_columns
+
+Revision ID: f3b8d2c61e07
+Revises: e5a7c91d3f24
+Create Date: 2026-10-19 21:40:52.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d2c61e07'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c91d3f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 조회 응답 ETag에 쓰는 수정 카운터 (수정할 때마다 +1)
+TABLES = ['teams', 'venues', 'players']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(table, sa.Column('row_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_column(table, 'row_version')
@@ -3,49 +3,85 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.utils.database import get_db
 from app.models.user import User
-from app.utils.auth import verify_token
+from app.utils.auth import decode_token
+from app.utils.auth_cache import AuthenticatedUser, user_state_cache
 # from app.enums.user_role import UserRole  # 문자열로 변경
 
 security = HTTPBearer()
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """현재 로그인한 사용자 정보 반환"""
-    token = credentials.credentials
-    username = verify_token(token)
-    
-    if username is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user = db.query(User).filter(User.username == username).first()
+def _credentials_exception(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+def _load_user_state(db: Session, payload: dict) -> AuthenticatedUser:
+    """캐시에 없을 때만 users 테이블 조회"""
+    user_id = payload.get("uid")
+    if user_id is not None:
+        cached = user_state_cache.get(user_id)
+        if cached is not None:
+            return cached
+        user = db.query(User).filter(User.id == user_id).first()
+    else:
+        # uid 클레임이 없는 이전 형식 토큰
+        user = db.query(User).filter(User.username == payload["sub"]).first()
+
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+        raise _credentials_exception("User not found")
+
+    state = AuthenticatedUser.from_user(user)
+    user_state_cache.put(state)
+    return state
+
+def authenticate_claims(db: Session, payload: dict) -> AuthenticatedUser:
+    """검증된 토큰 클레임을 현재 사용자 상태와 대조 (액세스/리프레시 토큰 공통)"""
+    user = _load_user_state(db, payload)
+
+    # 비밀번호 변경/비활성화 이전에 발급된 토큰 거부
+    if "uid" in payload and payload.get("ep") != user.token_epoch:
+        raise _credentials_exception("Token has been revoked")
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
+
+    return user
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> AuthenticatedUser:
+    """
+    현재 로그인한 사용자 정보 반환
+
+    토큰 클레임과 사용자 상태 캐시로 확인하므로 대부분의 요청은 DB를 조회하지 않습니다.
+    """
+    payload = decode_token(credentials.credentials)
+    if payload is None:
+        raise _credentials_exception("Invalid authentication credentials")
+    return authenticate_claims(db, payload)
+
+def get_current_user_record(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """현재 사용자의 DB 레코드 (정보 조회/수정이 필요한 엔드포인트 전용)"""
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if user is None:
+        raise _credentials_exception("User not found")
     return user
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_user(current_user: AuthenticatedUser = Depends(get_current_user)) -> AuthenticatedUser:
     """활성 사용자만 허용"""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
-def require_manager_role(current_user: User = Depends(get_current_active_user)) -> User:
+def require_manager_role(current_user: AuthenticatedUser = Depends(get_current_active_user)) -> AuthenticatedUser:
     """총무 권한 필요"""
     if current_user.role != "총무":
         raise HTTPException(
@@ -54,7 +90,7 @@ def require_manager_role(current_user: User = Depends(get_current_active_user))
         )
     return current_user
 
-def require_coach_role(current_user: User = Depends(get_current_active_user)) -> User:
+def require_coach_role(current_user: AuthenticatedUser = Depends(get_current_active_user)) -> AuthenticatedUser:
     """감독 권한 필요 (라인업 관리 전용)"""
     if current_user.role != "감독":
         raise HTTPException(
@@ -63,7 +99,7 @@ def require_coach_role(current_user: User = Depends(get_current_active_user)) ->
         )
     return current_user
 
-def require_coach_or_manager_role(current_user: User = Depends(get_current_active_user)) -> User:
+def require_coach_or_manager_role(current_user: AuthenticatedUser = Depends(get_current_active_user)) -> AuthenticatedUser:
     """감독 또는 총무 권한 필요 (일반 조회용)"""
     if current_user.role not in ["감독", "총무"]:
         raise HTTPException(
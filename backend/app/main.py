@@ -1,28 +1,38 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
 import uvicorn
 import os
-import subprocess
 
-from app.utils.database import engine, Base
-from app.routers import players, games, lineups, pdf, excel, auth, teams, venues
+from app.utils.database import DATABASE_REPLICA_URL
+from app.utils.migrations import prepare_database
+from app.routers import players, games, lineups, pdf, excel, auth, teams, venues, exports, metrics
+from app.services.export_jobs import export_jobs, prewarm_scheduler, warn_if_multiple_workers, EXPORT_PREWARM_ENABLED
+from app.utils.db_routing import track_writes
+from app.utils.query_stats import record_query_stats
+from app.utils.responses import ORJSONResponse
+from app.utils.compression import COMPRESSION_ENABLED, CompressionMiddleware
 
 # Import all models to ensure they are registered
-from app.models import player, game, lineup, lineup_player, user, team, venue
+from app.models import player, game, lineup, lineup_player, user, team, venue, refresh_token
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마 준비는 import 시점이 아니라 서버 시작 시 한 번 (app/utils/migrations.py)
+    prepare_database()
 
-# Run migrations if RUN_MIGRATIONS is set
-if os.getenv("RUN_MIGRATIONS") == "true":
-    try:
-        subprocess.run(["alembic", "upgrade", "head"], check=True)
-        print("Database migrations completed successfully")
-    except subprocess.CalledProcessError as e:
-        print(f"Migration failed: {e}")
-    except Exception as e:
-        print(f"Migration error: {e}")
+    # 내보내기 작업은 프로세스 메모리에 보관 (워커 하나 전제)
+    warn_if_multiple_workers()
+
+    # 곧 시작하는 경기의 라인업 내보내기를 미리 렌더링
+    if EXPORT_PREWARM_ENABLED:
+        prewarm_scheduler.start()
+
+    yield
+
+    prewarm_scheduler.stop()
+    export_jobs.shutdown()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -30,7 +40,10 @@ app = FastAPI(
     description="야구 라인업 관리 서비스 API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # orjson 인코딩 (app/utils/responses.py)
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -48,6 +61,11 @@ allowed_origins = [
 if os.getenv("ALLOWED_ORIGINS"):
     allowed_origins.extend(os.getenv("ALLOWED_ORIGINS").split(","))
 
+# 응답 압축 (br/gzip, 작은 응답과 이미 압축된 내보내기는 제외)
+# 라우터 바로 바깥에 두어 응답 본문을 한 번에 받음 (다른 미들웨어는 본문을 조각으로 다시 보냄)
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
 # HTTPS 강제 미들웨어
 @app.middleware("http")
 async def force_https_redirect(request: Request, call_next):
@@ -76,6 +94,10 @@ async def force_https_redirect(request: Request, call_next):
     response = await call_next(request)
     return response
 
+# 쓰기 직후 같은 사용자의 조회를 주 DB로 보내기 위한 기록 (복제본 사용 시)
+if DATABASE_REPLICA_URL:
+    app.middleware("http")(track_writes)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -84,6 +106,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 수/DB 시간 (Server-Timing 헤더, CORS 헤더를 볼 수 있도록 가장 바깥에 둠)
+app.middleware("http")(record_query_stats)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1", tags=["authentication"])
 app.include_router(teams.router, prefix="/api/v1/teams", tags=["teams"])
@@ -93,6 +118,8 @@ app.include_router(games.router, prefix="/api/v1/games", tags=["games"])
 app.include_router(lineups.router, prefix="/api/v1/lineups", tags=["lineups"])
 app.include_router(pdf.router, prefix="/api/v1/pdf", tags=["pdf"])
 app.include_router(excel.router, prefix="/api/v1/excel", tags=["excel"])
+app.include_router(exports.router, prefix="/api/v1/exports", tags=["exports"])
+app.include_router(metrics.router, prefix="/api/v1/metrics", tags=["metrics"])
 
 @app.get("/")
 async def root():
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.utils.database import Base
@@ -7,7 +7,7 @@ class Game(Base):
     __tablename__ = "games"
     
     id = Column(Integer, primary_key=True, index=True)
-    game_date = Column(DateTime, nullable=False)
+    game_date = Column(DateTime, nullable=False, index=True)
     venue_id = Column(Integer, nullable=False)  # 경기장 ID
     opponent_team_id = Column(Integer, nullable=False)  # 임시로 외래키 제거
     is_home = Column(Boolean, default=True)  # True: 홈경기, False: 어웨이경기
@@ -20,3 +20,8 @@ class Game(Base):
     # 관계
     # opponent_team = relationship("Team", foreign_keys=[opponent_team_id])  # 임시로 주석 처리
     lineups = relationship("Lineup", back_populates="game", cascade="all, delete-orphan")
+
+    # 상태별 경기 목록 (경기일 순)
+    __table_args__ = (
+        Index('ix_games_status_game_date', 'status', 'game_date'),
+    )
@@ -7,7 +7,7 @@ class Lineup(Base):
     __tablename__ = "lineups"
     
     id = Column(Integer, primary_key=True, index=True)
-    game_id = Column(Integer, ForeignKey("games.id"), nullable=False)
+    game_id = Column(Integer, ForeignKey("games.id"), nullable=False, index=True)
     name = Column(String(200), nullable=False)
     is_default = Column(Boolean, default=False)
     attendance_data = Column(Text, nullable=True)  # 출석 데이터를 JSON으로 저장
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, UniqueConstraint, CheckConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, UniqueConstraint, CheckConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.utils.database import Base
@@ -22,5 +22,8 @@ class LineupPlayer(Base):
     __table_args__ = (
         UniqueConstraint('lineup_id', 'position', name='uq_lineup_position'),
         UniqueConstraint('lineup_id', 'batting_order', name='uq_lineup_batting_order'),
-        CheckConstraint('batting_order >= 0 AND batting_order <= 9', name='ck_batting_order_range')
+        CheckConstraint('batting_order >= 0 AND batting_order <= 9', name='ck_batting_order_range'),
+        # 라인업별 선수 조회(타순 정렬, 타순/포지션 중복 확인)와 선수별 출전 기록
+        Index('ix_lineup_players_lineup_id_batting_order', 'lineup_id', 'batting_order'),
+        Index('ix_lineup_players_player_id', 'player_id'),
     )
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Date, Enum, ForeignKey
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Date, Enum, ForeignKey, Index
+from sqlalchemy.sql import func, literal_column
 from sqlalchemy.orm import relationship
 from app.utils.database import Base
 from app.enums.player_role import PlayerRole
@@ -33,5 +33,14 @@ class Player(Base):
     notes = Column(Text)
     
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 수정할 때마다 +1 (updated_at은 SQLite에서 초 단위라 1초 안의 수정을 구분하지 못함, ETag에 사용)
+    row_version = Column(Integer, nullable=False, default=0, server_default="0",
+                         onupdate=literal_column("row_version") + 1)
+
+    # 선수 목록 필터(활성 여부, 역할) + 최신 등록순 정렬
+    __table_args__ = (
+        Index('ix_players_is_active_created_at', 'is_active', 'created_at'),
+        Index('ix_players_role_created_at', 'role', 'created_at'),
+    )
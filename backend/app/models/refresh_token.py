@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.utils.database import Base
+
+class RefreshTokenFamily(Base):
+    """
+    리프레시 토큰 세션 (로그인 한 번 = 한 행)
+
+    토큰을 갱신할 때마다 generation이 1씩 올라가며, 이미 사용한 세대의 토큰이
+    다시 들어오면 탈취로 보고 세션 전체를 폐기합니다.
+    """
+    __tablename__ = "refresh_token_families"
+    
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    generation = Column(Integer, nullable=False, default=0)
+    revoked = Column(Boolean, nullable=False, default=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 from app.utils.database import Base
 
 class Team(Base):
@@ -10,9 +10,11 @@ class Team(Base):
     city = Column(String(50), nullable=True)  # 도시명 (예: 서울, 부산)
     league = Column(String(50), nullable=True)  # 리그 (예: KBO, MLB)
     is_active = Column(Boolean, default=True)
-    is_our_team = Column(Boolean, default=False)  # 우리팀 여부
+    is_our_team = Column(Boolean, default=False, index=True)  # 우리팀 여부
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    row_version = Column(Integer, nullable=False, default=0, server_default="0",
+                         onupdate=literal_column("row_version") + 1)  # 수정 카운터 (ETag용)
 
     def __repr__(self):
         return f"<Team(id={self.id}, name='{self.name}', city='{self.city}')>"
@@ -10,5 +10,6 @@ class User(Base):
     password_hash = Column(String(255), nullable=False)
     role = Column(String(20), nullable=False)  # '총무' 또는 '감독'
     is_active = Column(Boolean, default=True)
+    token_epoch = Column(Integer, nullable=False, default=0, server_default="0")  # 바뀌면 이전 토큰 무효
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 from app.utils.database import Base
 
 class Venue(Base):
@@ -15,3 +15,5 @@ class Venue(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    row_version = Column(Integer, nullable=False, default=0, server_default="0",
+                         onupdate=literal_column("row_version") + 1)  # 수정 카운터 (ETag용)
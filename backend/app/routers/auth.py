@@ -1,26 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from datetime import timedelta
+import asyncio
 from app.utils.database import get_db
 from app.models.user import User
-from app.schemas.user import UserCreate, UserResponse, Token, PasswordChange
-from app.utils.auth import verify_password, get_password_hash, create_access_token
-from app.dependencies.auth import get_current_user
+from app.schemas.user import UserCreate, UserResponse, Token, PasswordChange, RefreshTokenRequest, TokenRefresh
+from app.utils.auth import (
+    verify_password_async, get_password_hash_async, create_user_access_token, decode_token, REFRESH_TOKEN_TYPE
+)
+from app.utils.auth_cache import AuthenticatedUser, revoke_user_tokens, user_state_cache
+from app.utils.refresh_tokens import refresh_token_store
+from app.utils.login_throttle import login_throttle, client_ip, limit_auth_requests
+from app.dependencies.auth import get_current_user_record, authenticate_claims
 # from app.enums.user_role import UserRole  # 문자열로 변경
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
-# 토큰 만료 시간
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
-
 @router.post("/token", response_model=Token)
-async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(request: Request, form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """로그인"""
+    # 시도 제한 (한도 초과 시 bcrypt 검증 없이 429, 실패가 쌓이면 지연)
+    delay = login_throttle.check_login(client_ip(request), form_data.username)
+    if delay:
+        await asyncio.sleep(delay)
+
     # 사용자 조회
     user = db.query(User).filter(User.username == form_data.username).first()
     
-    if not user or not verify_password(form_data.password, user.password_hash):
+    verified, new_hash = (False, None)
+    if user:
+        password_hash = user.password_hash
+        # bcrypt 대기 중에 풀 커넥션을 잡고 있지 않도록 읽기 트랜잭션 종료
+        db.commit()
+        verified, new_hash = await verify_password_async(form_data.password, password_hash)
+
+    if not verified:
+        login_throttle.record_failure(form_data.username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -32,20 +47,65 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session =
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
+
+    login_throttle.record_success(form_data.username)
+
+    # BCRYPT_ROUNDS가 바뀌었으면 새 작업 비용으로 다시 저장
+    if new_hash:
+        user.password_hash = new_hash
+        db.commit()
+        db.refresh(user)
     
-    # JWT 토큰 생성
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
-    )
+    # JWT 토큰 생성 (액세스 토큰 + 세션 유지용 리프레시 토큰)
+    state = AuthenticatedUser.from_user(user)
+    user_state_cache.put(state)
+    access_token = create_user_access_token(state)
+    # 세션 행 커밋 후 user를 다시 조회하면 응답을 보낼 때까지 커넥션을 잡으므로 먼저 직렬화
+    user_data = UserResponse.model_validate(user)
+    refresh_token = refresh_token_store.issue(db, state)
     
     return {
         "access_token": access_token,
+        "refresh_token": refresh_token,
         "token_type": "bearer",
-        "user": user
+        "user": user_data
+    }
+
+@router.post("/refresh", response_model=TokenRefresh, dependencies=[Depends(limit_auth_requests)])
+async def refresh_access_token(request: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """토큰 갱신 (비밀번호 없이 새 액세스 토큰 발급, 리프레시 토큰은 매번 교체)"""
+    payload = decode_token(request.refresh_token, REFRESH_TOKEN_TYPE)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user = authenticate_claims(db, payload)
+    refresh_token = refresh_token_store.rotate(db, user, payload)
+    if refresh_token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return {
+        "access_token": create_user_access_token(user),
+        "refresh_token": refresh_token,
+        "token_type": "bearer"
     }
 
-@router.post("/register", response_model=UserResponse)
+@router.post("/logout", dependencies=[Depends(limit_auth_requests)])
+async def logout(request: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """로그아웃 (리프레시 토큰 세션 폐기)"""
+    payload = decode_token(request.refresh_token, REFRESH_TOKEN_TYPE)
+    if payload and payload.get("fam"):
+        refresh_token_store.revoke(db, payload["fam"])
+    return {"message": "로그아웃되었습니다."}
+
+@router.post("/register", response_model=UserResponse, dependencies=[Depends(limit_auth_requests)])
 async def register(user: UserCreate, db: Session = Depends(get_db)):
     """사용자 등록 (개발용)"""
     # 중복 사용자명 체크
@@ -56,8 +116,9 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
             detail="Username already registered"
         )
     
-    # 새 사용자 생성
-    hashed_password = get_password_hash(user.password)
+    # 새 사용자 생성 (bcrypt 대기 중에는 커넥션 반환)
+    db.commit()
+    hashed_password = await get_password_hash_async(user.password)
     db_user = User(
         username=user.username,
         password_hash=hashed_password,
@@ -71,29 +132,40 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     return db_user
 
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(current_user: User = Depends(get_current_user)):
+async def read_users_me(current_user: User = Depends(get_current_user_record)):
     """현재 사용자 정보 조회"""
     return current_user
 
-@router.post("/change-password")
+@router.post("/change-password", dependencies=[Depends(limit_auth_requests)])
 async def change_password(
     password_data: PasswordChange,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_record),
     db: Session = Depends(get_db)
 ):
-    """비밀번호 변경"""
+    """비밀번호 변경 (기존 토큰과 세션은 모두 무효화하고 새 토큰 반환)"""
     # 현재 비밀번호 확인
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    password_hash = current_user.password_hash
+    # bcrypt 대기 중에 풀 커넥션을 잡고 있지 않도록 읽기 트랜잭션 종료
+    db.commit()
+    verified, _ = await verify_password_async(password_data.current_password, password_hash)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 올바르지 않습니다."
         )
     
     # 새 비밀번호 해시화
-    new_password_hash = get_password_hash(password_data.new_password)
+    new_password_hash = await get_password_hash_async(password_data.new_password)
     
     # 비밀번호 업데이트
     current_user.password_hash = new_password_hash
+    revoke_user_tokens(current_user)
     db.commit()
-    
-    return {"message": "비밀번호가 성공적으로 변경되었습니다."}
+    db.refresh(current_user)
+
+    state = AuthenticatedUser.from_user(current_user)
+    return {
+        "message": "비밀번호가 성공적으로 변경되었습니다.",
+        "access_token": create_user_access_token(state),
+        "refresh_token": refresh_token_store.issue(db, state)
+    }
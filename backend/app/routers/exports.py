@@ -0,0 +1,84 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
+
+from app.schemas.export import ExportJobCreate, ExportJobResponse
+from app.dependencies.auth import get_current_active_user
+from app.services.export_jobs import export_jobs, ExportJob, COMPLETED
+from app.services.export_service import EXPORT_FORMATS
+from app.services.appearance_export import iter_appearance_csv, CSV_MEDIA_TYPE
+
+router = APIRouter()
+
+def _job_response(job: ExportJob) -> dict:
+    return {
+        "id": job.id,
+        "lineup_id": job.lineup_id,
+        "format": job.export_format,
+        "status": job.status,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+        "error": job.error,
+        "download_url": f"/api/v1/exports/{job.id}/download" if job.status == COMPLETED else None,
+    }
+
+@router.post("/", response_model=ExportJobResponse, status_code=202)
+async def create_export_job(
+    export_request: ExportJobCreate,
+    current_user = Depends(get_current_active_user)
+):
+    """내보내기 작업 등록"""
+    if export_request.format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {export_request.format}")
+
+    job = export_jobs.submit(export_request.lineup_id, export_request.format, owner_id=current_user.id)
+    return _job_response(job)
+
+@router.get("/appearances.csv")
+async def export_appearances_csv(
+    year: Optional[int] = Query(None, ge=2000, le=2100),
+    current_user = Depends(get_current_active_user)
+):
+    """전체 출전 기록 CSV (라인업 선수 + 선수/경기/상대팀/경기장)"""
+    filename = f"appearances_{year}.csv" if year else "appearances.csv"
+    return StreamingResponse(
+        iter_appearance_csv(year),
+        media_type=CSV_MEDIA_TYPE,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+@router.get("/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    current_user = Depends(get_current_active_user)
+):
+    """내보내기 작업 상태 조회 (본인이 등록한 작업만)"""
+    job = export_jobs.get(job_id, owner_id=current_user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return _job_response(job)
+
+@router.get("/{job_id}/download")
+async def download_export_job(
+    job_id: str,
+    current_user = Depends(get_current_active_user)
+):
+    """완료된 내보내기 결과 다운로드 (본인이 등록한 작업만)"""
+    job = export_jobs.get(job_id, owner_id=current_user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if job.status != COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Export job is {job.status}")
+
+    # 결과가 캐시에서 밀려났으면 다시 렌더링하므로 스레드 풀에서 실행
+    content = await run_in_threadpool(export_jobs.content, job)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Lineup not found")
+
+    export_format = EXPORT_FORMATS[job.export_format]
+    return Response(
+        content=content,
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f"attachment; filename=lineup_{job.lineup_id}.{export_format.extension}"}
+    )
@@ -1,37 +1,45 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.utils.database import get_db
+from app.utils.database import get_async_db, get_async_read_db
+from app.utils.query_stats import query_budget
+from app.utils.responses import trusted_response
 from app.models.game import Game
+from app.models.lineup import Lineup
+from app.models.team import Team
+from app.models.venue import Venue
 from app.schemas.game import GameCreate, GameUpdate, GameResponse
 from app.dependencies.auth import get_current_active_user, require_manager_role
+from app.services.game_context import load_teams_and_venues
 
 router = APIRouter()
 
-@router.get("/", response_model=List[GameResponse])
+async def _count_lineups(db: AsyncSession, game_id: int) -> int:
+    return await db.scalar(select(func.count()).select_from(Lineup).where(Lineup.game_id == game_id))
+
+@router.get("/", response_model=List[GameResponse], dependencies=[Depends(query_budget(3))])
 async def get_games(
     skip: int = 0,
     limit: int = 20,
     status: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """경기 목록 조회"""
-    from app.models.team import Team
-    
-    query = db.query(Game)
+    query = select(Game)
     
     if status:
-        query = query.filter(Game.status == status)
+        query = query.where(Game.status == status)
     
-    games = query.offset(skip).limit(limit).all()
+    games = (await db.scalars(query.offset(skip).limit(limit))).all()
     
-    # 각 경기에 팀 정보와 경기장 정보 포함
-    from app.models.venue import Venue
+    # 각 경기에 팀 정보와 경기장 정보 포함 (경기 수와 관계없이 한 번씩 조회)
+    teams, venues = await load_teams_and_venues(db, games)
     result = []
     for game in games:
-        opponent_team = db.query(Team).filter(Team.id == game.opponent_team_id).first()
-        venue = db.query(Venue).filter(Venue.id == game.venue_id).first()
+        opponent_team = teams.get(game.opponent_team_id)
+        venue = venues.get(game.venue_id)
         game_dict = {
             "id": game.id,
             "game_date": game.game_date,
@@ -60,20 +68,17 @@ async def get_games(
         }
         result.append(game_dict)
     
-    return result
+    return trusted_response(GameResponse, result)
 
-@router.get("/{game_id}", response_model=GameResponse)
-async def get_game(game_id: int, db: Session = Depends(get_db)):
+@router.get("/{game_id}", response_model=GameResponse, dependencies=[Depends(query_budget(3))])
+async def get_game(game_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """경기 상세 조회"""
-    from app.models.team import Team
-    
-    game = db.query(Game).filter(Game.id == game_id).first()
+    game = await db.get(Game, game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    opponent_team = db.query(Team).filter(Team.id == game.opponent_team_id).first()
-    from app.models.venue import Venue
-    venue = db.query(Venue).filter(Venue.id == game.venue_id).first()
+    opponent_team = await db.get(Team, game.opponent_team_id)
+    venue = await db.get(Venue, game.venue_id)
     
     return {
         "id": game.id,
@@ -105,27 +110,25 @@ async def get_game(game_id: int, db: Session = Depends(get_db)):
 @router.post("/", response_model=GameResponse)
 async def create_game(
     game: GameCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_manager_role)
 ):
     """경기 등록"""
     try:
         # 상대팀 존재 확인
-        from app.models.team import Team
-        from app.models.venue import Venue
-        opponent_team = db.query(Team).filter(Team.id == game.opponent_team_id).first()
+        opponent_team = await db.get(Team, game.opponent_team_id)
         if not opponent_team:
             raise HTTPException(status_code=400, detail="상대팀을 찾을 수 없습니다")
         
         # 경기장 존재 확인
-        venue = db.query(Venue).filter(Venue.id == game.venue_id).first()
+        venue = await db.get(Venue, game.venue_id)
         if not venue:
             raise HTTPException(status_code=400, detail="경기장을 찾을 수 없습니다")
         
         db_game = Game(**game.model_dump())
         db.add(db_game)
-        db.commit()
-        db.refresh(db_game)
+        await db.commit()
+        await db.refresh(db_game)
         
         # 팀 정보와 경기장 정보 포함하여 반환
         return GameResponse(
@@ -155,7 +158,7 @@ async def create_game(
             }
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"경기 생성 에러: {e}")
         raise HTTPException(status_code=400, detail=f"경기 생성 실패: {str(e)}")
 
@@ -163,55 +166,51 @@ async def create_game(
 async def update_game(
     game_id: int, 
     game: GameUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_manager_role)
 ):
     """경기 수정"""
-    db_game = db.query(Game).filter(Game.id == game_id).first()
+    db_game = await db.get(Game, game_id)
     if not db_game:
         raise HTTPException(status_code=404, detail="Game not found")
     
     for key, value in game.model_dump(exclude_unset=True).items():
         setattr(db_game, key, value)
     
-    db.commit()
-    db.refresh(db_game)
+    await db.commit()
+    await db.refresh(db_game)
     return db_game
 
 @router.delete("/{game_id}")
 async def delete_game(
     game_id: int, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_manager_role)
 ):
     """경기 삭제"""
-    from app.models.lineup import Lineup
-    
-    game = db.query(Game).filter(Game.id == game_id).first()
+    game = await db.get(Game, game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
     # 연결된 라인업이 있는지 확인
-    existing_lineups = db.query(Lineup).filter(Lineup.game_id == game_id).count()
+    existing_lineups = await _count_lineups(db, game_id)
     if existing_lineups > 0:
         raise HTTPException(
             status_code=400, 
             detail="연결된 오더지가 있습니다. 먼저 오더지를 삭제해 주세요."
         )
     
-    db.delete(game)
-    db.commit()
+    await db.delete(game)
+    await db.commit()
     return {"message": "Game deleted successfully"}
 
 @router.get("/{game_id}/lineups/count")
-async def get_game_lineups_count(game_id: int, db: Session = Depends(get_db)):
+async def get_game_lineups_count(game_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """경기의 라인업 개수 조회"""
-    from app.models.lineup import Lineup
-    
-    game = db.query(Game).filter(Game.id == game_id).first()
+    game = await db.get(Game, game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    lineups_count = db.query(Lineup).filter(Lineup.game_id == game_id).count()
+    lineups_count = await _count_lineups(db, game_id)
     
     return {"lineups_count": lineups_count}
@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List, Dict
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from starlette.concurrency import run_in_threadpool
+from typing import List, Dict, Optional
 from pydantic import BaseModel
 
-from app.utils.database import get_db
+from app.utils.database import get_async_db, get_async_read_db
+from app.utils.query_stats import query_budget
+from app.utils.responses import trusted_response
 from app.models.lineup import Lineup
 from app.models.lineup_player import LineupPlayer
 from app.schemas.lineup import LineupCreate, LineupUpdate, LineupResponse, LineupPlayerResponse, LineupPlayerCreate
 from app.dependencies.auth import get_current_active_user, require_coach_role
+from app.services.lineup_document import load_lineup_document, ROSTER_SCOPES
+from app.services.lineup_card import (
+    CARD_FORMATS, DEFAULT_CARD_WIDTH, MIN_CARD_WIDTH, MAX_CARD_WIDTH, DEFAULT_CARD_QUALITY, CardFontUnavailable
+)
+from app.services.export_service import render_export
+from app.services.game_context import GameContext, load_game_contexts
 
 # 출석 상태 스키마
 class AttendanceUpdate(BaseModel):
@@ -15,98 +27,20 @@ class AttendanceUpdate(BaseModel):
 
 router = APIRouter()
 
-@router.get("/", response_model=List[LineupResponse])
-async def get_lineups(
-    skip: int = 0,
-    limit: int = 20,
-    game_id: int = None,
-    db: Session = Depends(get_db)
-):
-    """라인업 목록 조회"""
-    from app.models.game import Game
-    from app.models.team import Team
-    from app.models.venue import Venue
-    
-    query = db.query(Lineup)
-    
-    if game_id:
-        query = query.filter(Lineup.game_id == game_id)
-    
-    lineups = query.offset(skip).limit(limit).all()
-    
-    # 각 라인업에 경기 정보 추가
-    result = []
-    for lineup in lineups:
-        # 경기 정보 조회
-        game = db.query(Game).filter(Game.id == lineup.game_id).first()
-        if game:
-            # 상대팀 정보 조회
-            opponent_team = db.query(Team).filter(Team.id == game.opponent_team_id).first()
-            # 경기장 정보 조회
-            venue = db.query(Venue).filter(Venue.id == game.venue_id).first()
-            
-            # 경기 정보를 딕셔너리로 변환
-            game_data = {
-                "id": game.id,
-                "game_date": game.game_date,
-                "is_home": game.is_home,
-                "game_type": game.game_type,
-                "status": game.status,
-                "opponent_team": {
-                    "id": opponent_team.id,
-                    "name": opponent_team.name
-                } if opponent_team else None,
-                "venue": {
-                    "id": venue.id,
-                    "name": venue.name,
-                    "location": venue.location
-                } if venue else None
-            }
-            
-            # 라인업 객체에 경기 정보 추가
-            lineup_dict = {
-                "id": lineup.id,
-                "game_id": lineup.game_id,
-                "name": lineup.name,
-                "is_default": lineup.is_default,
-                "created_at": lineup.created_at,
-                "updated_at": lineup.updated_at,
-                "lineup_players": lineup.lineup_players,
-                "game": game_data
-            }
-            result.append(lineup_dict)
-        else:
-            result.append(lineup)
-    
-    return result
+async def _get_lineup_with_players(db: AsyncSession, lineup_id: int) -> Optional[Lineup]:
+    """라인업과 선수 목록을 함께 조회 (응답 직렬화 중 지연 로딩이 일어나지 않도록)"""
+    return await db.scalar(
+        select(Lineup)
+        .options(selectinload(Lineup.lineup_players).selectinload(LineupPlayer.player))
+        .where(Lineup.id == lineup_id)
+        .execution_options(populate_existing=True)
+    )
 
-@router.get("/{lineup_id}", response_model=LineupResponse)
-async def get_lineup(lineup_id: int, db: Session = Depends(get_db)):
-    """라인업 상세 조회"""
-    from app.models.game import Game
-    from app.models.team import Team
-    from app.models.venue import Venue
-    from app.models.player import Player
-    from sqlalchemy.orm import joinedload
-    
-    # 선수 정보를 함께 로드
-    lineup = db.query(Lineup).options(
-        joinedload(Lineup.lineup_players).joinedload(LineupPlayer.player)
-    ).filter(Lineup.id == lineup_id).first()
-    
-    if not lineup:
-        raise HTTPException(status_code=404, detail="Lineup not found")
-    
-    # 라인업 플레이어들은 이미 올바른 관계로 로드되었으므로 그대로 사용
-    lineup_players_with_details = lineup.lineup_players
-    
-    # 경기 정보 조회
-    game = db.query(Game).filter(Game.id == lineup.game_id).first()
-    if game:
-        # 상대팀 정보 조회
-        opponent_team = db.query(Team).filter(Team.id == game.opponent_team_id).first()
-        # 경기장 정보 조회
-        venue = db.query(Venue).filter(Venue.id == game.venue_id).first()
+def _lineup_dict(lineup: Lineup, game_context: Optional[GameContext] = None) -> dict:
+    """라인업 응답 (경기 정보 포함, 경기가 없으면 game=None)"""
+    game_data = None
+    if game_context:
+        game, opponent_team, venue = game_context
         
         # 경기 정보를 딕셔너리로 변환
         game_data = {
@@ -125,43 +59,127 @@ async def get_lineup(lineup_id: int, db: Session = Depends(get_db)):
                 "location": venue.location
             } if venue else None
         }
-        
-        # 라인업 객체에 경기 정보 추가
-        lineup_dict = {
-            "id": lineup.id,
-            "game_id": lineup.game_id,
-            "name": lineup.name,
-            "is_default": lineup.is_default,
-            "created_at": lineup.created_at,
-            "updated_at": lineup.updated_at,
-            "lineup_players": lineup_players_with_details,
-            "game": game_data
-        }
-        return lineup_dict
     
-    return lineup
+    return {
+        "id": lineup.id,
+        "game_id": lineup.game_id,
+        "name": lineup.name,
+        "is_default": lineup.is_default,
+        "created_at": lineup.created_at,
+        "updated_at": lineup.updated_at,
+        "lineup_players": lineup.lineup_players,
+        "game": game_data
+    }
+
+async def _lineup_response(db: AsyncSession, lineup_id: int) -> dict:
+    """선수 목록과 경기 정보를 포함한 라인업 응답 조회"""
+    lineup = await _get_lineup_with_players(db, lineup_id)
+    game_contexts = await load_game_contexts(db, [lineup.game_id])
+    return _lineup_dict(lineup, game_contexts.get(lineup.game_id))
+
+async def _get_lineup_player(db: AsyncSession, lineup_id: int, lineup_player_id: int) -> Optional[LineupPlayer]:
+    return await db.scalar(
+        select(LineupPlayer).where(
+            LineupPlayer.id == lineup_player_id,
+            LineupPlayer.lineup_id == lineup_id
+        )
+    )
+
+@router.get("/", response_model=List[LineupResponse], dependencies=[Depends(query_budget(6))])
+async def get_lineups(
+    skip: int = 0,
+    limit: int = 20,
+    game_id: int = None,
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """라인업 목록 조회"""
+    query = select(Lineup).options(
+        selectinload(Lineup.lineup_players).selectinload(LineupPlayer.player)
+    )
+    
+    if game_id:
+        query = query.where(Lineup.game_id == game_id)
+    
+    lineups = (await db.scalars(query.offset(skip).limit(limit))).all()
+    
+    # 경기, 상대팀, 경기장 정보는 라인업 수와 관계없이 한 번씩 조회
+    game_contexts = await load_game_contexts(db, (lineup.game_id for lineup in lineups))
+    
+    # 각 라인업에 경기 정보 추가 (데이터베이스 값 그대로라 재검증 없이 인코딩)
+    return trusted_response(
+        LineupResponse, [_lineup_dict(lineup, game_contexts.get(lineup.game_id)) for lineup in lineups]
+    )
+
+@router.get("/{lineup_id}", response_model=LineupResponse, dependencies=[Depends(query_budget(6))])
+async def get_lineup(lineup_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """라인업 상세 조회"""
+    # 선수 정보를 함께 로드
+    lineup = await _get_lineup_with_players(db, lineup_id)
+    
+    if not lineup:
+        raise HTTPException(status_code=404, detail="Lineup not found")
+    
+    # 경기 정보 조회
+    game_contexts = await load_game_contexts(db, [lineup.game_id])
+    return _lineup_dict(lineup, game_contexts.get(lineup.game_id))
+
+@router.get("/{lineup_id}/card.{image_format}")
+async def get_lineup_card_image(
+    lineup_id: int,
+    image_format: str,
+    width: int = Query(DEFAULT_CARD_WIDTH, ge=MIN_CARD_WIDTH, le=MAX_CARD_WIDTH),
+    quality: int = Query(DEFAULT_CARD_QUALITY, ge=30, le=95),
+    roster: str = "all",
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user = Depends(get_current_active_user)
+):
+    """라인업 카드 이미지 (메신저 공유용 PNG/JPEG, roster: all, present)"""
+    if image_format not in CARD_FORMATS:
+        raise HTTPException(status_code=404, detail="Unsupported image format")
+    if roster not in ROSTER_SCOPES:
+        raise HTTPException(status_code=400, detail=f"Unknown roster scope: {roster}")
+
+    # 문서 로더는 동기 코드이므로 같은 연결을 쓰는 동기 세션으로 실행
+    document = await db.run_sync(load_lineup_document, lineup_id)
+    if not document:
+        raise HTTPException(status_code=404, detail="Lineup not found")
+
+    if CARD_FORMATS[image_format][0] == "PNG":
+        options = {"width": width, "roster": roster}
+        export_format = "png"
+    else:
+        options = {"width": width, "quality": quality, "roster": roster}
+        export_format = "jpg"
+    try:
+        # 이미지 렌더링은 CPU 작업이므로 이벤트 루프 밖에서
+        content = await run_in_threadpool(render_export, document, export_format, **options)
+    except CardFontUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return Response(
+        content=content,
+        media_type=CARD_FORMATS[image_format][1],
+        headers={"Content-Disposition": f"inline; filename=lineup_{lineup_id}.{image_format}"}
+    )
 
 @router.post("/", response_model=LineupResponse)
 async def create_lineup(
     lineup: LineupCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업 생성"""
-    from app.models.game import Game
-    from app.models.team import Team
-    from app.models.venue import Venue
-    
     # 기존 라인업이 있는지 확인
-    existing_lineup = db.query(Lineup).filter(Lineup.game_id == lineup.game_id).first()
+    existing_lineup = await db.scalar(
+        select(Lineup)
+        .options(selectinload(Lineup.lineup_players).selectinload(LineupPlayer.player))
+        .where(Lineup.game_id == lineup.game_id)
+        .limit(1)
+    )
     if existing_lineup:
         # 기존 라인업이 있으면 그 라인업을 반환
-        game = db.query(Game).filter(Game.id == existing_lineup.game_id).first()
-        if game:
-            # 상대팀 정보 조회
-            opponent_team = db.query(Team).filter(Team.id == game.opponent_team_id).first()
-            # 경기장 정보 조회
-            venue = db.query(Venue).filter(Venue.id == game.venue_id).first()
+        game_contexts = await load_game_contexts(db, [existing_lineup.game_id])
+        if existing_lineup.game_id in game_contexts:
+            game, opponent_team, venue = game_contexts[existing_lineup.game_id]
             
             # 경기 정보를 딕셔너리로 변환
             game_data = {
@@ -190,21 +208,18 @@ async def create_lineup(
             }
             return lineup_dict
         
-        return existing_lineup
+        return _lineup_dict(existing_lineup)
     
     # 새 라인업 생성
     db_lineup = Lineup(**lineup.dict())
     db.add(db_lineup)
-    db.commit()
-    db.refresh(db_lineup)
+    await db.commit()
+    db_lineup = await _get_lineup_with_players(db, db_lineup.id)
     
     # 경기 정보 조회
-    game = db.query(Game).filter(Game.id == db_lineup.game_id).first()
-    if game:
-        # 상대팀 정보 조회
-        opponent_team = db.query(Team).filter(Team.id == game.opponent_team_id).first()
-        # 경기장 정보 조회
-        venue = db.query(Venue).filter(Venue.id == game.venue_id).first()
+    game_contexts = await load_game_contexts(db, [db_lineup.game_id])
+    if db_lineup.game_id in game_contexts:
+        game, opponent_team, venue = game_contexts[db_lineup.game_id]
         
         # 경기 정보를 딕셔너리로 변환
         game_data = {
@@ -233,83 +248,82 @@ async def create_lineup(
         }
         return lineup_dict
     
-    return db_lineup
+    return _lineup_dict(db_lineup)
 
 @router.put("/{lineup_id}", response_model=LineupResponse)
 async def update_lineup(
     lineup_id: int, 
     lineup: LineupUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업 수정"""
-    db_lineup = db.query(Lineup).filter(Lineup.id == lineup_id).first()
+    db_lineup = await _get_lineup_with_players(db, lineup_id)
     if not db_lineup:
         raise HTTPException(status_code=404, detail="Lineup not found")
     
     for key, value in lineup.dict(exclude_unset=True).items():
         setattr(db_lineup, key, value)
     
-    db.commit()
-    db.refresh(db_lineup)
-    return db_lineup
+    await db.commit()
+    return await _lineup_response(db, lineup_id)
 
 @router.delete("/{lineup_id}")
 async def delete_lineup(
     lineup_id: int, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업 삭제"""
-    lineup = db.query(Lineup).filter(Lineup.id == lineup_id).first()
+    lineup = await db.get(Lineup, lineup_id)
     if not lineup:
         raise HTTPException(status_code=404, detail="Lineup not found")
     
-    db.delete(lineup)
-    db.commit()
+    await db.delete(lineup)
+    await db.commit()
     return {"message": "Lineup deleted successfully"}
 
 @router.post("/{lineup_id}/players", response_model=LineupPlayerResponse)
 async def add_player_to_lineup(
     lineup_id: int,
     player_data: LineupPlayerCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업에 선수 추가"""
     # Check if lineup exists
-    lineup = db.query(Lineup).filter(Lineup.id == lineup_id).first()
+    lineup = await db.get(Lineup, lineup_id)
     if not lineup:
         raise HTTPException(status_code=404, detail="Lineup not found")
     
     # Check if player exists
     from app.models.player import Player
-    player = db.query(Player).filter(Player.id == player_data.player_id).first()
+    player = await db.get(Player, player_data.player_id)
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
     # Check for player conflicts
     # 같은 타순에 기존 선수가 있으면 모두 삭제 (교체)
-    existing_players = db.query(LineupPlayer).filter(
+    existing_players = (await db.scalars(select(LineupPlayer).where(
         LineupPlayer.lineup_id == lineup_id,
         LineupPlayer.batting_order == player_data.batting_order
-    ).all()
+    ))).all()
     
     for existing_player in existing_players:
-        db.delete(existing_player)
+        await db.delete(existing_player)
     
     # 변경사항을 먼저 커밋하여 unique constraint 충돌 방지
-    db.commit()
+    await db.commit()
     
     # 포지션 중복 체크 (1~9번 타자들만, 투수 제외)
     if 1 <= player_data.batting_order <= 9 and player_data.position and player_data.position != 'P':
         # 같은 포지션에 다른 선수가 있는지 확인
-        existing_player = db.query(LineupPlayer).filter(
+        existing_player = await db.scalar(select(LineupPlayer).where(
             LineupPlayer.lineup_id == lineup_id,
             LineupPlayer.position == player_data.position,
             LineupPlayer.batting_order >= 1,
             LineupPlayer.batting_order <= 9
-        ).first()
+        ).limit(1))
         
         if existing_player:
             raise HTTPException(
@@ -328,8 +342,8 @@ async def add_player_to_lineup(
         **player_data_dict
     )
     db.add(lineup_player)
-    db.commit()
-    db.refresh(lineup_player)
+    await db.commit()
+    await db.refresh(lineup_player, ["player"])
     
     return lineup_player
 
@@ -338,14 +352,11 @@ async def update_lineup_player_position(
     lineup_id: int,
     lineup_player_id: int,
     position_data: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업 플레이어 포지션 업데이트"""
-    lineup_player = db.query(LineupPlayer).filter(
-        LineupPlayer.id == lineup_player_id,
-        LineupPlayer.lineup_id == lineup_id
-    ).first()
+    lineup_player = await _get_lineup_player(db, lineup_id, lineup_player_id)
     
     if not lineup_player:
         raise HTTPException(status_code=404, detail="Lineup player not found")
@@ -358,13 +369,13 @@ async def update_lineup_player_position(
     # 중복 체크: 1~9번 타자들만 포지션 중복 체크
     if new_position and new_position != 'P':
         # 같은 포지션에 다른 선수가 있는지 확인 (1~9번만)
-        existing_player = db.query(LineupPlayer).filter(
+        existing_player = await db.scalar(select(LineupPlayer).where(
             LineupPlayer.lineup_id == lineup_id,
             LineupPlayer.position == new_position,
             LineupPlayer.batting_order >= 1,
             LineupPlayer.batting_order <= 9,
             LineupPlayer.id != lineup_player_id  # 현재 업데이트 중인 레코드 제외
-        ).first()
+        ).limit(1))
         
         if existing_player:
             raise HTTPException(
@@ -373,7 +384,7 @@ async def update_lineup_player_position(
             )
     
     lineup_player.position = new_position
-    db.commit()
+    await db.commit()
     
     return {"message": "Player position updated successfully"}
 
@@ -381,20 +392,17 @@ async def update_lineup_player_position(
 async def remove_player_from_lineup(
     lineup_id: int,
     lineup_player_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업에서 선수 제거"""
-    lineup_player = db.query(LineupPlayer).filter(
-        LineupPlayer.id == lineup_player_id,
-        LineupPlayer.lineup_id == lineup_id
-    ).first()
+    lineup_player = await _get_lineup_player(db, lineup_id, lineup_player_id)
     
     if not lineup_player:
         raise HTTPException(status_code=404, detail="Lineup player not found")
     
-    db.delete(lineup_player)
-    db.commit()
+    await db.delete(lineup_player)
+    await db.commit()
     return {"message": "Player removed from lineup successfully"}
 
 @router.post("/{lineup_id}/copy", response_model=LineupResponse)
@@ -402,11 +410,11 @@ async def copy_lineup(
     lineup_id: int,
     new_name: str,
     new_game_id: int = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업 복사"""
-    original_lineup = db.query(Lineup).filter(Lineup.id == lineup_id).first()
+    original_lineup = await _get_lineup_with_players(db, lineup_id)
     if not original_lineup:
         raise HTTPException(status_code=404, detail="Lineup not found")
     
@@ -417,8 +425,7 @@ async def copy_lineup(
         is_default=False
     )
     db.add(new_lineup)
-    db.commit()
-    db.refresh(new_lineup)
+    await db.commit()
     
     # Copy lineup players
     for lineup_player in original_lineup.lineup_players:
@@ -431,18 +438,18 @@ async def copy_lineup(
         )
         db.add(new_lineup_player)
     
-    db.commit()
-    return new_lineup
+    await db.commit()
+    return await _lineup_response(db, new_lineup.id)
 
 @router.get("/{lineup_id}/attendance")
 async def get_lineup_attendance(
     lineup_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user = Depends(get_current_active_user)
 ):
     """라인업의 출석 상태 조회"""
     try:
-        lineup = db.query(Lineup).filter(Lineup.id == lineup_id).first()
+        lineup = await db.get(Lineup, lineup_id)
         if not lineup:
             raise HTTPException(status_code=404, detail="Lineup not found")
         
@@ -466,11 +473,11 @@ async def get_lineup_attendance(
 async def update_lineup_attendance(
     lineup_id: int,
     attendance_data: AttendanceUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업의 출석 상태 업데이트"""
-    lineup = db.query(Lineup).filter(Lineup.id == lineup_id).first()
+    lineup = await db.get(Lineup, lineup_id)
     if not lineup:
         raise HTTPException(status_code=404, detail="Lineup not found")
     
@@ -478,7 +485,7 @@ async def update_lineup_attendance(
     import json
     attendance_json = json.dumps(attendance_data.attendance)
     lineup.attendance_data = attendance_json
-    db.commit()
+    await db.commit()
     
     return {"message": "Attendance updated successfully"}
 
@@ -487,30 +494,27 @@ async def update_lineup_player_position(
     lineup_id: int,
     lineup_player_id: int,
     position_data: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_coach_role)
 ):
     """라인업 선수의 포지션 업데이트"""
     # 라인업 존재 확인
-    lineup = db.query(Lineup).filter(Lineup.id == lineup_id).first()
+    lineup = await db.get(Lineup, lineup_id)
     if not lineup:
         raise HTTPException(status_code=404, detail="Lineup not found")
     
     # 라인업 선수 존재 확인
-    lineup_player = db.query(LineupPlayer).filter(
-        LineupPlayer.id == lineup_player_id,
-        LineupPlayer.lineup_id == lineup_id
-    ).first()
+    lineup_player = await _get_lineup_player(db, lineup_id, lineup_player_id)
     if not lineup_player:
         raise HTTPException(status_code=404, detail="Lineup player not found")
     
     # 포지션 중복 확인 (같은 포지션이 다른 선수에게 할당되어 있는지)
     if position_data.get('position') and position_data['position'] != '':
-        existing_player = db.query(LineupPlayer).filter(
+        existing_player = await db.scalar(select(LineupPlayer).where(
             LineupPlayer.lineup_id == lineup_id,
             LineupPlayer.position == position_data['position'],
             LineupPlayer.id != lineup_player_id
-        ).first()
+        ).limit(1))
         
         if existing_player:
             raise HTTPException(
@@ -520,6 +524,6 @@ async def update_lineup_player_position(
     
     # 포지션 업데이트
     lineup_player.position = position_data.get('position', '')
-    db.commit()
+    await db.commit()
     
     return {"message": "Position updated successfully"}
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.dependencies.auth import require_manager_role
+from app.utils.pool_metrics import pool_metrics_snapshot
+from app.utils.slow_queries import slow_query_log
+
+router = APIRouter()
+
+@router.get("/db-pool")
+async def get_db_pool_metrics(current_user = Depends(require_manager_role)):
+    """
+    커넥션 풀 지표 (엔진별)
+
+    wait_ms는 풀에서 연결을 얻기까지 기다린 시간, saturated_checkouts는 오버플로까지
+    모두 사용 중이던 체크아웃 수입니다. 포화가 잦으면 DB_POOL_SIZE/DB_MAX_OVERFLOW를 늘립니다.
+    """
+    return pool_metrics_snapshot()
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    current_user = Depends(require_manager_role)
+):
+    """
+    최근 느린 쿼리 (최신순, 프로세스 단위)
+
+    SLOW_QUERY_MS보다 오래 걸린 SQL의 문장, 가린 파라미터, 라우트, 실행 계획입니다.
+    explain이 null이고 explain_error도 없으면 실행 계획을 아직 수집 중입니다.
+    """
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "total": slow_query_log.total,
+        "entries": slow_query_log.entries(limit),
+    }
+
+@router.delete("/slow-queries")
+async def clear_slow_queries(current_user = Depends(require_manager_role)):
+    """느린 쿼리 기록 비우기 (튜닝 후 다시 측정할 때)"""
+    slow_query_log.clear()
+    return {"message": "Slow query log cleared"}
@@ -1,50 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from typing import List
 import logging
 
-from app.utils.database import get_db
+from app.utils.database import get_async_db, get_async_read_db
+from app.utils.http_cache import CacheValidators, validators_statement
+from app.utils.query_stats import query_budget
+from app.utils.responses import trusted_response
 from app.models.player import Player
-from app.schemas.player import PlayerCreate, PlayerUpdate, PlayerResponse
+from app.schemas.player import PlayerCreate, PlayerUpdate, PlayerResponse, PlayerImportReport
+from app.services.player_import import parse_import_file, apply_import
 from app.dependencies.auth import get_current_active_user, require_manager_role
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.get("/", response_model=List[PlayerResponse])
+@router.get("/", response_model=List[PlayerResponse], dependencies=[Depends(query_budget(2))])
 async def get_players(
+    request: Request,
     skip: int = 0,
     limit: int = 20,
     active: bool = None,
     role: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """선수 목록 조회"""
-    query = db.query(Player)
+    conditions = []
     
     if active is not None:
-        query = query.filter(Player.is_active == active)
+        conditions.append(Player.is_active == active)
     
     if role:
-        query = query.filter(Player.role == role)
+        conditions.append(Player.role == role)
+    
+    # 바뀐 것이 없으면 행을 읽지 않고 304
+    validators = CacheValidators.from_row(
+        (await db.execute(validators_statement(Player, *conditions))).one(), PlayerResponse, request.url.query
+    )
+    if validators.matches(request):
+        return validators.not_modified()
     
     # 최신 선수가 먼저 나오도록 created_at 기준 내림차순 정렬
-    players = query.order_by(Player.created_at.desc()).offset(skip).limit(limit).all()
-    return players
+    query = select(Player).where(*conditions).order_by(Player.created_at.desc()).offset(skip).limit(limit)
+    players = (await db.scalars(query)).all()
+    return trusted_response(PlayerResponse, players, headers=validators.headers())
 
-@router.get("/{player_id}", response_model=PlayerResponse)
-async def get_player(player_id: int, db: Session = Depends(get_db)):
+@router.get("/{player_id}", response_model=PlayerResponse, dependencies=[Depends(query_budget(2))])
+async def get_player(player_id: int, request: Request, db: AsyncSession = Depends(get_async_read_db)):
     """선수 상세 조회"""
-    player = db.query(Player).filter(Player.id == player_id).first()
-    if not player:
+    row = (await db.execute(
+        select(Player.created_at, Player.updated_at, Player.row_version).where(Player.id == player_id)
+    )).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Player not found")
-    return player
+    
+    validators = CacheValidators.from_row((1, *row), PlayerResponse, player_id, collection=False)
+    if validators.matches(request):
+        return validators.not_modified()
+    
+    player = await db.get(Player, player_id)
+    return trusted_response(PlayerResponse, player, headers=validators.headers())
 
 @router.post("/", response_model=PlayerResponse)
 async def create_player(
     player: PlayerCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_manager_role)
 ):
     """선수 등록"""
@@ -56,24 +79,47 @@ async def create_player(
         
         db_player = Player(**player_data)
         db.add(db_player)
-        db.commit()
-        db.refresh(db_player)
+        await db.commit()
+        await db.refresh(db_player)
         return db_player
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"선수 생성 에러: {e}")
         raise HTTPException(status_code=400, detail=f"선수 생성 실패: {str(e)}")
 
+@router.post("/import", response_model=PlayerImportReport)
+async def import_player_sheet(
+    file: UploadFile = File(...),
+    dry_run: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(require_manager_role)
+):
+    """선수 명단 일괄 등록 (XLSX/CSV, 배번 기준 등록 또는 수정)"""
+    content = await file.read()
+    try:
+        # 파일 읽기/검증은 CPU 작업이므로 이벤트 루프 밖에서
+        parsed = await run_in_threadpool(parse_import_file, file.filename or "", content)
+        # DB 반영은 동기 코드이므로 같은 연결을 쓰는 동기 세션으로 실행 (쿼리 2번)
+        report = await db.run_sync(apply_import, parsed, dry_run=dry_run)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"선수 일괄 등록 에러: {e}")
+        raise HTTPException(status_code=400, detail=f"선수 일괄 등록 실패: {str(e)}")
+
+    logger.info(f"선수 일괄 등록 - 등록 {report.created}, 수정 {report.updated}, 오류 {report.failed}, 반영 {report.applied}")
+    return report
+
 @router.put("/{player_id}", response_model=PlayerResponse)
 async def update_player(
     player_id: int, 
     player: PlayerUpdate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(require_manager_role)
 ):
     """선수 수정"""
     try:
-        db_player = db.query(Player).filter(Player.id == player_id).first()
+        db_player = await db.get(Player, player_id)
         if not db_player:
             raise HTTPException(status_code=404, detail="Player not found")
         
@@ -87,25 +133,25 @@ async def update_player(
         for key, value in update_data.items():
             setattr(db_player, key, value)
         
-        db.commit()
-        db.refresh(db_player)
+        await db.commit()
+        await db.refresh(db_player)
         return db_player
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"선수 수정 에러: {e}")
         raise HTTPException(status_code=400, detail=f"선수 수정 실패: {str(e)}")
 
 @router.delete("/{player_id}")
 async def delete_player(
     player_id: int, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """선수 삭제"""
     logger.info(f"선수 삭제 요청 - 선수 ID: {player_id}")
-    player = db.query(Player).filter(Player.id == player_id).first()
+    player = await db.get(Player, player_id)
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
-    db.delete(player)
-    db.commit()
+    await db.delete(player)
+    await db.commit()
     return {"message": "Player deleted successfully"}
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.utils.database import get_db
+from app.utils.database import get_db, get_read_db
+from app.utils.http_cache import CacheValidators, validators_statement
 from app.models.team import Team
 from app.schemas.team import TeamCreate, TeamUpdate, TeamResponse
 from app.dependencies.auth import get_current_active_user, require_manager_role
@@ -11,30 +13,47 @@ router = APIRouter()
 
 @router.get("/", response_model=List[TeamResponse])
 async def get_teams(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 20,
     active: bool = None,
     league: str = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """팀 목록 조회"""
-    query = db.query(Team)
+    conditions = []
     
     if active is not None:
-        query = query.filter(Team.is_active == active)
+        conditions.append(Team.is_active == active)
     
     if league:
-        query = query.filter(Team.league == league)
+        conditions.append(Team.league == league)
     
-    teams = query.offset(skip).limit(limit).all()
+    # 바뀐 것이 없으면 행을 읽지 않고 304
+    validators = CacheValidators.from_row(
+        db.execute(validators_statement(Team, *conditions)).one(), TeamResponse, request.url.query
+    )
+    if validators.matches(request):
+        return validators.not_modified()
+    
+    teams = db.query(Team).filter(*conditions).offset(skip).limit(limit).all()
+    validators.apply(response)
     return teams
 
 @router.get("/{team_id}", response_model=TeamResponse)
-async def get_team(team_id: int, db: Session = Depends(get_db)):
+async def get_team(team_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """팀 상세 조회"""
-    team = db.query(Team).filter(Team.id == team_id).first()
-    if not team:
+    row = db.execute(select(Team.created_at, Team.updated_at, Team.row_version).where(Team.id == team_id)).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Team not found")
+    
+    validators = CacheValidators.from_row((1, *row), TeamResponse, team_id, collection=False)
+    if validators.matches(request):
+        return validators.not_modified()
+    
+    team = db.query(Team).filter(Team.id == team_id).first()
+    validators.apply(response)
     return team
 
 @router.post("/", response_model=TeamResponse)
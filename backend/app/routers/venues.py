@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.utils.database import get_db
+from app.utils.database import get_db, get_read_db
+from app.utils.http_cache import CacheValidators, validators_statement
 from app.models.venue import Venue
 from app.schemas.venue import VenueCreate, VenueUpdate, VenueResponse
 from app.dependencies.auth import require_manager_role
@@ -11,26 +13,43 @@ router = APIRouter()
 
 @router.get("/", response_model=List[VenueResponse])
 async def get_venues(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     active: bool = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """경기장 목록 조회"""
-    query = db.query(Venue)
+    conditions = []
     
     if active is not None:
-        query = query.filter(Venue.is_active == active)
+        conditions.append(Venue.is_active == active)
     
-    venues = query.offset(skip).limit(limit).all()
+    # 바뀐 것이 없으면 행을 읽지 않고 304
+    validators = CacheValidators.from_row(
+        db.execute(validators_statement(Venue, *conditions)).one(), VenueResponse, request.url.query
+    )
+    if validators.matches(request):
+        return validators.not_modified()
+    
+    venues = db.query(Venue).filter(*conditions).offset(skip).limit(limit).all()
+    validators.apply(response)
     return venues
 
 @router.get("/{venue_id}", response_model=VenueResponse)
-async def get_venue(venue_id: int, db: Session = Depends(get_db)):
+async def get_venue(venue_id: int, request: Request, response: Response, db: Session = Depends(get_read_db)):
     """경기장 상세 조회"""
-    venue = db.query(Venue).filter(Venue.id == venue_id).first()
-    if not venue:
+    row = db.execute(select(Venue.created_at, Venue.updated_at, Venue.row_version).where(Venue.id == venue_id)).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Venue not found")
+    
+    validators = CacheValidators.from_row((1, *row), VenueResponse, venue_id, collection=False)
+    if validators.matches(request):
+        return validators.not_modified()
+    
+    venue = db.query(Venue).filter(Venue.id == venue_id).first()
+    validators.apply(response)
     return venue
 
 @router.post("/", response_model=VenueResponse)
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class ExportJobCreate(BaseModel):
+    lineup_id: int
+    format: str = "pdf"  # pdf, xlsx, png, jpg
+
+class ExportJobResponse(BaseModel):
+    id: str
+    lineup_id: int
+    format: str
+    status: str  # PENDING, RUNNING, COMPLETED, FAILED
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import List, Optional
 from datetime import date, datetime
 from app.enums.player_role import PlayerRole
 
@@ -53,3 +53,18 @@ class PlayerResponse(PlayerBase):
 
     class Config:
         from_attributes = True
+
+class PlayerImportRow(BaseModel):
+    row: int  # 시트 행 번호 (헤더 = 1)
+    number: Optional[str] = None
+    name: Optional[str] = None
+    action: str  # created, updated, error
+    errors: List[str] = []
+
+class PlayerImportReport(BaseModel):
+    applied: bool  # 오류가 있거나 dry_run이면 False (아무것도 저장하지 않음)
+    total: int
+    created: int
+    updated: int
+    failed: int
+    rows: List[PlayerImportRow]
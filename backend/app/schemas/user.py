@@ -27,6 +27,15 @@ class Token(BaseModel):
     access_token: str
     token_type: str
     user: UserResponse
+    refresh_token: Optional[str] = None
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+class TokenRefresh(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str
 
 class TokenData(BaseModel):
     username: Optional[str] = None
@@ -0,0 +1,90 @@
+"""
+출전 기록 CSV 내보내기
+모든 라인업 선수 기록을 선수/경기/상대팀/경기장과 조인해 CSV로 스트리밍합니다.
+
+서버 측 커서(yield_per)로 일정 개수씩 가져와 바로 인코딩해 내보내므로,
+행 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+from datetime import datetime
+from io import StringIO
+from typing import Iterator, Optional
+import csv
+
+from sqlalchemy import select
+
+from app.models.game import Game
+from app.models.lineup import Lineup
+from app.models.lineup_player import LineupPlayer
+from app.models.player import Player
+from app.models.team import Team
+from app.models.venue import Venue
+from app.utils.database import SessionLocal
+
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+# 한 번에 가져와 인코딩하는 행 수
+APPEARANCE_BATCH_SIZE = 1000
+
+APPEARANCE_COLUMNS = (
+    "game_id", "game_date", "game_type", "game_status", "is_home",
+    "opponent_team", "venue",
+    "lineup_id", "lineup_name",
+    "player_id", "player_number", "player_name", "player_role",
+    "batting_order", "position", "is_starter",
+)
+
+
+def appearance_query(year: Optional[int] = None):
+    """출전 기록 조회 쿼리 (경기일, 라인업, 타순 순)"""
+    stmt = (
+        select(
+            Game.id, Game.game_date, Game.game_type, Game.status, Game.is_home,
+            Team.name, Venue.name,
+            Lineup.id, Lineup.name,
+            Player.id, Player.number, Player.name, Player.role,
+            LineupPlayer.batting_order, LineupPlayer.position, LineupPlayer.is_starter,
+        )
+        .select_from(LineupPlayer)
+        .join(Lineup, Lineup.id == LineupPlayer.lineup_id)
+        .join(Game, Game.id == Lineup.game_id)
+        .join(Player, Player.id == LineupPlayer.player_id)
+        .outerjoin(Team, Team.id == Game.opponent_team_id)
+        .outerjoin(Venue, Venue.id == Game.venue_id)
+        .order_by(Game.game_date, Lineup.id, LineupPlayer.batting_order)
+    )
+    if year is not None:
+        stmt = stmt.where(Game.game_date >= datetime(year, 1, 1), Game.game_date < datetime(year + 1, 1, 1))
+    return stmt
+
+
+def _csv_values(row) -> tuple:
+    values = list(row)
+    values[1] = values[1].isoformat() if values[1] else ""  # game_date
+    values[12] = values[12].value if values[12] else ""     # player_role
+    return values
+
+
+def iter_appearance_csv(year: Optional[int] = None, batch_size: int = APPEARANCE_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    출전 기록 CSV를 배치 단위로 인코딩해 반환 (StreamingResponse용)
+
+    요청 의존성의 세션은 응답 전송 전에 닫히므로 자체 세션을 열고,
+    스트리밍이 끝나거나 클라이언트가 끊으면 닫습니다.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    writer.writerow(APPEARANCE_COLUMNS)
+    yield buffer.getvalue().encode("utf-8-sig")
+
+    db = SessionLocal()
+    try:
+        result = db.execute(appearance_query(year).execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(_csv_values(row) for row in rows)
+            yield buffer.getvalue().encode("utf-8")
+    finally:
+        db.close()
@@ -0,0 +1,270 @@
+"""
+비동기 내보내기 작업
+요청 핸들러 대신 로컬 워커 풀에서 PDF/엑셀/이미지를 렌더링하고,
+곧 시작하는 경기의 라인업을 미리 렌더링해 두는 스케줄러를 제공합니다.
+
+작업 목록과 렌더링 캐시는 프로세스 메모리에만 있으므로 API는 워커 프로세스 하나로 실행합니다
+(uvicorn 기본값, Procfile/Dockerfile 그대로). 워커가 여럿이면 다른 워커가 만든 작업은
+GET /exports/{id}에서 404가 되고, 사전 렌더링도 워커마다 따로 돕니다.
+
+완료된 작업은 결과 바이트 대신 렌더링 캐시(export_cache)의 키만 가지며, 작업은 등록한 사용자만
+조회할 수 있습니다 (사전 렌더링 작업은 소유자 없음).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
+from typing import Dict, List, Optional
+import logging
+import os
+import uuid
+
+from app.models.game import Game
+from app.models.lineup import Lineup
+from app.services.export_service import (
+    render_export, export_cache, export_cache_key, is_export_cached, DEFAULT_EXPORT_OPTIONS
+)
+from app.services.lineup_document import load_lineup_document
+from app.utils.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", "2"))
+EXPORT_MAX_JOBS = int(os.getenv("EXPORT_MAX_JOBS", "500"))
+EXPORT_JOB_TTL_MINUTES = int(os.getenv("EXPORT_JOB_TTL_MINUTES", "60"))
+
+EXPORT_PREWARM_ENABLED = os.getenv("EXPORT_PREWARM_ENABLED", "false").lower() == "true"
+EXPORT_PREWARM_INTERVAL_SECONDS = int(os.getenv("EXPORT_PREWARM_INTERVAL_SECONDS", "900"))
+EXPORT_PREWARM_HOURS = int(os.getenv("EXPORT_PREWARM_HOURS", "24"))
+PREWARM_FORMATS = ("pdf", "xlsx", "png")
+
+
+@dataclass
+class ExportJob:
+    """내보내기 작업"""
+    id: str
+    lineup_id: int
+    export_format: str
+    owner_id: Optional[int] = None  # 등록한 사용자 ID (사전 렌더링 작업은 None)
+    status: str = PENDING
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    cache_key: Optional[tuple] = field(default=None, repr=False)  # 완료 시 export_cache 키
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+
+class ExportJobManager:
+    """작업 저장소 + 워커 풀 (프로세스 단위, 메모리 보관)"""
+
+    def __init__(self, max_workers: int = EXPORT_WORKERS, max_jobs: int = EXPORT_MAX_JOBS,
+                 job_ttl: timedelta = timedelta(minutes=EXPORT_JOB_TTL_MINUTES)):
+        self.max_workers = max_workers
+        self.max_jobs = max_jobs
+        self.job_ttl = job_ttl
+        self._jobs: Dict[str, ExportJob] = {}
+        self._lock = Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # import 시점이 아니라 첫 작업 시점에 스레드 생성
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="export")
+        return self._executor
+
+    def submit(self, lineup_id: int, export_format: str, owner_id: Optional[int] = None) -> ExportJob:
+        """작업 등록 (같은 소유자의 같은 라인업/형식 작업이 진행 중이면 그 작업 반환)"""
+        with self._lock:
+            self._prune()
+            for job in self._jobs.values():
+                if (job.lineup_id == lineup_id and job.export_format == export_format
+                        and job.owner_id == owner_id and not job.is_done):
+                    return job
+
+            job = ExportJob(id=uuid.uuid4().hex, lineup_id=lineup_id, export_format=export_format,
+                            owner_id=owner_id)
+            self._jobs[job.id] = job
+            executor = self._get_executor()
+
+        executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str, owner_id: Optional[int] = None) -> Optional[ExportJob]:
+        """작업 조회 (다른 사용자의 작업은 None)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.owner_id != owner_id:
+            return None
+        return job
+
+    def has_active_job(self, lineup_id: int, export_format: str) -> bool:
+        with self._lock:
+            return any(
+                job.lineup_id == lineup_id and job.export_format == export_format and not job.is_done
+                for job in self._jobs.values()
+            )
+
+    def content(self, job: ExportJob) -> Optional[bytes]:
+        """
+        완료된 작업의 결과 (캐시에서 밀려났으면 현재 라인업으로 다시 렌더링)
+
+        Returns:
+            파일 바이트, 그사이 라인업이 삭제됐으면 None
+        """
+        content = export_cache.get(job.cache_key)
+        if content is not None:
+            return content
+        db = SessionLocal()
+        try:
+            document = load_lineup_document(db, job.lineup_id)
+        finally:
+            db.close()
+        if document is None:
+            return None
+        return render_export(document, job.export_format, **DEFAULT_EXPORT_OPTIONS[job.export_format])
+
+    def _prune(self) -> None:
+        """만료된 작업 삭제 후, 그래도 많으면 오래된 완료 작업부터 삭제"""
+        expire_before = datetime.utcnow() - self.job_ttl
+        finished = [j for j in self._jobs.values() if j.is_done and j.finished_at is not None]
+        for job in finished:
+            if job.finished_at < expire_before:
+                del self._jobs[job.id]
+
+        overflow = len(self._jobs) - self.max_jobs + 1
+        if overflow > 0:
+            remaining = sorted((j for j in finished if j.id in self._jobs), key=lambda j: j.finished_at)
+            for job in remaining[:overflow]:
+                del self._jobs[job.id]
+
+    def _run(self, job: ExportJob) -> None:
+        job.status = RUNNING
+        db = SessionLocal()
+        try:
+            document = load_lineup_document(db, job.lineup_id)
+            if document is None:
+                self._finish(job, FAILED, error="Lineup not found")
+                return
+            options = DEFAULT_EXPORT_OPTIONS[job.export_format]
+            render_export(document, job.export_format, **options)
+            self._finish(job, COMPLETED, cache_key=export_cache_key(document, job.export_format, **options))
+        except Exception as e:
+            logger.exception(f"내보내기 작업 실패: {job.id}")
+            self._finish(job, FAILED, error=str(e))
+        finally:
+            db.close()
+
+    @staticmethod
+    def _finish(job: ExportJob, status: str, cache_key: Optional[tuple] = None, error: Optional[str] = None) -> None:
+        # _prune은 다른 스레드에서 is_done인 작업의 finished_at을 비교하므로 상태는 마지막에 바꿈
+        job.cache_key = cache_key
+        job.error = error
+        job.finished_at = datetime.utcnow()
+        job.status = status
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+export_jobs = ExportJobManager()
+
+
+def warn_if_multiple_workers() -> None:
+    """워커가 여럿이면 경고 (uvicorn/gunicorn은 WEB_CONCURRENCY로 워커 수 지정)"""
+    workers = int(os.getenv("WEB_CONCURRENCY", "1") or "1")
+    if workers > 1:
+        logger.warning(
+            f"WEB_CONCURRENCY={workers}: 내보내기 작업은 프로세스 메모리에 보관되므로 "
+            "다른 워커에서 조회하면 404가 됩니다. API는 워커 하나로 실행하세요."
+        )
+
+
+def find_upcoming_lineup_ids(hours: int = EXPORT_PREWARM_HOURS) -> List[int]:
+    """지금부터 hours 시간 안에 시작하는 경기의 라인업 ID"""
+    now = datetime.now()
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Lineup.id)
+            .join(Game, Game.id == Lineup.game_id)
+            .filter(
+                Game.game_date >= now,
+                Game.game_date < now + timedelta(hours=hours),
+                Game.status != "CANCELLED",
+            )
+            .all()
+        )
+        return [lineup_id for (lineup_id,) in rows]
+    finally:
+        db.close()
+
+
+def prewarm_upcoming_exports(hours: int = EXPORT_PREWARM_HOURS, formats=PREWARM_FORMATS) -> List[ExportJob]:
+    """
+    곧 시작하는 경기의 라인업을 미리 렌더링
+
+    현재 내용이 이미 캐시에 있거나 같은 라인업/형식 작업이 진행 중이면 작업을 만들지 않으므로,
+    반환값은 새로 등록한 작업만 포함합니다.
+    """
+    jobs = []
+    for lineup_id in find_upcoming_lineup_ids(hours):
+        db = SessionLocal()
+        try:
+            document = load_lineup_document(db, lineup_id)
+        finally:
+            db.close()
+        if document is None:
+            continue
+        for export_format in formats:
+            if is_export_cached(document, export_format, **DEFAULT_EXPORT_OPTIONS[export_format]):
+                continue
+            if export_jobs.has_active_job(lineup_id, export_format):
+                continue
+            jobs.append(export_jobs.submit(lineup_id, export_format))
+    return jobs
+
+
+class ExportPrewarmScheduler:
+    """주기적으로 prewarm_upcoming_exports를 실행하는 백그라운드 스레드"""
+
+    def __init__(self, interval_seconds: int = EXPORT_PREWARM_INTERVAL_SECONDS, hours: int = EXPORT_PREWARM_HOURS):
+        self.interval_seconds = interval_seconds
+        self.hours = hours
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._loop, name="export-prewarm", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                jobs = prewarm_upcoming_exports(self.hours)
+                if jobs:
+                    logger.info(f"내보내기 사전 렌더링 작업 {len(jobs)}건 등록")
+            except Exception as e:
+                logger.warning(f"내보내기 사전 렌더링 실패: {e}")
+            self._stop.wait(self.interval_seconds)
+
+
+prewarm_scheduler = ExportPrewarmScheduler()
@@ -0,0 +1,76 @@
+"""
+내보내기 서비스
+형식별 렌더러를 한곳에 모으고, 결과를 내용 기반 캐시로 재사용합니다.
+"""
+
+from typing import Callable, Dict, NamedTuple
+
+from app.services.lineup_card import render_lineup_card, DEFAULT_CARD_WIDTH, DEFAULT_CARD_QUALITY
+from app.services.lineup_document import LineupDocument
+from app.services.lineup_excel import render_lineup_excel, XLSX_MEDIA_TYPE
+from app.services.lineup_pdf import render_lineup_pdf, get_pdf_profile, DEFAULT_PDF_PROFILE
+from app.services.render_cache import RenderCache
+
+
+class ExportFormat(NamedTuple):
+    """내보내기 형식"""
+    extension: str
+    media_type: str
+    render: Callable[..., bytes]
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {
+    "pdf": ExportFormat(
+        "pdf", "application/pdf",
+        lambda document, profile=None, roster="all": render_lineup_pdf(
+            document, get_pdf_profile(profile), roster_scope=roster
+        ),
+    ),
+    "xlsx": ExportFormat("xlsx", XLSX_MEDIA_TYPE, render_lineup_excel),
+    "png": ExportFormat(
+        "png", "image/png",
+        lambda document, **options: render_lineup_card(document, image_format="png", **options),
+    ),
+    "jpg": ExportFormat(
+        "jpg", "image/jpeg",
+        lambda document, **options: render_lineup_card(document, image_format="jpg", **options),
+    ),
+}
+
+# 다운로드 엔드포인트의 기본 옵션 (사전 렌더링도 같은 옵션으로 해야 캐시가 맞음)
+DEFAULT_EXPORT_OPTIONS: Dict[str, dict] = {
+    "pdf": {"profile": DEFAULT_PDF_PROFILE, "roster": "all"},
+    "xlsx": {},
+    "png": {"width": DEFAULT_CARD_WIDTH, "roster": "all"},
+    "jpg": {"width": DEFAULT_CARD_WIDTH, "quality": DEFAULT_CARD_QUALITY, "roster": "all"},
+}
+
+export_cache = RenderCache(max_entries=256, max_bytes=64 * 1024 * 1024)
+
+
+def export_cache_key(document: LineupDocument, export_format: str, **options) -> tuple:
+    return (document.content_key, export_format, tuple(sorted(options.items())))
+
+
+def render_export(document: LineupDocument, export_format: str, **options) -> bytes:
+    """
+    라인업 내보내기 (캐시 우선)
+
+    Args:
+        document: 라인업 문서 데이터
+        export_format: EXPORT_FORMATS의 키
+        options: 형식별 렌더러 옵션 (pdf: profile, roster, png/jpg: width, quality)
+
+    Returns:
+        파일 바이트
+    """
+    key = export_cache_key(document, export_format, **options)
+    content = export_cache.get(key)
+    if content is None:
+        content = EXPORT_FORMATS[export_format].render(document, **options)
+        export_cache.put(key, content)
+    return content
+
+
+def is_export_cached(document: LineupDocument, export_format: str, **options) -> bool:
+    return export_cache.contains(export_cache_key(document, export_format, **options))
@@ -0,0 +1,46 @@
+"""
+경기 부가 정보 로더 (비동기)
+경기 목록/라인업 목록 응답에 붙는 상대팀과 경기장을 경기 수와 관계없이 한 번씩만 조회합니다.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.game import Game
+from app.models.team import Team
+from app.models.venue import Venue
+
+GameContext = Tuple[Game, Optional[Team], Optional[Venue]]
+
+
+async def load_teams_and_venues(
+    db: AsyncSession, games: Iterable[Game]
+) -> Tuple[Dict[int, Team], Dict[int, Venue]]:
+    """경기들의 상대팀/경기장을 ID별로 조회 (쿼리 최대 2번)"""
+    games = list(games)
+    team_ids = {game.opponent_team_id for game in games}
+    venue_ids = {game.venue_id for game in games}
+
+    teams = {}
+    if team_ids:
+        teams = {team.id: team for team in await db.scalars(select(Team).where(Team.id.in_(team_ids)))}
+    venues = {}
+    if venue_ids:
+        venues = {venue.id: venue for venue in await db.scalars(select(Venue).where(Venue.id.in_(venue_ids)))}
+    return teams, venues
+
+
+async def load_game_contexts(db: AsyncSession, game_ids: Iterable[int]) -> Dict[int, GameContext]:
+    """경기 ID -> (경기, 상대팀, 경기장), 없는 경기는 빠짐 (쿼리 최대 3번)"""
+    game_ids = set(game_ids)
+    if not game_ids:
+        return {}
+
+    games = (await db.scalars(select(Game).where(Game.id.in_(game_ids)))).all()
+    teams, venues = await load_teams_and_venues(db, games)
+    return {
+        game.id: (game, teams.get(game.opponent_team_id), venues.get(game.venue_id))
+        for game in games
+    }
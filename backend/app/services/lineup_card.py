@@ -0,0 +1,156 @@
+"""
+라인업 카드 이미지 렌더러
+PDF 라인업 시트와 같은 내용을 메신저 공유용 PNG/JPEG 이미지로 그립니다.
+명단은 PDF와 같은 범위(roster)를 따르되, 한 장에 보이도록 MAX_CARD_ROSTER_ROWS행까지만 그리고
+나머지는 "외 N명"으로 표시합니다. 한글 TrueType 폰트(fonts-nanum 등)가 필요합니다.
+"""
+
+from functools import lru_cache
+from io import BytesIO
+from typing import Sequence
+import logging
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.services.lineup_document import LineupDocument, LINEUP_HEADERS, ROSTER_HEADERS
+from app.services.lineup_pdf import HANGUL_FONT_PATHS, capped_roster_rows
+
+logger = logging.getLogger(__name__)
+
+# 이미지 형식: 확장자 → (Pillow 형식, MIME 타입)
+CARD_FORMATS = {
+    "png": ("PNG", "image/png"),
+    "jpg": ("JPEG", "image/jpeg"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+
+DEFAULT_CARD_WIDTH = 1080
+MIN_CARD_WIDTH = 320
+MAX_CARD_WIDTH = 2160
+DEFAULT_CARD_QUALITY = 80
+# 카드 명단 최대 행 수 (PDF의 MAX_ROSTER_ROWS를 쓰면 2000명 명단에서 높이가 수만 px가 됨)
+MAX_CARD_ROSTER_ROWS = 30
+
+# 기준 폭(1080px)에서의 레이아웃 (px)
+BASE_WIDTH = 1080
+MARGIN = 40
+COLUMN_GAP = 40
+SECTION_GAP = 30
+ROW_HEIGHT = 44
+FONT_SIZE = 22
+GAME_INFO_WIDTHS = [110, 450]
+LINEUP_WIDTHS = [70, 120, 190, 90, 90]
+ROSTER_WIDTHS = [80, 160, 80, 80]
+
+# 흑백만 사용하므로 그레이스케일(L)로 그려 파일 크기를 줄임
+BLACK = 0
+WHITE = 255
+HEADER_GREY = 169  # reportlab colors.darkgrey
+
+# PNG는 16단계 회색 팔레트(4bit)로 저장 (안티앨리어싱 유지, 8bit 대비 약 30% 작음)
+_PNG_LEVELS_LUT = [value >> 4 for value in range(256)]
+_PNG_GREY_PALETTE = [channel for level in range(16) for channel in (level * 17,) * 3]
+
+
+class CardFontUnavailable(RuntimeError):
+    """한글 폰트가 없어 카드를 그릴 수 없음 (Pillow 기본 폰트에는 한글 글리프가 없음)"""
+
+
+@lru_cache(maxsize=16)
+def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    for font_path in HANGUL_FONT_PATHS:
+        if os.path.exists(font_path):
+            return ImageFont.truetype(font_path, size)
+    raise CardFontUnavailable(
+        "라인업 카드에 쓸 한글 폰트가 없습니다 (fonts-nanum 설치 필요): " + ", ".join(HANGUL_FONT_PATHS)
+    )
+
+
+def _draw_table(draw: ImageDraw.ImageDraw, x: int, y: int, widths: Sequence[int], rows: Sequence[Sequence[str]],
+                row_height: int, font, header: bool, line_width: int) -> int:
+    """표를 그리고 표 아래쪽 y 좌표 반환"""
+    for row_idx, row in enumerate(rows):
+        is_header = header and row_idx == 0
+        top = y + row_idx * row_height
+        left = x
+        for width, text in zip(widths, row):
+            draw.rectangle(
+                [left, top, left + width, top + row_height],
+                fill=HEADER_GREY if is_header else WHITE,
+                outline=BLACK,
+                width=line_width,
+            )
+            if text:
+                draw.text((left + width / 2, top + row_height / 2), text,
+                          fill=WHITE if is_header else BLACK, font=font, anchor="mm")
+            left += width
+    return y + len(rows) * row_height
+
+
+def render_lineup_card(document: LineupDocument, width: int = DEFAULT_CARD_WIDTH,
+                       image_format: str = "png", quality: int = DEFAULT_CARD_QUALITY,
+                       roster: str = "all") -> bytes:
+    """
+    라인업 카드 이미지 생성
+
+    Args:
+        document: 라인업 문서 데이터
+        width: 이미지 폭 (px), 높이는 내용에 맞춰 결정 (명단은 MAX_CARD_ROSTER_ROWS행까지)
+        image_format: png, jpg, jpeg
+        quality: JPEG 품질 (PNG는 무시)
+        roster: 명단 범위 (all, present)
+
+    Returns:
+        이미지 바이트
+
+    Raises:
+        CardFontUnavailable: 한글 폰트가 없을 때
+    """
+    pil_format, _ = CARD_FORMATS[image_format]
+    scale = width / BASE_WIDTH
+
+    def px(value: float) -> int:
+        return max(1, round(value * scale))
+
+    row_height = px(ROW_HEIGHT)
+    line_width = px(2)
+    font = _load_font(px(FONT_SIZE))
+
+    game_info_rows = [list(row) for row in document.game_info_rows]
+    lineup_rows = [list(LINEUP_HEADERS)] + [list(row) for row in document.lineup_rows]
+    roster_entries = capped_roster_rows(document.roster_for(roster), MAX_CARD_ROSTER_ROWS)
+    roster_rows = [list(ROSTER_HEADERS)] + [list(row) for row in roster_entries]
+
+    left_height = (len(game_info_rows) + len(lineup_rows)) * row_height + px(SECTION_GAP)
+    right_height = len(roster_rows) * row_height
+    height = px(MARGIN) * 2 + max(left_height, right_height)
+
+    image = Image.new("L", (width, height), WHITE)
+    draw = ImageDraw.Draw(image)
+
+    # 왼쪽: 경기 정보 + 라인업
+    left_x = px(MARGIN)
+    y = px(MARGIN)
+    y = _draw_table(draw, left_x, y, [px(w) for w in GAME_INFO_WIDTHS], game_info_rows,
+                    row_height, font, header=False, line_width=line_width)
+    y += px(SECTION_GAP)
+    _draw_table(draw, left_x, y, [px(w) for w in LINEUP_WIDTHS], lineup_rows,
+                row_height, font, header=True, line_width=line_width)
+
+    # 오른쪽: 선수 명단
+    right_x = left_x + px(sum(LINEUP_WIDTHS)) + px(COLUMN_GAP)
+    _draw_table(draw, right_x, px(MARGIN), [px(w) for w in ROSTER_WIDTHS], roster_rows,
+                row_height, font, header=True, line_width=line_width)
+
+    buffer = BytesIO()
+    if pil_format == "PNG":
+        paletted = Image.frombytes("P", image.size, image.point(_PNG_LEVELS_LUT).tobytes())
+        paletted.putpalette(_PNG_GREY_PALETTE)
+        # compress_level 9나 optimize=True는 수십 ms가 더 걸려 기본 압축 사용
+        paletted.save(buffer, format="PNG", bits=4, compress_level=6)
+    else:
+        # 선과 글자 위주라 JPEG는 PNG보다 큼 (사진 앨범 등 JPEG만 받는 곳용)
+        image.save(buffer, format="JPEG", quality=quality, optimize=True)
+    return buffer.getvalue()
+
@@ -0,0 +1,250 @@
+"""
+라인업 문서 로더
+PDF, 엑셀 등 모든 내보내기 형식이 공유하는 라인업 데이터를 한 번에 조회합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+import hashlib
+import json
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.game import Game
+from app.models.lineup import Lineup
+from app.models.lineup_player import LineupPlayer
+from app.models.player import Player
+from app.models.team import Team
+from app.models.user import User
+from app.models.venue import Venue
+
+# 선수 명단 범위: 전체 활성 선수 / 출석한 선수만
+ROSTER_SCOPES = ("all", "present")
+
+# 포지션 코드 → 표시명
+POSITION_NAMES = {
+    "1B": "1루수",
+    "2B": "2루수",
+    "3B": "3루수",
+    "SS": "유격수",
+    "LF": "좌익수",
+    "CF": "중견수",
+    "RF": "우익수",
+    "C": "포수",
+    "DH": "지명타자",
+    "P": "투수",
+}
+
+LINEUP_HEADERS = ("타순", "위치", "성명", "배번", "비고")
+ROSTER_HEADERS = ("번호", "성명", "배번", "비고")
+
+DEFAULT_TEAM_NAME = "씨밀레"
+DEFAULT_COACH_NAME = "감독"
+UNKNOWN_LABEL = "미정"
+
+
+class LineupRow(NamedTuple):
+    """라인업 표의 한 행 (타순, 위치, 성명, 배번, 비고)"""
+    order: str
+    position: str
+    name: str
+    number: str
+    note: str = ""
+
+
+class RosterEntry(NamedTuple):
+    """선수 명단의 한 행"""
+    number: str
+    name: str
+    present: Optional[bool] = None  # 출석 체크 결과 (기록 없으면 None)
+
+    def as_row(self) -> Tuple[str, str, str, str]:
+        """번호, 성명, 배번, 비고"""
+        return (self.number, self.name, self.number, "")
+
+
+@dataclass(frozen=True)
+class LineupDocument:
+    """내보내기용 라인업 데이터 (불변)"""
+    lineup_id: int
+    lineup_name: str
+    team_name: str
+    coach_name: str
+    game_date: datetime
+    venue_name: str
+    opponent_name: str
+    lineup_rows: Tuple[LineupRow, ...]
+    roster: Tuple[RosterEntry, ...]
+
+    @property
+    def content_key(self) -> str:
+        """내용이 같으면 같은 값이 되는 캐시 키"""
+        return hashlib.sha256(repr(self).encode("utf-8")).hexdigest()
+
+    def roster_for(self, scope: str = "all") -> Tuple[RosterEntry, ...]:
+        """
+        범위에 맞는 선수 명단
+
+        "present"는 출석으로 체크된 선수만 반환하며, 출석 기록이 없으면 전체를 반환합니다.
+        """
+        if scope == "present" and any(entry.present is not None for entry in self.roster):
+            return tuple(entry for entry in self.roster if entry.present)
+        return self.roster
+
+    @property
+    def game_date_label(self) -> str:
+        return f"{self.game_date.strftime('%m.%d(%a)')} {self.game_date.strftime('%H:%M')}"
+
+    @property
+    def game_info_rows(self) -> Tuple[Tuple[str, str], ...]:
+        """경기 정보 표 (항목, 값)"""
+        return (
+            ("팀명", self.team_name),
+            ("감독", self.coach_name),
+            ("날짜", self.game_date_label),
+            ("구장", self.venue_name),
+            ("상대팀", self.opponent_name),
+        )
+
+
+def position_name(position: Optional[str]) -> str:
+    """포지션 코드를 표시명으로 변환 (알 수 없는 코드는 그대로)"""
+    if not position:
+        return ""
+    return POSITION_NAMES.get(position, position)
+
+
+def _number_label(number: Optional[str]) -> str:
+    # '0', '00' 등번호도 그대로 표시
+    return "" if number is None else str(number)
+
+
+def _parse_attendance(attendance_data: Optional[str]) -> Dict[int, bool]:
+    """lineups.attendance_data(JSON) → {player_id: 출석 여부}"""
+    if not attendance_data:
+        return {}
+    try:
+        return {int(k): bool(v) for k, v in json.loads(attendance_data).items()}
+    except (json.JSONDecodeError, ValueError, AttributeError):
+        return {}
+
+
+def _build_lineup_rows(lineup_players) -> Tuple[LineupRow, ...]:
+    """타순 1-9번과 투수(0번) 행 구성"""
+    by_order = {}
+    for batting_order, position, name, number in lineup_players:
+        # 같은 타순이 여러 개면 첫 번째만 사용
+        by_order.setdefault(batting_order, (position, name, number))
+
+    rows = []
+    for order in range(1, 10):
+        entry = by_order.get(order)
+        if entry:
+            position, name, number = entry
+            rows.append(LineupRow(str(order), position_name(position), name, _number_label(number)))
+        else:
+            rows.append(LineupRow(str(order), "", "", ""))
+
+    pitcher = by_order.get(0)
+    if pitcher:
+        _, name, number = pitcher
+        rows.append(LineupRow("P", "투수", name, _number_label(number)))
+    else:
+        rows.append(LineupRow("P", "투수", "", ""))
+
+    return tuple(rows)
+
+
+def iter_lineup_documents(db: Session, *criteria) -> Iterator[LineupDocument]:
+    """
+    조건에 맞는 라인업들의 내보내기 데이터 (경기 날짜순)
+
+    라인업 수와 무관하게 4개의 쿼리만 실행하며, 문서는 하나씩 만들어 반환합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        criteria: Lineup/Game 컬럼에 대한 필터 조건
+    """
+    # 1. 라인업 + 경기 + 상대팀 + 경기장
+    headers = (
+        db.query(
+            Lineup.id,
+            Lineup.name,
+            Lineup.attendance_data,
+            Game.game_date,
+            Team.name.label("opponent_name"),
+            Venue.name.label("venue_name"),
+        )
+        .join(Game, Game.id == Lineup.game_id)
+        .outerjoin(Team, Team.id == Game.opponent_team_id)
+        .outerjoin(Venue, Venue.id == Game.venue_id)
+        .filter(*criteria)
+        .order_by(Game.game_date, Lineup.id)
+        .all()
+    )
+    if not headers:
+        return
+
+    # 2. 감독(선수 중 COACH 우선, 없으면 사용자) + 우리팀
+    coach_player_name = select(Player.name).where(Player.role == 'COACH').limit(1).scalar_subquery()
+    coach_username = select(User.username).where(User.role == 'coach').limit(1).scalar_subquery()
+    our_team_name = select(Team.name).where(Team.is_active == True).limit(1).scalar_subquery()
+    coach_player, coach_user, our_team = db.execute(
+        select(coach_player_name, coach_username, our_team_name)
+    ).one()
+
+    # 3. 라인업 선수 + 선수 정보 (전체 라인업 한 번에)
+    lineup_ids = [header.id for header in headers]
+    lineup_players: Dict[int, list] = {lineup_id: [] for lineup_id in lineup_ids}
+    for lineup_id, batting_order, position, name, number in (
+        db.query(LineupPlayer.lineup_id, LineupPlayer.batting_order, LineupPlayer.position, Player.name, Player.number)
+        .join(Player, Player.id == LineupPlayer.player_id)
+        .filter(LineupPlayer.lineup_id.in_(lineup_ids))
+        .order_by(LineupPlayer.lineup_id, LineupPlayer.batting_order)
+    ):
+        lineup_players[lineup_id].append((batting_order, position, name, number))
+
+    # 4. 활성 선수 명단
+    roster = (
+        db.query(Player.id, Player.number, Player.name)
+        .filter(Player.is_active == True)
+        .order_by(Player.number)
+        .all()
+    )
+
+    team_name = our_team or DEFAULT_TEAM_NAME
+    coach_name = coach_player or coach_user or DEFAULT_COACH_NAME
+    for header in headers:
+        attendance = _parse_attendance(header.attendance_data)
+        yield LineupDocument(
+            lineup_id=header.id,
+            lineup_name=header.name,
+            team_name=team_name,
+            coach_name=coach_name,
+            game_date=header.game_date,
+            venue_name=header.venue_name or UNKNOWN_LABEL,
+            opponent_name=header.opponent_name or UNKNOWN_LABEL,
+            lineup_rows=_build_lineup_rows(lineup_players[header.id]),
+            roster=tuple(
+                RosterEntry(_number_label(number), name, attendance.get(player_id))
+                for player_id, number, name in roster
+            ),
+        )
+
+
+def load_lineup_document(db: Session, lineup_id: int) -> Optional[LineupDocument]:
+    """
+    라인업 내보내기 데이터 조회
+
+    라인업 크기와 무관하게 4개의 쿼리만 실행합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        lineup_id: 라인업 ID
+
+    Returns:
+        LineupDocument, 라인업이 없으면 None
+    """
+    return next(iter_lineup_documents(db, Lineup.id == lineup_id), None)
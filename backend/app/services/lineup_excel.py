@@ -0,0 +1,171 @@
+"""
+라인업 엑셀 렌더러
+LineupDocument를 A4 가로 라인업 시트 XLSX로 변환합니다.
+
+openpyxl write-only 모드로 행 단위로 기록하고, 셀 서식은 통합 문서에 한 번만
+등록한 NamedStyle을 이름으로 참조합니다. 셀 객체를 메모리에 쌓아 두지 않으므로
+선수 명단이 크거나 시트가 많아도 메모리 사용량이 일정합니다.
+"""
+
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Iterator, List, Optional
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.worksheet import Worksheet
+
+from app.services.lineup_document import LineupDocument, LINEUP_HEADERS, ROSTER_HEADERS
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# 이 크기까지는 메모리, 넘으면 임시 파일로 기록
+SPOOL_MAX_MEMORY = 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# 공유 서식 이름
+HEADER_STYLE = "lineup_header"
+CELL_STYLE = "lineup_cell"
+LABEL_STYLE = "lineup_label"
+
+# 시트 배치 (1부터 시작하는 행/열 번호)
+GAME_INFO_ROW = 1
+LINEUP_HEADER_ROW = 7
+ROSTER_HEADER_ROW = 1
+LINEUP_COLUMN = 1   # A
+ROSTER_COLUMN = 8   # H
+LINEUP_WIDTHS = [8, 12, 15, 8, 8]
+ROSTER_WIDTHS = [8, 15, 8, 8]
+
+
+def _named_styles() -> List[NamedStyle]:
+    header_font = Font(name='맑은 고딕', size=12, bold=True)
+    data_font = Font(name='맑은 고딕', size=11)
+    center_alignment = Alignment(horizontal='center', vertical='center')
+    left_alignment = Alignment(horizontal='left', vertical='center')
+
+    # 테두리 스타일
+    thin_border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+    # 헤더 배경색
+    header_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')
+
+    return [
+        NamedStyle(name=HEADER_STYLE, font=header_font, alignment=center_alignment,
+                   border=thin_border, fill=header_fill),
+        NamedStyle(name=CELL_STYLE, font=data_font, alignment=center_alignment, border=thin_border),
+        NamedStyle(name=LABEL_STYLE, font=data_font, alignment=left_alignment, border=thin_border),
+    ]
+
+
+def create_workbook() -> Workbook:
+    """공유 서식이 등록된 write-only 통합 문서"""
+    wb = Workbook(write_only=True)
+    for style in _named_styles():
+        wb.add_named_style(style)
+    return wb
+
+
+def styled_cell(ws, value, style: str) -> WriteOnlyCell:
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def setup_a4_landscape(ws) -> None:
+    # A4 사이즈 설정 (210mm x 297mm)
+    ws.page_setup.paperSize = Worksheet.PAPERSIZE_A4
+    ws.page_setup.orientation = Worksheet.ORIENTATION_LANDSCAPE  # 가로 방향
+
+
+def set_column_widths(ws, start_column: int, widths: List[int]) -> None:
+    # write-only 시트는 행을 쓰기 전에 열 너비를 지정해야 함
+    for col_idx, width in enumerate(widths, start_column):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+
+def write_lineup_sheet(wb: Workbook, document: LineupDocument, title: str = "라인업") -> None:
+    """
+    라인업 시트 추가
+
+    배치: 게임 정보 A1:B5, 라인업 A7:E17, 선수 명단 H1:K...
+    """
+    ws = wb.create_sheet(title)
+    setup_a4_landscape(ws)
+    set_column_widths(ws, LINEUP_COLUMN, LINEUP_WIDTHS)
+    set_column_widths(ws, ROSTER_COLUMN, ROSTER_WIDTHS)
+
+    game_info_rows = document.game_info_rows
+    lineup_rows = document.lineup_rows
+    roster = document.roster
+    lineup_last_row = LINEUP_HEADER_ROW + len(lineup_rows)
+    roster_last_row = ROSTER_HEADER_ROW + len(roster)
+
+    for row_idx in range(1, max(lineup_last_row, roster_last_row) + 1):
+        row: List[Optional[WriteOnlyCell]] = [None] * (ROSTER_COLUMN + len(ROSTER_HEADERS) - 1)
+
+        # 1. 게임 정보 테이블
+        info_idx = row_idx - GAME_INFO_ROW
+        if 0 <= info_idx < len(game_info_rows):
+            for offset, value in enumerate(game_info_rows[info_idx]):
+                row[LINEUP_COLUMN - 1 + offset] = styled_cell(ws, value, LABEL_STYLE)
+
+        # 2. 라인업 테이블
+        if row_idx == LINEUP_HEADER_ROW:
+            for offset, header in enumerate(LINEUP_HEADERS):
+                row[LINEUP_COLUMN - 1 + offset] = styled_cell(ws, header, HEADER_STYLE)
+        elif LINEUP_HEADER_ROW < row_idx <= lineup_last_row:
+            for offset, value in enumerate(lineup_rows[row_idx - LINEUP_HEADER_ROW - 1]):
+                row[LINEUP_COLUMN - 1 + offset] = styled_cell(ws, value, CELL_STYLE)
+
+        # 3. 선수 명단 테이블
+        if row_idx == ROSTER_HEADER_ROW:
+            for offset, header in enumerate(ROSTER_HEADERS):
+                row[ROSTER_COLUMN - 1 + offset] = styled_cell(ws, header, HEADER_STYLE)
+        elif ROSTER_HEADER_ROW < row_idx <= roster_last_row:
+            for offset, value in enumerate(roster[row_idx - ROSTER_HEADER_ROW - 1].as_row()):
+                row[ROSTER_COLUMN - 1 + offset] = styled_cell(ws, value, CELL_STYLE)
+
+        ws.append(row)
+
+
+def save_workbook_to_spool(wb: Workbook) -> SpooledTemporaryFile:
+    """통합 문서를 스풀 임시 파일에 저장하고 처음 위치로 되돌림"""
+    spool = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    wb.save(spool)
+    spool.seek(0)
+    return spool
+
+
+def iter_file_chunks(fileobj: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """파일을 청크 단위로 읽어 반환하고 다 읽으면 닫음 (StreamingResponse용)"""
+    try:
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        fileobj.close()
+
+
+def render_lineup_excel(document: LineupDocument) -> bytes:
+    """
+    라인업 엑셀 생성
+
+    Args:
+        document: 라인업 문서 데이터
+
+    Returns:
+        XLSX 바이트
+    """
+    wb = create_workbook()
+    write_lineup_sheet(wb, document)
+    with save_workbook_to_spool(wb) as spool:
+        return spool.read()
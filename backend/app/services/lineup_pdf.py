@@ -0,0 +1,223 @@
+"""
+라인업 PDF 렌더러
+LineupDocument를 A4 라인업 시트 PDF로 변환합니다.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+from typing import List, Optional, Sequence, Tuple
+import logging
+import os
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import PageBreak, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from app.services.lineup_document import LineupDocument, RosterEntry, LINEUP_HEADERS, ROSTER_HEADERS
+
+logger = logging.getLogger(__name__)
+
+# 한글 글리프가 있는 TrueType 폰트 후보 (서브셋으로 임베딩)
+HANGUL_FONT_PATHS = [
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',  # Ubuntu/Debian
+    '/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf',  # Ubuntu/Debian
+    '/System/Library/Fonts/AppleGothic.ttf',  # macOS
+]
+
+KOREAN_FONT_NAME = 'KoreanFont'
+# 임베딩하지 않는 Adobe 한글 CID 폰트 (뷰어의 한글 폰트로 표시)
+CID_FONT_NAME = 'HYGothic-Medium'
+
+
+@dataclass(frozen=True)
+class PdfProfile:
+    """PDF 출력 프로파일"""
+    name: str
+    embed_font: bool  # True: TTF 서브셋 임베딩, False: CID 폰트 참조만
+    page_compression: bool = True
+
+
+PDF_PROFILES = {
+    # 기본값: 사용한 글리프만 임베딩 + 페이지 압축 (어느 뷰어에서나 한글 표시)
+    'compact': PdfProfile('compact', embed_font=True),
+    # 폰트를 임베딩하지 않아 가장 작음 (뷰어에 한글 폰트가 있어야 함)
+    'viewer-font': PdfProfile('viewer-font', embed_font=False),
+    # 디버깅용 비압축 출력
+    'uncompressed': PdfProfile('uncompressed', embed_font=True, page_compression=False),
+}
+DEFAULT_PDF_PROFILE = 'compact'
+
+# 선수 명단 행 높이 고정 (페이지당 행 수를 미리 계산하기 위함)
+ROSTER_ROW_HEIGHT = 24
+# SimpleDocTemplate 프레임의 위아래 패딩 합 + 여유
+FRAME_PADDING = 14
+# 렌더링 시간 상한을 위한 명단 최대 행 수 (초과분은 인원수만 표시)
+MAX_ROSTER_ROWS = 1000
+
+
+def _register_cid_font() -> str:
+    if CID_FONT_NAME not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(UnicodeCIDFont(CID_FONT_NAME))
+    return CID_FONT_NAME
+
+
+@lru_cache(maxsize=None)
+def register_korean_font(embed: bool = True) -> str:
+    """
+    한글 폰트 등록 후 폰트 이름 반환 (프로세스당 한 번만 탐색)
+
+    ReportLab은 TTFont를 항상 사용한 글리프만 서브셋으로 임베딩합니다.
+    한글 TTF가 없으면 한글 글리프가 없는 Helvetica 대신 CID 폰트를 사용합니다.
+    """
+    if not embed:
+        return _register_cid_font()
+
+    try:
+        for font_path in HANGUL_FONT_PATHS:
+            if os.path.exists(font_path):
+                pdfmetrics.registerFont(TTFont(KOREAN_FONT_NAME, font_path))
+                logger.info(f"한글 폰트 등록 성공: {font_path}")
+                return KOREAN_FONT_NAME
+        logger.warning("한글 TTF 폰트를 찾을 수 없어 CID 폰트 사용")
+    except Exception as e:
+        logger.warning(f"한글 폰트 등록 실패: {e}")
+
+    return _register_cid_font()
+
+
+def get_pdf_profile(name: Optional[str] = None) -> PdfProfile:
+    """프로파일 이름으로 조회 (알 수 없는 이름은 KeyError)"""
+    return PDF_PROFILES[name or DEFAULT_PDF_PROFILE]
+
+
+def _grid_style(font_name: str, font_size: int, header: bool) -> TableStyle:
+    commands = [
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), font_name),
+        ('FONTSIZE', (0, 0), (-1, -1), font_size),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ]
+    if header:
+        commands += [
+            ('BACKGROUND', (0, 0), (-1, 0), colors.darkgrey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ]
+    else:
+        commands.append(('BACKGROUND', (0, 0), (-1, -1), colors.white))
+    commands += [
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 4),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]
+    return TableStyle(commands)
+
+
+def capped_roster_rows(roster: Sequence[RosterEntry], max_rows: int = MAX_ROSTER_ROWS) -> List[Tuple[str, ...]]:
+    """명단 행 (max_rows를 넘으면 마지막 행에 나머지 인원수만 표시, 카드 이미지도 같은 규칙)"""
+    rows = [entry.as_row() for entry in roster[:max_rows]]
+    if len(roster) > max_rows:
+        rows[-1] = ("", f"외 {len(roster) - max_rows + 1}명", "", "")
+    return rows
+
+
+def _roster_chunks(roster: Sequence[RosterEntry], rows_per_column: int) -> List[List[Tuple[str, ...]]]:
+    """명단을 열 단위로 나눔 (MAX_ROSTER_ROWS를 넘으면 나머지는 인원수만 표시)"""
+    rows = capped_roster_rows(roster)
+    if not rows:
+        return [[]]
+    return [rows[i:i + rows_per_column] for i in range(0, len(rows), rows_per_column)]
+
+
+def _roster_table(rows: List[Tuple[str, ...]], font_name: str) -> Table:
+    table = Table([list(ROSTER_HEADERS)] + [list(row) for row in rows],
+                  colWidths=[0.5*inch, 1.5*inch, 0.5*inch, 0.5*inch], rowHeights=ROSTER_ROW_HEIGHT)
+    table.setStyle(_grid_style(font_name, 10, header=True))
+    return table
+
+
+def _two_column_layout(left, right) -> Table:
+    """2열 레이아웃 (간격 조정)"""
+    main_table = Table([[left, right]], colWidths=[3.5*inch, 3*inch])
+    main_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('LEFTPADDING', (0, 0), (0, -1), 0),
+        ('RIGHTPADDING', (0, 0), (0, -1), 20),  # 왼쪽 열 오른쪽 패딩
+        ('LEFTPADDING', (1, 0), (1, -1), 20),   # 오른쪽 열 왼쪽 패딩
+        ('RIGHTPADDING', (1, 0), (1, -1), 0),
+        # 명단 열이 페이지 높이를 꽉 채우므로 위아래 여백 없음
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ]))
+    return main_table
+
+
+def render_lineup_pdf(document: LineupDocument, profile: Optional[PdfProfile] = None,
+                      roster_scope: str = "all") -> bytes:
+    """
+    라인업 PDF 생성
+
+    선수 명단이 첫 페이지에 다 들어가지 않으면 다음 페이지에 2열로 이어서 출력합니다.
+
+    Args:
+        document: 라인업 문서 데이터
+        profile: 출력 프로파일 (기본: compact)
+        roster_scope: 명단 범위 ("all": 전체 활성 선수, "present": 출석한 선수만)
+
+    Returns:
+        PDF 바이트
+    """
+    profile = profile or get_pdf_profile()
+    korean_font = register_korean_font(embed=profile.embed_font)
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=30,
+        leftMargin=30,
+        topMargin=30,
+        bottomMargin=30,
+        # rl_config 전역 설정과 무관하게 압축 여부를 고정
+        pageCompression=1 if profile.page_compression else 0,
+        # 생성 시각을 넣지 않아 같은 내용이면 같은 바이트
+        invariant=1,
+    )
+
+    # 2열 레이아웃: 왼쪽(경기정보+라인업), 오른쪽(선수명단)
+    left_content = []
+
+    # 왼쪽 상단: 경기 정보 테이블 (2열 구조)
+    game_info_table = Table([list(row) for row in document.game_info_rows], colWidths=[0.8*inch, 2.2*inch])
+    game_info_table.setStyle(_grid_style(korean_font, 11, header=False))
+    left_content.append(game_info_table)
+    left_content.append(Spacer(1, 20))
+
+    # 왼쪽: 라인업 테이블 (타순 1-9번 + 투수)
+    lineup_table = Table([list(LINEUP_HEADERS)] + [list(row) for row in document.lineup_rows],
+                         colWidths=[0.5*inch, 0.8*inch, 1.2*inch, 0.5*inch, 0.5*inch])
+    lineup_table.setStyle(_grid_style(korean_font, 10, header=True))
+    left_content.append(lineup_table)
+
+    # 오른쪽: 선수 명단을 한 페이지 높이 단위로 나눔
+    # 첫 페이지는 오른쪽 열 하나, 다음 페이지부터는 양쪽 열 모두 명단
+    rows_per_column = int((doc.height - FRAME_PADDING) // ROSTER_ROW_HEIGHT) - 1  # 헤더 제외
+    chunks = _roster_chunks(document.roster_for(roster_scope), rows_per_column)
+    roster_tables = [_roster_table(chunk, korean_font) for chunk in chunks]
+
+    story = [_two_column_layout(left_content, roster_tables[0])]
+    for page_start in range(1, len(roster_tables), 2):
+        story.append(PageBreak())
+        right = roster_tables[page_start + 1] if page_start + 1 < len(roster_tables) else ""
+        story.append(_two_column_layout(roster_tables[page_start], right))
+
+    doc.build(story)
+    return buffer.getvalue()
@@ -0,0 +1,288 @@
+"""
+선수 일괄 등록
+업로드한 XLSX/CSV 명단을 배번 기준으로 등록하거나 수정합니다.
+
+모든 행을 먼저 검증하고, 기존 배번은 쿼리 한 번으로 찾은 뒤, 오류가 없을 때만
+INSERT ... ON CONFLICT (number) DO UPDATE 한 문장으로 한꺼번에 반영합니다.
+
+파일 읽기/검증(parse_import_file)은 DB가 필요 없는 CPU 작업이라 요청 핸들러가 스레드 풀에서 실행하고,
+DB 반영(apply_import)만 세션에서 실행합니다.
+"""
+
+from datetime import datetime
+from io import BytesIO, StringIO
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+import csv
+
+from openpyxl import load_workbook
+from pydantic import ValidationError
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.enums.player_role import PlayerRole
+from app.models.player import Player
+from app.schemas.player import PlayerCreate, PlayerImportReport, PlayerImportRow
+
+MAX_IMPORT_ROWS = 2000
+CSV_ENCODINGS = ("utf-8-sig", "cp949")  # 엑셀에서 저장한 한글 CSV는 cp949인 경우가 많음
+
+CREATED = "created"
+UPDATED = "updated"
+ERROR = "error"
+
+# 헤더 이름 -> Player 필드 (영문 필드명도 그대로 허용)
+HEADER_ALIASES = {
+    "배번": "number", "등번호": "number",
+    "성명": "name", "이름": "name",
+    "연락처": "phone", "전화번호": "phone",
+    "이메일": "email",
+    "역할": "role",
+    "나이": "age",
+    "생년월일": "birth_date",
+    "출신지": "hometown",
+    "학교": "school", "출신학교": "school",
+    "선호 포지션": "position_preference", "선호포지션": "position_preference",
+    "키": "height",
+    "몸무게": "weight",
+    "입단일": "join_date",
+    "선수출신": "is_professional", "선출": "is_professional",
+    "메모": "notes", "비고": "notes",
+    "활성": "is_active",
+}
+IMPORT_FIELDS = [
+    "number", "name", "phone", "email", "role", "age", "birth_date", "hometown", "school",
+    "position_preference", "height", "weight", "join_date", "is_professional", "notes", "is_active",
+]
+STRING_FIELDS = {"number", "name", "phone", "email", "hometown", "school", "position_preference", "notes"}
+DATE_FIELDS = {"birth_date", "join_date"}
+BOOLEAN_FIELDS = {"is_professional", "is_active"}
+TRUE_VALUES = {"o", "y", "yes", "예", "true", "1"}
+FALSE_VALUES = {"x", "n", "no", "아니오", "false", "0"}
+
+# 방언별 INSERT (ON CONFLICT 지원)
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+SheetRow = Tuple[int, Dict[str, object]]  # (시트 행 번호, 필드 -> 셀 값)
+
+
+class ParsedImport(NamedTuple):
+    """검증을 마친 업로드 파일 (DB 반영 전)"""
+    fields: List[str]  # 파일에 있는 필드 (이 열만 덮어씀)
+    results: List[PlayerImportRow]  # 행별 결과 (통과한 행은 action 미정)
+    players: Dict[int, PlayerCreate]  # 시트 행 번호 -> 검증된 선수
+
+
+def _header_field(header) -> Optional[str]:
+    if header is None:
+        return None
+    text = str(header).strip()
+    if text in IMPORT_FIELDS:
+        return text
+    return HEADER_ALIASES.get(text) or HEADER_ALIASES.get(text.replace(" ", ""))
+
+
+def _iter_table_rows(rows: Iterable[tuple]) -> Iterator[SheetRow]:
+    """첫 행을 헤더로 보고 나머지 행을 필드 딕셔너리로 변환 (빈 행은 건너뜀)"""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError("빈 파일입니다")
+
+    fields = [_header_field(h) for h in header]
+    missing = [f for f in ("number", "name") if f not in fields]
+    if missing:
+        raise ValueError(f"필수 열이 없습니다: {', '.join(missing)}")
+
+    count = 0
+    for row_idx, values in enumerate(rows, 2):
+        data = {
+            field: value for field, value in zip(fields, values)
+            if field and value is not None and str(value).strip() != ""
+        }
+        if not data:
+            continue
+        count += 1
+        if count > MAX_IMPORT_ROWS:
+            raise ValueError(f"한 번에 최대 {MAX_IMPORT_ROWS}명까지 등록할 수 있습니다")
+        yield row_idx, data
+
+
+def read_import_file(filename: str, content: bytes) -> Tuple[List[str], List[SheetRow]]:
+    """
+    업로드 파일 읽기
+
+    Returns:
+        (파일에 있는 필드 목록, 행 목록)
+    """
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    if extension == "xlsx":
+        wb = load_workbook(BytesIO(content), read_only=True, data_only=True)
+        try:
+            rows = list(wb.active.iter_rows(values_only=True))
+        finally:
+            wb.close()
+    elif extension == "csv":
+        for encoding in CSV_ENCODINGS:
+            try:
+                text = content.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            raise ValueError("CSV 인코딩을 알 수 없습니다 (UTF-8 또는 CP949)")
+        rows = [tuple(row) for row in csv.reader(StringIO(text))]
+    else:
+        raise ValueError("xlsx 또는 csv 파일만 업로드할 수 있습니다")
+
+    sheet_rows = list(_iter_table_rows(rows))
+    header_fields = {_header_field(h) for h in rows[0]}
+    return [f for f in IMPORT_FIELDS if f in header_fields], sheet_rows
+
+
+def _normalize_value(field: str, value):
+    """셀 값을 PlayerCreate가 받는 형태로 변환"""
+    if isinstance(value, str):
+        value = value.strip()
+
+    if field in STRING_FIELDS:
+        # 엑셀 숫자 셀 (배번 7 -> 7.0, 전화번호 등)
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value)
+    if field in DATE_FIELDS and isinstance(value, datetime):
+        return value.date()
+    if field in BOOLEAN_FIELDS and isinstance(value, str):
+        lowered = value.lower()
+        if lowered in TRUE_VALUES:
+            return True
+        if lowered in FALSE_VALUES:
+            return False
+    if field == "role" and isinstance(value, str) and value.upper() in PlayerRole.__members__:
+        return PlayerRole[value.upper()]
+    return value
+
+
+def _validation_messages(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(loc) for loc in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    ]
+
+
+def validate_rows(sheet_rows: List[SheetRow]) -> Tuple[List[PlayerImportRow], Dict[int, PlayerCreate]]:
+    """
+    전체 행 검증 (DB 조회 없음)
+
+    Returns:
+        (행별 결과 - 통과한 행은 action 미정, 시트 행 번호 -> 검증된 선수)
+    """
+    results: List[PlayerImportRow] = []
+    players: Dict[int, PlayerCreate] = {}
+    seen_numbers: Dict[str, int] = {}
+
+    for row_idx, data in sheet_rows:
+        values = {field: _normalize_value(field, value) for field, value in data.items()}
+        result = PlayerImportRow(row=row_idx, number=values.get("number"), name=values.get("name"), action=ERROR)
+        results.append(result)
+
+        if not values.get("number"):
+            result.errors.append("number: 배번이 없습니다")
+        elif values["number"] in seen_numbers:
+            result.errors.append(f"number: {seen_numbers[values['number']]}행과 배번이 중복됩니다")
+        else:
+            seen_numbers[values["number"]] = row_idx
+
+        try:
+            player = PlayerCreate(**values)
+        except ValidationError as e:
+            result.errors.extend(_validation_messages(e))
+            continue
+
+        if not result.errors:
+            players[row_idx] = player
+
+    return results, players
+
+
+def _upsert_players(db: Session, players: List[PlayerCreate], update_fields: List[str]) -> None:
+    """배번 기준 INSERT ... ON CONFLICT DO UPDATE (executemany 한 번)"""
+    dialect = db.get_bind().dialect.name
+    if dialect not in UPSERT_INSERTS:
+        raise ValueError(f"일괄 등록을 지원하지 않는 데이터베이스입니다: {dialect}")
+
+    rows = []
+    for player in players:
+        data = player.model_dump()
+        # phone이 None인 경우 빈 문자열로 변환 (create_player와 동일)
+        if data.get("phone") is None:
+            data["phone"] = ""
+        rows.append(data)
+
+    stmt = UPSERT_INSERTS[dialect](Player)
+    # 파일에 있는 열만 덮어씀 (없는 열은 기존 값 유지)
+    set_ = {field: stmt.excluded[field] for field in update_fields if field != "number"}
+    set_["updated_at"] = func.now()
+    # ON CONFLICT DO UPDATE에는 Column.onupdate가 적용되지 않으므로 직접 증가
+    set_["row_version"] = Player.row_version + 1
+    stmt = stmt.on_conflict_do_update(index_elements=[Player.number], set_=set_)
+    db.execute(stmt, rows)
+
+
+def parse_import_file(filename: str, content: bytes) -> ParsedImport:
+    """업로드 파일 읽기 + 전체 행 검증 (DB 조회 없음, 형식 오류는 ValueError)"""
+    fields, sheet_rows = read_import_file(filename, content)
+    results, players = validate_rows(sheet_rows)
+    return ParsedImport(fields, results, players)
+
+
+def apply_import(db: Session, parsed: ParsedImport, dry_run: bool = False) -> PlayerImportReport:
+    """
+    검증된 명단을 배번 기준으로 등록/수정
+
+    Args:
+        db: 데이터베이스 세션
+        parsed: parse_import_file 결과
+        dry_run: True면 결과 보고만 하고 저장하지 않음
+
+    Returns:
+        행별 결과 보고서 (오류가 한 행이라도 있으면 아무것도 저장하지 않음)
+    """
+    results, players = parsed.results, parsed.players
+
+    # 기존 배번 조회 (쿼리 1번)
+    numbers = [player.number for player in players.values()]
+    existing: Set[str] = set()
+    if numbers:
+        existing = {number for (number,) in db.query(Player.number).filter(Player.number.in_(numbers))}
+
+    for result in results:
+        if result.row in players:
+            result.action = UPDATED if result.number in existing else CREATED
+
+    failed = sum(1 for result in results if result.action == ERROR)
+    applied = not failed and not dry_run and bool(players)
+    if applied:
+        try:
+            _upsert_players(db, list(players.values()), parsed.fields)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+    return PlayerImportReport(
+        applied=applied,
+        total=len(results),
+        created=sum(1 for result in results if result.action == CREATED),
+        updated=sum(1 for result in results if result.action == UPDATED),
+        failed=failed,
+        rows=results,
+    )
+
+
+def import_players(db: Session, filename: str, content: bytes, dry_run: bool = False) -> PlayerImportReport:
+    """선수 명단 일괄 등록/수정 (파일 읽기/검증 + DB 반영, 동기 코드용)"""
+    return apply_import(db, parse_import_file(filename, content), dry_run=dry_run)
@@ -0,0 +1,122 @@
+"""
+시즌 엑셀 내보내기
+한 해의 모든 경기 라인업을 경기별 시트로, 포지션별 출전/출석 현황을 요약 시트로
+하나의 통합 문서에 기록합니다.
+"""
+
+from collections import Counter, defaultdict
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import Dict, List, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.game import Game
+from app.services.lineup_document import LineupDocument, POSITION_NAMES, iter_lineup_documents
+from app.services.lineup_excel import (
+    create_workbook, write_lineup_sheet, save_workbook_to_spool, set_column_widths, styled_cell,
+    HEADER_STYLE, CELL_STYLE,
+)
+
+# 시트 이름에 쓸 수 없는 문자
+INVALID_TITLE_CHARS = set('[]:*?/\\')
+MAX_TITLE_LENGTH = 31
+
+UNASSIGNED_POSITION = "미지정"
+POSITION_COLUMNS = list(POSITION_NAMES.values()) + [UNASSIGNED_POSITION]
+
+PlayerKey = Tuple[str, str]  # (배번, 성명) - 배번은 선수마다 고유
+
+
+def _number_sort_key(key: PlayerKey):
+    number, name = key
+    return (0, int(number), name) if number.isdigit() else (1, number, name)
+
+
+class SeasonSummary:
+    """경기 시트를 쓰는 동안 누적하는 시즌 요약"""
+
+    def __init__(self):
+        self.game_labels: List[str] = []
+        self.positions: Dict[PlayerKey, Counter] = defaultdict(Counter)
+        self.attended: Dict[PlayerKey, Set[int]] = defaultdict(set)
+
+    def add(self, document: LineupDocument, game_label: str) -> None:
+        game_idx = len(self.game_labels)
+        self.game_labels.append(game_label)
+
+        for row in document.lineup_rows:
+            if row.name:
+                self.positions[(row.number, row.name)][row.position or UNASSIGNED_POSITION] += 1
+
+        for entry in document.roster:
+            games = self.attended[(entry.number, entry.name)]
+            if entry.present:
+                games.add(game_idx)
+
+
+def _sheet_title(document: LineupDocument, used: Set[str]) -> str:
+    base = f"{document.game_date.strftime('%m%d')} {document.opponent_name}"
+    base = "".join(ch for ch in base if ch not in INVALID_TITLE_CHARS)[:MAX_TITLE_LENGTH]
+    title, suffix = base, 2
+    while title in used:
+        tail = f" ({suffix})"
+        title = base[:MAX_TITLE_LENGTH - len(tail)] + tail
+        suffix += 1
+    used.add(title)
+    return title
+
+
+def _write_position_summary(wb, summary: SeasonSummary) -> None:
+    ws = wb.create_sheet("포지션별 출전")
+    set_column_widths(ws, 1, [8, 15] + [9] * len(POSITION_COLUMNS) + [8])
+
+    headers = ["배번", "성명"] + POSITION_COLUMNS + ["합계"]
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
+    for key in sorted(summary.positions, key=_number_sort_key):
+        counts = summary.positions[key]
+        values = list(key) + [counts.get(position, 0) for position in POSITION_COLUMNS] + [sum(counts.values())]
+        ws.append([styled_cell(ws, value, CELL_STYLE) for value in values])
+
+
+def _write_attendance_summary(wb, summary: SeasonSummary) -> None:
+    ws = wb.create_sheet("출석")
+    set_column_widths(ws, 1, [8, 15] + [7] * len(summary.game_labels) + [8])
+
+    headers = ["배번", "성명"] + summary.game_labels + ["출석"]
+    ws.append([styled_cell(ws, header, HEADER_STYLE) for header in headers])
+    for key in sorted(summary.attended, key=_number_sort_key):
+        games = summary.attended[key]
+        marks = ["O" if game_idx in games else "" for game_idx in range(len(summary.game_labels))]
+        ws.append([styled_cell(ws, value, CELL_STYLE) for value in list(key) + marks + [len(games)]])
+
+
+def build_season_workbook(db: Session, year: int) -> SpooledTemporaryFile:
+    """
+    시즌 통합 문서 생성
+
+    조회 쿼리는 경기 수와 무관하게 4개이며, 라인업 문서는 시트를 쓰면서 하나씩
+    만들어 버립니다. 요약은 모든 경기 시트를 쓴 뒤 마지막에 추가합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        year: 시즌 연도
+
+    Returns:
+        처음 위치로 되돌린 스풀 임시 파일 (호출자가 닫아야 함)
+    """
+    wb = create_workbook()
+    summary = SeasonSummary()
+    used_titles: Set[str] = set()
+
+    for document in iter_lineup_documents(
+        db,
+        Game.game_date >= datetime(year, 1, 1),
+        Game.game_date < datetime(year + 1, 1, 1),
+    ):
+        write_lineup_sheet(wb, document, title=_sheet_title(document, used_titles))
+        summary.add(document, document.game_date.strftime('%m/%d'))
+
+    _write_position_summary(wb, summary)
+    _write_attendance_summary(wb, summary)
+    return save_workbook_to_spool(wb)
@@ -1,17 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+import asyncio
+import os
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 # from app.config import settings  # 필요시 추가
 
 # 비밀번호 해싱
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 작업 비용(rounds)을 바꾸면 기존 해시는 다음 로그인 때 새 비용으로 다시 해싱됨
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# bcrypt 전용 스레드 풀 (동시에 CPU를 쓰는 해싱 수를 제한해 이벤트 루프와 다른 요청을 보호)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
 
 # JWT 설정
 SECRET_KEY = "your-secret-key-here"  # 실제 운영에서는 환경변수로 관리
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 480  # 8시간
+# 액세스 토큰은 짧게, 세션 유지는 리프레시 토큰으로 (비밀번호 재입력 없이 갱신)
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+
+# 토큰 종류 (typ 클레임)
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
@@ -21,6 +36,21 @@ def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 (bcrypt 스레드 풀에서 실행)
+
+    Returns:
+        (일치 여부, 작업 비용이 바뀌어 새로 만든 해시 또는 None)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, pwd_context.verify_and_update, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (bcrypt 스레드 풀에서 실행)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, pwd_context.hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """JWT 토큰 생성"""
     to_encode = data.copy()
@@ -32,6 +62,46 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def create_user_access_token(user, expires_delta: Optional[timedelta] = None):
+    """
+    사용자 JWT 토큰 생성
+
+    사용자 ID, 역할, 토큰 epoch를 함께 담아 요청마다 users 테이블을 조회하지 않고
+    검증할 수 있게 합니다.
+    """
+    return create_access_token(
+        data={
+            "sub": user.username, "uid": user.id, "role": user.role, "ep": user.token_epoch or 0,
+            "typ": ACCESS_TOKEN_TYPE,
+        },
+        expires_delta=expires_delta,
+    )
+
+def create_refresh_token(user, family_id: str, generation: int, expires_at: datetime) -> str:
+    """리프레시 토큰 생성 (세션 ID와 세대를 담음)"""
+    return jwt.encode(
+        {
+            "sub": user.username, "uid": user.id, "ep": user.token_epoch or 0,
+            "typ": REFRESH_TOKEN_TYPE, "fam": family_id, "gen": generation, "exp": expires_at,
+        },
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+def decode_token(token: str, token_type: str = ACCESS_TOKEN_TYPE) -> Optional[dict]:
+    """
+    JWT 토큰 검증 후 클레임 반환
+
+    typ 클레임이 다르면 거부합니다 (typ이 없는 이전 토큰은 액세스 토큰으로 취급).
+    """
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("sub") is None or payload.get("typ", ACCESS_TOKEN_TYPE) != token_type:
+        return None
+    return payload
+
 def verify_token(token: str) -> Optional[str]:
     """JWT 토큰 검증"""
     try:
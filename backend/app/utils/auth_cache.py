@@ -0,0 +1,120 @@
+"""
+인증 사용자 상태 캐시
+토큰 검증에 필요한 사용자 상태(역할, 활성 여부, 토큰 epoch)를 짧게 메모리에 보관해
+인증된 요청마다 users 테이블을 조회하지 않도록 합니다 (프로세스 단위, TTL + LRU).
+
+비밀번호 변경이나 비활성화로 사용자가 바뀌면 flush 때와 커밋 직후에 해당 항목을 지우고
+(커밋 전에 다른 요청이 이전 행을 다시 캐시에 넣을 수 있으므로), 다른 워커 프로세스의
+캐시는 TTL이 지나면 새로 읽습니다.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple, Optional
+import os
+import time
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "1024"))
+
+
+class AuthenticatedUser(NamedTuple):
+    """토큰으로 확인한 현재 사용자 (DB 세션과 무관한 읽기 전용 값)"""
+    id: int
+    username: str
+    role: str
+    is_active: bool
+    token_epoch: int
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthenticatedUser":
+        return cls(user.id, user.username, user.role, bool(user.is_active), user.token_epoch or 0)
+
+
+class UserStateCache:
+    """사용자 ID -> AuthenticatedUser, 항목마다 TTL이 있는 LRU 캐시"""
+
+    def __init__(self, ttl_seconds: int = AUTH_CACHE_TTL_SECONDS, max_entries: int = AUTH_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[AuthenticatedUser]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user: AuthenticatedUser) -> None:
+        with self._lock:
+            self._entries.pop(user.id, None)
+            self._entries[user.id] = (time.monotonic() + self.ttl_seconds, user)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+user_state_cache = UserStateCache()
+
+
+def revoke_user_tokens(user: User) -> None:
+    """이 사용자에게 발급한 모든 토큰 무효화 (커밋은 호출자가)"""
+    user.token_epoch = (user.token_epoch or 0) + 1
+
+
+@event.listens_for(User, "before_update")
+def _bump_epoch_on_deactivation(mapper, connection, target: User) -> None:
+    # 어떤 경로로 비활성화되든 기존 토큰을 더 이상 쓸 수 없게 함
+    history = inspect(target).attrs.is_active.history
+    if history.has_changes() and not target.is_active:
+        revoke_user_tokens(target)
+
+
+# 세션에서 변경된 사용자 ID (커밋 직후 한 번 더 지움)
+_PENDING_INVALIDATIONS_KEY = "auth_cache_pending_user_ids"
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_cached_state(mapper, connection, target: User) -> None:
+    user_state_cache.invalidate(target.id)
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    # flush와 커밋 사이에 다른 요청이 이전 행을 읽어 캐시에 넣었을 수 있음
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS_KEY, ()):
+        user_state_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
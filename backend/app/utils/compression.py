@@ -0,0 +1,191 @@
+"""
+응답 압축 미들웨어
+클라이언트의 Accept-Encoding에 따라 Brotli(br) 또는 gzip으로 압축합니다.
+목록 응답(JSON)은 같은 키와 경기/경기장 정보가 반복되어 압축률이 높아, 경기장 모바일
+데이터 환경에서 전송량과 대기 시간이 크게 줄어듭니다.
+
+- COMPRESSION_MIN_SIZE 바이트보다 작은 응답은 그대로 보냄 (압축 이득보다 CPU/헤더 비용이 큼)
+- JSON/텍스트/CSV만 압축, PDF/엑셀(zip)/이미지처럼 이미 압축된 내보내기와
+  Content-Encoding이 있는 응답은 건너뜀
+- 스트리밍 응답(CSV 내보내기 등)은 조각마다 압축해서 바로 보냄
+- brotli 패키지가 없으면 gzip만 사용
+"""
+
+from typing import Optional
+import gzip
+import os
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+# gzip 1~9, brotli 0~11 (동적 응답은 속도를 위해 중간값)
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 (br 우선, q=0은 제외)"""
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    best, best_quality = None, 0.0
+    for coding in candidates:
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class _Compressor:
+    """스트리밍 압축 (조각마다 flush해서 바로 전송)"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality, mode=brotli.MODE_TEXT)
+        else:
+            # wbits 31 = gzip 헤더/트레일러 포함
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+def compress_body(body: bytes, encoding: str, gzip_level: int = GZIP_LEVEL,
+                  brotli_quality: int = BROTLI_QUALITY) -> bytes:
+    """한 번에 보내는 응답 본문 압축"""
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality, mode=brotli.MODE_TEXT)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE,
+                 gzip_level: int = GZIP_LEVEL, brotli_quality: int = BROTLI_QUALITY):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.gzip_level, self.brotli_quality)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int, gzip_level: int, brotli_quality: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._start: Optional[Message] = None
+        self._headers: Optional[MutableHeaders] = None
+        self._buffer = b""
+        self._compressor: Optional[_Compressor] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._headers = MutableHeaders(raw=list(message["headers"]))
+            self._start = {**message, "headers": self._headers.raw}
+            if message["status"] in (204, 304) or not is_compressible(self._headers):
+                self._passthrough = True
+                await self._send(self._start)
+                return
+            self._headers.add_vary_header("Accept-Encoding")
+            # 본문 크기를 보고 압축 여부를 정하므로 시작 메시지는 잠시 보관
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        more_body = message.get("more_body", False)
+        if self._compressor is not None:
+            body = self._compressor.compress(message.get("body", b""))
+            if not more_body:
+                body += self._compressor.finish()
+            await self._send({**message, "body": body})
+            return
+
+        # 다른 미들웨어를 거치면 작은 응답도 여러 조각으로 오므로 최소 크기까지 모아서 판단
+        self._buffer += message.get("body", b"")
+        if more_body and len(self._buffer) < self.minimum_size:
+            return
+        body, self._buffer = self._buffer, b""
+
+        if not more_body and len(body) < self.minimum_size:
+            self._passthrough = True
+            await self._send(self._start)
+            await self._send({**message, "body": body})
+            return
+
+        headers = self._headers
+        headers["Content-Encoding"] = self.encoding
+        # 압축 표현은 바이트가 달라지므로 강한 ETag를 약한 ETag로 (조건부 요청은 약한 비교)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        if not more_body:
+            body = compress_body(body, self.encoding, self.gzip_level, self.brotli_quality)
+            headers["Content-Length"] = str(len(body))
+            await self._send(self._start)
+            await self._send({**message, "body": body})
+            return
+
+        # 스트리밍: 전체 길이를 알 수 없으므로 Content-Length 제거 (chunked)
+        del headers["Content-Length"]
+        self._compressor = _Compressor(self.encoding, self.gzip_level, self.brotli_quality)
+        await self._send(self._start)
+        await self._send({**message, "body": self._compressor.compress(body)})
@@ -0,0 +1,102 @@
+"""
+읽기 전용 복제본 라우팅
+안전한 조회 요청(GET/HEAD)은 복제본으로, 쓰기는 주 DB로 보냅니다.
+
+복제 지연 때문에 방금 저장한 내용이 복제본에 아직 없을 수 있으므로, 사용자가 쓰기 요청을
+보낸 뒤 REPLICA_READ_YOUR_WRITES_SECONDS 동안은 그 사용자의 조회도 주 DB에서 읽습니다
+(프로세스 단위 기록).
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+import os
+import time
+
+from fastapi import Request
+from jose import JWTError, jwt
+
+# 쓰기 후 주 DB에서 읽는 시간 (복제 지연보다 길게)
+REPLICA_READ_YOUR_WRITES_SECONDS = float(os.getenv("REPLICA_READ_YOUR_WRITES_SECONDS", "5"))
+READ_YOUR_WRITES_MAX_ENTRIES = 10000
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReadYourWritesTracker:
+    """사용자별 마지막 쓰기 시각 (키 수는 LRU로 제한)"""
+
+    def __init__(self, window_seconds: float = REPLICA_READ_YOUR_WRITES_SECONDS,
+                 max_entries: int = READ_YOUR_WRITES_MAX_ENTRIES):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._writes: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = Lock()
+
+    def mark_write(self, key: str) -> None:
+        with self._lock:
+            self._writes.pop(key, None)
+            self._writes[key] = time.monotonic()
+            while len(self._writes) > self.max_entries:
+                self._writes.popitem(last=False)
+
+    def recently_wrote(self, key: str) -> bool:
+        with self._lock:
+            written_at = self._writes.get(key)
+            if written_at is None:
+                return False
+            if time.monotonic() - written_at > self.window_seconds:
+                del self._writes[key]
+                return False
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._writes.clear()
+
+
+read_your_writes = ReadYourWritesTracker()
+
+
+def request_user_key(request: Request) -> Optional[str]:
+    """
+    요청한 사용자 식별 (Authorization 토큰의 uid 클레임)
+
+    서명은 확인하지 않습니다. 라우팅에만 쓰이므로 위조 토큰으로 할 수 있는 일은
+    해당 사용자의 조회를 잠시 주 DB로 보내는 것뿐이고, 인증은 별도 의존성이 검증합니다.
+    """
+    authorization = request.headers.get("Authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        claims = jwt.get_unverified_claims(token)
+    except JWTError:
+        return None
+    user_id = claims.get("uid")
+    return str(user_id) if user_id is not None else None
+
+
+def should_read_from_replica(request: Request) -> bool:
+    """복제본에서 읽어도 되는 요청인지 (안전한 메서드 + 최근 쓰기 없음)"""
+    if request.method not in SAFE_METHODS:
+        return False
+    user_key = request_user_key(request)
+    return user_key is None or not read_your_writes.recently_wrote(user_key)
+
+
+async def track_writes(request: Request, call_next):
+    """쓰기 요청을 보낸 사용자를 기록하는 미들웨어 (요청 시작과 끝 모두 기록)"""
+    if request.method in SAFE_METHODS:
+        return await call_next(request)
+
+    user_key = request_user_key(request)
+    if user_key is None:
+        return await call_next(request)
+
+    # 쓰기 진행 중에 들어온 조회도 주 DB로 가도록 시작 시점에도 기록
+    read_your_writes.mark_write(user_key)
+    try:
+        return await call_next(request)
+    finally:
+        read_your_writes.mark_write(user_key)
@@ -0,0 +1,100 @@
+"""
+조회 응답 HTTP 캐시 (ETag / Last-Modified / Cache-Control)
+팀, 경기장, 선수처럼 자주 바뀌지 않는 데이터는 행 수, created_at/updated_at 최댓값, row_version 합계만
+먼저 조회해 검증값을 만들고, 클라이언트가 가진 값과 같으면 행을 읽지 않고 304로 응답합니다.
+
+- 행 추가는 행 수와 최댓값, 수정은 row_version(수정마다 +1), 삭제는 행 수가 바뀌므로 검증값이 달라짐
+  (SQLite의 func.now()는 초 단위라 시각만으로는 1초 안의 두 번째 수정을 구분하지 못함)
+- 목록은 삭제를 시각으로 알 수 없으므로 Last-Modified/If-Modified-Since 없이 ETag만 사용
+- 목록은 쿼리 문자열(페이지/필터)과 응답 스키마 필드도 ETag에 포함
+- Cache-Control: private, max-age=HTTP_CACHE_MAX_AGE (기본 0 = 매번 재검증, 바뀌지 않았으면 304로 본문 없이)
+  max-age를 늘리면 그동안은 재검증도 하지 않아, 방금 수정한 사용자도 이전 목록을 볼 수 있음
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Type
+import hashlib
+import os
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import Select, func, select
+
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "0"))
+
+
+def validators_statement(model, *conditions) -> Select:
+    """(행 수, created_at 최댓값, updated_at 최댓값, row_version 합계) 조회"""
+    return (
+        select(
+            func.count(), func.max(model.created_at), func.max(model.updated_at),
+            func.coalesce(func.sum(model.row_version), 0),
+        )
+        .select_from(model)
+        .where(*conditions)
+    )
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    # SQLite는 시간대 없이 UTC로 저장
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    etag: str
+    last_modified: Optional[datetime]
+
+    @classmethod
+    def from_row(cls, row, schema: Type[BaseModel], *key_parts, collection: bool = True) -> "CacheValidators":
+        """
+        validators_statement 결과로 검증값 생성 (key_parts: 쿼리 문자열, ID 등)
+
+        collection=True(목록)이면 Last-Modified를 쓰지 않음 (행 삭제는 최댓값을 바꾸지 않음)
+        """
+        count, max_created, max_updated, row_versions = row
+        timestamps = [value for value in (_as_utc(max_created), _as_utc(max_updated)) if value is not None]
+        last_modified = max(timestamps) if timestamps and not collection else None
+        # 응답 필드가 바뀌는 배포 뒤에는 이전 캐시를 쓰지 않도록 스키마 필드 이름 포함
+        source = "|".join(str(part) for part in (
+            count, row_versions, *timestamps, ",".join(schema.model_fields), *key_parts
+        ))
+        return cls(f'"{hashlib.sha1(source.encode()).hexdigest()[:20]}"', last_modified)
+
+    def matches(self, request: Request) -> bool:
+        """클라이언트 캐시가 최신인지 (If-None-Match 우선, 없으면 If-Modified-Since)"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # 압축 응답은 약한 ETag(W/)로 나가므로 약한 비교
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위
+        return self.last_modified.replace(microsecond=0) <= since
+
+    def headers(self, max_age: int = HTTP_CACHE_MAX_AGE) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": f"private, max-age={max_age}"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def apply(self, response: Response, max_age: int = HTTP_CACHE_MAX_AGE) -> None:
+        response.headers.update(self.headers(max_age))
+
+    def not_modified(self, max_age: int = HTTP_CACHE_MAX_AGE) -> Response:
+        return Response(status_code=304, headers=self.headers(max_age))
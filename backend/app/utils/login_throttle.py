@@ -0,0 +1,161 @@
+"""
+로그인 시도 제한
+IP별 인증 요청 수와 사용자명별 로그인 실패 수를 슬라이딩 윈도우로 세어,
+한도를 넘으면 bcrypt 검증 전에 429로 거절하고 실패가 쌓일수록 응답을 늦춥니다.
+
+키 수는 LRU로 제한하므로 임의의 사용자명/IP가 몰려도 메모리가 일정합니다 (프로세스 단위).
+"""
+
+from collections import OrderedDict, deque
+from threading import Lock
+from typing import Deque, Optional
+import math
+import os
+import time
+
+from fastapi import HTTPException, Request, status
+
+# IP별 인증 요청 한도 (로그인, 토큰 갱신, 가입, 비밀번호 변경 합산 - 경기장 와이파이처럼 팀 전체가 한 IP일 수 있음)
+AUTH_IP_LIMIT = int(os.getenv("AUTH_IP_LIMIT", "60"))
+AUTH_IP_WINDOW_SECONDS = int(os.getenv("AUTH_IP_WINDOW_SECONDS", "60"))
+
+# 사용자명별 로그인 실패 한도
+LOGIN_FAILURE_LIMIT = int(os.getenv("LOGIN_FAILURE_LIMIT", "10"))
+LOGIN_FAILURE_WINDOW_SECONDS = int(os.getenv("LOGIN_FAILURE_WINDOW_SECONDS", "900"))
+
+# 실패가 이만큼 쌓이면 지연 시작, 이후 실패마다 두 배 (최대 LOGIN_MAX_DELAY_SECONDS)
+LOGIN_DELAY_AFTER_FAILURES = 3
+LOGIN_BASE_DELAY_SECONDS = 0.5
+LOGIN_MAX_DELAY_SECONDS = 8.0
+
+THROTTLE_MAX_KEYS = int(os.getenv("THROTTLE_MAX_KEYS", "10000"))
+
+# 프록시(Railway 등) 뒤에서만 켬 - X-Forwarded-For의 앞쪽 주소는 클라이언트가 임의로 보낼 수 있으므로
+# 신뢰하는 프록시가 덧붙인 주소(오른쪽에서 FORWARDED_PROXY_COUNT번째)를 클라이언트 IP로 사용
+TRUST_FORWARDED_FOR = os.getenv("TRUST_FORWARDED_FOR", "false").lower() == "true"
+FORWARDED_PROXY_COUNT = max(1, int(os.getenv("FORWARDED_PROXY_COUNT", "1")))
+
+
+class SlidingWindowCounter:
+    """키별 최근 window_seconds 동안의 이벤트 수 (키 수는 LRU로 제한)"""
+
+    def __init__(self, limit: int, window_seconds: int, max_keys: int = THROTTLE_MAX_KEYS):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._events: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def _current(self, key: str, now: float) -> Optional[Deque[float]]:
+        events = self._events.get(key)
+        if events is None:
+            return None
+        while events and events[0] <= now - self.window_seconds:
+            events.popleft()
+        if not events:
+            del self._events[key]
+            return None
+        return events
+
+    def count(self, key: str) -> int:
+        with self._lock:
+            events = self._current(key, time.monotonic())
+            return len(events) if events else 0
+
+    def add(self, key: str) -> int:
+        """이벤트 기록 후 현재 개수 반환"""
+        now = time.monotonic()
+        with self._lock:
+            events = self._current(key, now)
+            if events is None:
+                events = self._events[key] = deque(maxlen=self.limit + 1)
+            events.append(now)
+            self._events.move_to_end(key)
+            while len(self._events) > self.max_keys:
+                self._events.popitem(last=False)
+            return len(events)
+
+    def retry_after(self, key: str) -> int:
+        """한도 안으로 돌아오기까지 남은 초 (한도 미만이면 0)"""
+        now = time.monotonic()
+        with self._lock:
+            events = self._current(key, now)
+            if not events or len(events) < self.limit:
+                return 0
+            return max(1, math.ceil(events[-self.limit] + self.window_seconds - now))
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._events.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+
+def client_ip(request: Request) -> str:
+    if TRUST_FORWARDED_FOR:
+        forwarded_for = request.headers.get("X-Forwarded-For")
+        addresses = [address.strip() for address in (forwarded_for or "").split(",") if address.strip()]
+        # 프록시 수보다 짧으면 프록시를 거치지 않은 요청이므로 연결 주소 사용
+        if len(addresses) >= FORWARDED_PROXY_COUNT:
+            return addresses[-FORWARDED_PROXY_COUNT]
+    return request.client.host if request.client else "unknown"
+
+
+def _too_many_requests(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many attempts. Try again later.",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+class LoginThrottle:
+    """IP별 요청 수 + 사용자명별 실패 수 제한"""
+
+    def __init__(self):
+        self.ip_requests = SlidingWindowCounter(AUTH_IP_LIMIT, AUTH_IP_WINDOW_SECONDS)
+        self.login_failures = SlidingWindowCounter(LOGIN_FAILURE_LIMIT, LOGIN_FAILURE_WINDOW_SECONDS)
+
+    @staticmethod
+    def _username_key(username: str) -> str:
+        return username.strip().lower()
+
+    def check_ip(self, ip: str) -> None:
+        """IP 요청 기록 (한도 초과 시 429)"""
+        if self.ip_requests.add(ip) > self.ip_requests.limit:
+            raise _too_many_requests(self.ip_requests.retry_after(ip))
+
+    def check_login(self, ip: str, username: str) -> float:
+        """
+        로그인 시도 전 확인 (한도 초과 시 429)
+
+        Returns:
+            bcrypt 검증 전에 기다릴 초 (최근 실패가 많을수록 길어짐)
+        """
+        self.check_ip(ip)
+
+        key = self._username_key(username)
+        retry_after = self.login_failures.retry_after(key)
+        if retry_after:
+            raise _too_many_requests(retry_after)
+
+        failures = self.login_failures.count(key)
+        if failures < LOGIN_DELAY_AFTER_FAILURES:
+            return 0.0
+        return min(LOGIN_BASE_DELAY_SECONDS * 2 ** (failures - LOGIN_DELAY_AFTER_FAILURES), LOGIN_MAX_DELAY_SECONDS)
+
+    def record_failure(self, username: str) -> None:
+        self.login_failures.add(self._username_key(username))
+
+    def record_success(self, username: str) -> None:
+        self.login_failures.reset(self._username_key(username))
+
+
+login_throttle = LoginThrottle()
+
+
+def limit_auth_requests(request: Request) -> None:
+    """인증 엔드포인트용 IP 요청 제한 의존성"""
+    login_throttle.check_ip(client_ip(request))
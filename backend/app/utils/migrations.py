@@ -0,0 +1,78 @@
+"""
+시작 단계 스키마 준비
+import 시점이 아니라 앱 시작(lifespan) 또는 배포 단계에서 한 번만 실행합니다.
+
+- RUN_MIGRATIONS=true: alembic upgrade head를 PostgreSQL advisory lock 안에서 실행
+  (여러 워커가 동시에 시작해도 한 곳만 마이그레이션하고 나머지는 기다렸다가 건너뜀)
+- 개발 환경(ENVIRONMENT != production): 마이그레이션을 쓰지 않으면 create_all로 테이블 생성
+- 운영 환경에서 RUN_MIGRATIONS가 없으면 스키마를 건드리지 않음
+- 빈 데이터베이스(새 PostgreSQL/SQLite)는 예전 리비전을 처음부터 재생하지 않고 현재 모델로
+  테이블을 만든 뒤 head로 표시 (초기 리비전 일부는 PostgreSQL 전용이고 순서상 처음부터 재생되지 않음)
+
+배포 단계에서 직접 실행: python -m app.utils.migrations
+"""
+
+from pathlib import Path
+import logging
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect, text
+
+from app.utils.database import Base, engine
+# 메타데이터에 모든 테이블 등록 (create_all/빈 데이터베이스 초기화용)
+from app.models import game, lineup, lineup_player, player, refresh_token, team, user, venue  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+RUN_MIGRATIONS = os.getenv("RUN_MIGRATIONS", "false").lower() == "true"
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# 마이그레이션 전용 advisory lock 키 (다른 잠금과 겹치지 않는 임의의 상수)
+MIGRATION_LOCK_ID = 0x4C494E45
+
+
+def run_migrations() -> None:
+    """alembic upgrade head (PostgreSQL은 advisory lock으로 한 프로세스만 실행)"""
+    use_lock = engine.dialect.name == "postgresql"
+    with engine.connect() as connection:
+        if use_lock:
+            # 세션 단위 잠금이라 아래 트랜잭션들이 끝나도 unlock 전까지 유지됨
+            connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+            connection.commit()
+        try:
+            config = Config(str(ALEMBIC_INI))
+            config.attributes["connection"] = connection
+            if not inspect(connection).get_table_names():
+                Base.metadata.create_all(bind=connection)
+                command.stamp(config, "head")
+            else:
+                command.upgrade(config, "head")
+            connection.commit()
+        finally:
+            if use_lock:
+                connection.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+                connection.commit()
+
+
+def prepare_database() -> None:
+    """앱 시작 시 스키마 준비 (설정에 따라 마이그레이션/create_all/아무것도 안 함)"""
+    if RUN_MIGRATIONS:
+        try:
+            run_migrations()
+            logger.info("Database migrations completed")
+        except Exception:
+            # 이전과 같이 마이그레이션 실패로 서버가 재시작을 반복하지 않도록 기록만 함
+            logger.exception("Database migration failed")
+    elif ENVIRONMENT != "production":
+        # 로컬 개발용 (운영은 마이그레이션으로만 스키마 변경)
+        Base.metadata.create_all(bind=engine)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_migrations()
+    logger.info("Database migrations completed")
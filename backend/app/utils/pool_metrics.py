@@ -0,0 +1,150 @@
+"""
+커넥션 풀 지표
+풀에서 연결을 얻기까지 기다린 시간, 오버플로/포화 횟수, 타임아웃을 엔진별로 모아
+풀 크기를 실제 사용량 기준으로 정할 수 있게 합니다 (프로세스 단위).
+"""
+
+from collections import deque
+from threading import Lock
+from typing import Deque, Dict, Optional, Type
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool
+
+# 대기 시간 백분위 계산에 쓰는 최근 체크아웃 수
+WAIT_SAMPLE_SIZE = 1000
+
+
+class PoolMetrics:
+    """엔진 하나의 풀 체크아웃 대기 시간과 포화 카운터"""
+
+    def __init__(self, name: str, sample_size: int = WAIT_SAMPLE_SIZE):
+        self.name = name
+        self.engine = None
+        self._waits_ms: Deque[float] = deque(maxlen=sample_size)
+        self._lock = Lock()
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.saturated_checkouts = 0
+        self.timeouts = 0
+        self.invalidated = 0
+        self.waits = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self._waits_ms.append(wait_ms)
+            self.waits += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    @property
+    def pool(self) -> Optional[Pool]:
+        # dispose 후에는 엔진이 새 풀을 쓰므로 매번 엔진에서 가져옴
+        return self.engine.pool if self.engine is not None else None
+
+    def attach(self, engine: Engine) -> None:
+        """풀 이벤트 연결 (엔진 생성 직후 한 번, 비동기 엔진은 sync_engine)"""
+        self.engine = engine
+
+        @event.listens_for(engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            checked_out = _call(self.pool, "checkedout")
+            size = _call(self.pool, "size")
+            with self._lock:
+                self.checkouts += 1
+                if size is not None and checked_out is not None:
+                    # 기본 크기를 넘긴 연결 사용 / 오버플로까지 모두 사용 (다음 요청은 대기)
+                    if checked_out > size:
+                        self.overflow_checkouts += 1
+                    if checked_out >= size + getattr(self.pool, "_max_overflow", 0):
+                        self.saturated_checkouts += 1
+
+        @event.listens_for(engine, "invalidate")
+        def _on_invalidate(dbapi_connection, connection_record, exception):
+            # 끊어진 연결 감지 (pre-ping 실패, 연결 오류)
+            with self._lock:
+                self.invalidated += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            waits = sorted(self._waits_ms)
+            stats = {
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "saturated_checkouts": self.saturated_checkouts,
+                "timeouts": self.timeouts,
+                "invalidated": self.invalidated,
+                "wait_ms": {
+                    "avg": round(self.wait_ms_total / self.waits, 3) if self.waits else 0.0,
+                    "p50": _percentile(waits, 0.50),
+                    "p95": _percentile(waits, 0.95),
+                    "p99": _percentile(waits, 0.99),
+                    "max": round(self.wait_ms_max, 3),
+                },
+            }
+
+        pool = self.pool
+        stats["pool"] = {
+            "class": type(pool).__name__ if pool is not None else None,
+            "size": _call(pool, "size"),
+            "max_overflow": getattr(pool, "_max_overflow", None),
+            "checked_out": _call(pool, "checkedout"),
+            "checked_in": _call(pool, "checkedin"),
+            "overflow": _call(pool, "overflow"),
+        }
+        return stats
+
+
+def _call(pool, method: str):
+    # NullPool/StaticPool 등은 크기 관련 메서드가 없음
+    fn = getattr(pool, method, None)
+    return fn() if fn is not None else None
+
+
+def _percentile(values, fraction: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return round(values[index], 3)
+
+
+def timed_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """
+    체크아웃 대기 시간을 재는 풀 클래스
+
+    풀 이벤트는 연결을 얻은 뒤에만 발생하므로 대기 시간은 _do_get을 감싸서 잽니다.
+    엔진 dispose 시 풀은 같은 클래스로 다시 만들어지므로 지표 객체는 클래스 속성으로 둡니다.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return base._do_get(self)
+        except PoolTimeoutError:
+            self._metrics.record_timeout()
+            raise
+        finally:
+            self._metrics.record_wait((time.perf_counter() - start) * 1000)
+
+    return type(f"Timed{base.__name__}", (base,), {"_metrics": metrics, "_do_get": _do_get})
+
+
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def register_pool_metrics(name: str) -> PoolMetrics:
+    metrics = pool_metrics[name] = PoolMetrics(name)
+    return metrics
+
+
+def pool_metrics_snapshot() -> dict:
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
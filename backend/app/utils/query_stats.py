@@ -0,0 +1,151 @@
+"""
+요청별 SQL 실행 횟수/시간
+엔진 이벤트로 요청 하나가 보낸 SQL 수와 DB 시간을 모아 Server-Timing 헤더(브라우저 개발자 도구의
+Timing 탭)와 로그로 남깁니다. N+1 조회처럼 쿼리 수가 늘어나는 변경을 배포 전에 바로 볼 수 있습니다.
+
+엔드포인트는 query_budget(n) 의존성으로 허용 쿼리 수를 선언합니다. 넘으면 경고 로그를 남기고,
+QUERY_BUDGET_STRICT=true(개발/벤치마크용)이면 한도를 넘는 SQL을 실행하기 전에 예외를 발생시켜
+어느 코드가 추가 쿼리를 보냈는지 스택 트레이스로 바로 찾을 수 있게 합니다.
+"""
+
+from contextvars import ContextVar
+from typing import Optional
+import json
+import logging
+import os
+import time
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 응답에 Server-Timing 헤더 추가
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "true").lower() == "true"
+# 요청마다 쿼리 수/DB 시간 로그 (개발용, 한도 초과 경고는 항상 남김)
+QUERY_STATS_LOG = os.getenv("QUERY_STATS_LOG", "false").lower() == "true"
+# DB 시간이 이 이상인 요청은 QUERY_STATS_LOG가 꺼져 있어도 로그 (0이면 끔)
+QUERY_STATS_LOG_DB_MS = float(os.getenv("QUERY_STATS_LOG_DB_MS", "500"))
+# 한도를 넘는 SQL 실행 시 예외
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """query_budget으로 선언한 쿼리 수를 넘음 (QUERY_BUDGET_STRICT=true일 때만)"""
+
+
+class QueryStats:
+    """요청 하나의 SQL 수와 DB 시간"""
+
+    def __init__(self, request: Optional[Request] = None):
+        self.request = request
+        self.count = 0
+        self.db_ms = 0.0
+        self.budget: Optional[int] = None
+        self.started = time.perf_counter()
+
+    @property
+    def route(self) -> Optional[str]:
+        """요청 경로의 경로 파라미터를 이름으로 바꾼 값 (예: /api/v1/lineups/{lineup_id})"""
+        if self.request is None:
+            return None
+        # 라우터 prefix가 APIRoute.path에 들어 있지 않은 FastAPI 버전도 있어 실제 경로에서 만듦
+        names = {str(value): name for name, value in self.request.scope.get("path_params", {}).items()}
+        return "/".join(
+            f"{{{names[segment]}}}" if segment in names else segment
+            for segment in self.request.url.path.split("/")
+        )
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget is not None and self.count > self.budget
+
+    def server_timing(self) -> str:
+        total_ms = (time.perf_counter() - self.started) * 1000
+        return f'db;dur={self.db_ms:.1f};desc="{self.count} queries", app;dur={total_ms:.1f}'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진의 SQL 실행을 현재 요청 통계에 기록 (비동기 엔진은 sync_engine을 넘김)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        if stats is None:
+            return
+        if QUERY_BUDGET_STRICT and stats.budget is not None and stats.count >= stats.budget:
+            raise QueryBudgetExceeded(
+                f"쿼리 한도 {stats.budget}개 초과: {statement.splitlines()[0][:200]}"
+            )
+        conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        starts = conn.info.get("query_stats_start")
+        if stats is None or not starts:
+            return
+        stats.count += 1
+        stats.db_ms += (time.perf_counter() - starts.pop()) * 1000
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        # 실패한 SQL은 after_cursor_execute가 불리지 않으므로 시작 시각만 정리
+        connection = exception_context.connection
+        starts = connection.info.get("query_stats_start") if connection is not None else None
+        if starts:
+            starts.pop()
+
+
+def query_budget(max_queries: int):
+    """
+    엔드포인트 쿼리 한도 선언 (인증 등 의존성의 쿼리 포함)
+
+        @router.get("/", dependencies=[Depends(query_budget(6))])
+    """
+
+    def _declare_budget():
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.budget = max_queries
+
+    return _declare_budget
+
+
+async def record_query_stats(request: Request, call_next):
+    """요청마다 쿼리 통계를 모아 Server-Timing 헤더와 로그로 남기는 미들웨어"""
+    stats = QueryStats(request)
+    token = _current_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        _current_stats.reset(token)
+
+    if SERVER_TIMING_ENABLED:
+        response.headers["Server-Timing"] = stats.server_timing()
+        # 다른 도메인의 프론트엔드에서도 개발자 도구에 표시 (CORS 허용 출처에 한해)
+        allowed_origin = response.headers.get("access-control-allow-origin")
+        if allowed_origin:
+            response.headers["Timing-Allow-Origin"] = allowed_origin
+
+    record = {
+        "method": request.method,
+        "route": stats.route,
+        "status": response.status_code,
+        "queries": stats.count,
+        "db_ms": round(stats.db_ms, 1),
+        "budget": stats.budget,
+    }
+    if stats.over_budget:
+        logger.warning("query budget exceeded %s", json.dumps(record, ensure_ascii=False))
+    elif QUERY_STATS_LOG or (QUERY_STATS_LOG_DB_MS and stats.db_ms >= QUERY_STATS_LOG_DB_MS):
+        logger.info("query stats %s", json.dumps(record, ensure_ascii=False))
+    return response
@@ -0,0 +1,137 @@
+"""
+리프레시 토큰 저장소
+로그인 세션마다 refresh_token_families 한 행으로 세대(generation)를 관리하고,
+폐기된 세션 ID는 메모리에도 보관해 DB 조회 없이 거부합니다.
+
+갱신은 "현재 세대와 같을 때만 +1" 하는 UPDATE 한 번으로 처리하므로 여러 워커에서도
+같은 리프레시 토큰을 두 번 쓸 수 없습니다. 이미 사용한 토큰이 다시 들어오면
+탈취로 보고 세션 전체를 폐기합니다.
+
+단, 바로 이전 세대의 토큰이 교체 직후 REFRESH_REUSE_GRACE_SECONDS 안에 다시 들어오면
+(탭 두 개가 동시에 갱신, 응답을 못 받은 재시도) 폐기하지 않고 현재 세대 토큰을 다시 발급합니다.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Optional
+import os
+import time
+import uuid
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.models.refresh_token import RefreshTokenFamily
+from app.utils.auth import REFRESH_TOKEN_EXPIRE_DAYS, create_refresh_token
+
+# 메모리에 보관할 폐기 세션 ID 수
+REVOKED_CACHE_MAX_ENTRIES = 10000
+# 만료된 세션 행 정리 주기
+PURGE_INTERVAL_SECONDS = 3600
+# 교체 직후 이전 세대 토큰을 재사용으로 보지 않는 시간 (0이면 유예 없음)
+REFRESH_REUSE_GRACE_SECONDS = int(os.getenv("REFRESH_REUSE_GRACE_SECONDS", "30"))
+
+
+class RefreshTokenStore:
+    """리프레시 토큰 발급/갱신/폐기 (프로세스 단위 폐기 캐시 + DB)"""
+
+    def __init__(self, max_revoked: int = REVOKED_CACHE_MAX_ENTRIES):
+        self.max_revoked = max_revoked
+        self._revoked: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = Lock()
+        self._last_purge = 0.0
+
+    def _remember_revoked(self, family_id: str) -> None:
+        with self._lock:
+            self._revoked[family_id] = None
+            self._revoked.move_to_end(family_id)
+            while len(self._revoked) > self.max_revoked:
+                self._revoked.popitem(last=False)
+
+    def is_revoked(self, family_id: str) -> bool:
+        with self._lock:
+            return family_id in self._revoked
+
+    def issue(self, db: Session, user) -> str:
+        """새 로그인 세션을 만들고 첫 리프레시 토큰 반환"""
+        self._purge_expired(db)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        family_id = uuid.uuid4().hex
+        db.add(RefreshTokenFamily(id=family_id, user_id=user.id, generation=0, expires_at=expires_at))
+        db.commit()
+        # 커밋 후 family.id를 읽으면 다시 조회하면서 요청이 끝날 때까지 커넥션을 잡으므로 지역 변수 사용
+        return create_refresh_token(user, family_id, 0, expires_at)
+
+    def rotate(self, db: Session, user, payload: dict) -> Optional[str]:
+        """
+        리프레시 토큰 교체
+
+        Returns:
+            다음 세대의 리프레시 토큰, 폐기/재사용/만료된 토큰이면 None
+        """
+        family_id, generation = payload.get("fam"), payload.get("gen")
+        if not family_id or generation is None or self.is_revoked(family_id):
+            return None
+
+        now = datetime.now(timezone.utc)
+        result = db.execute(
+            update(RefreshTokenFamily)
+            .where(
+                RefreshTokenFamily.id == family_id,
+                RefreshTokenFamily.generation == generation,
+                RefreshTokenFamily.revoked == False,
+            )
+            .values(generation=generation + 1, updated_at=now)
+        )
+        # 세션 만료 시각은 처음 로그인 기준으로 유지
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        if result.rowcount == 1:
+            db.commit()
+            return create_refresh_token(user, family_id, generation + 1, expires_at)
+        db.rollback()
+
+        if self._within_grace(db, family_id, generation, now):
+            # 동시 갱신/재시도: 다른 요청이 방금 교체한 현재 세대 토큰을 그대로 발급
+            return create_refresh_token(user, family_id, generation + 1, expires_at)
+
+        # 이미 쓴 세대의 토큰 재사용 (또는 폐기된 세션) → 세션 전체 폐기
+        self.revoke(db, family_id)
+        return None
+
+    @staticmethod
+    def _within_grace(db: Session, family_id: str, generation: int, now: datetime) -> bool:
+        """바로 이전 세대 토큰이 교체 직후 다시 들어왔는지"""
+        if REFRESH_REUSE_GRACE_SECONDS <= 0:
+            return False
+        row = db.execute(
+            select(RefreshTokenFamily.generation, RefreshTokenFamily.revoked, RefreshTokenFamily.updated_at)
+            .where(RefreshTokenFamily.id == family_id)
+        ).first()
+        if row is None or row.revoked or row.generation != generation + 1 or row.updated_at is None:
+            return False
+        rotated_at = row.updated_at
+        # SQLite는 시간대 없이 UTC로 저장
+        if rotated_at.tzinfo is None:
+            rotated_at = rotated_at.replace(tzinfo=timezone.utc)
+        return now - rotated_at <= timedelta(seconds=REFRESH_REUSE_GRACE_SECONDS)
+
+    def revoke(self, db: Session, family_id: str) -> None:
+        """세션 폐기 (로그아웃, 재사용 감지)"""
+        db.execute(
+            update(RefreshTokenFamily)
+            .where(RefreshTokenFamily.id == family_id)
+            .values(revoked=True)
+        )
+        db.commit()
+        self._remember_revoked(family_id)
+
+    def _purge_expired(self, db: Session) -> None:
+        now = time.monotonic()
+        if now - self._last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        db.execute(delete(RefreshTokenFamily).where(RefreshTokenFamily.expires_at < datetime.now(timezone.utc)))
+
+
+refresh_token_store = RefreshTokenStore()
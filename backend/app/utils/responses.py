@@ -0,0 +1,88 @@
+"""
+JSON 응답 직렬화
+- ORJSONResponse: 앱 기본 응답 클래스 (orjson이 없으면 표준 json)
+- trusted_response: 데이터베이스에서 바로 만든 값은 response_model 재검증 없이 스키마 필드만 골라 바로 인코딩
+
+trusted_response는 검증을 건너뛰므로 스키마와 같은 모양의 값(모델 컬럼, 핸들러가 만든 dict)에만 씁니다.
+출력이 검증 경로와 같은지는 benchmarks/serialization.py가 비교합니다.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, Type, Union, get_args, get_origin
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+# OPT_NON_STR_KEYS: 출석 {player_id: bool}처럼 정수 키 허용
+# OPT_UTC_Z: UTC 시각을 pydantic과 같게 "Z"로 표기
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z if orjson is not None else 0
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(jsonable_encoder(content))
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+def _default(value):
+    # orjson이 모르는 타입 (pydantic 모델 등)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _nested_model(annotation) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """필드 타입에서 중첩 모델과 목록 여부 (Optional/List 풀기)"""
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _nested_model(args[0]) if len(args) == 1 else (None, False)
+    if origin in (list, List):
+        model, _ = _nested_model(get_args(annotation)[0])
+        return model, model is not None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _field_plan(model: Type[BaseModel]) -> tuple:
+    """(필드 이름, 기본값, 중첩 모델, 목록 여부) - 모델마다 한 번 계산"""
+    plan = []
+    for name, field in model.model_fields.items():
+        default = field.default if field.default is not PydanticUndefined else None
+        nested, is_list = _nested_model(field.annotation)
+        plan.append((name, default, nested, is_list))
+    return tuple(plan)
+
+
+def trusted_dump(model: Type[BaseModel], obj) -> Optional[dict]:
+    """검증 없이 모델 필드만 골라 dict로 (ORM 객체 또는 dict)"""
+    if obj is None:
+        return None
+    is_dict = isinstance(obj, dict)
+    data = {}
+    for name, default, nested, is_list in _field_plan(model):
+        value = obj.get(name, default) if is_dict else getattr(obj, name, default)
+        if nested is not None and value is not None:
+            if is_list:
+                value = [trusted_dump(nested, item) for item in value]
+            else:
+                value = trusted_dump(nested, value)
+        data[name] = value
+    return data
+
+
+def trusted_response(model: Type[BaseModel], content, **kwargs) -> ORJSONResponse:
+    """response_model 재검증을 건너뛰는 응답 (content는 객체 하나 또는 목록)"""
+    if isinstance(content, (list, tuple)):
+        return ORJSONResponse([trusted_dump(model, item) for item in content], **kwargs)
+    return ORJSONResponse(trusted_dump(model, content), **kwargs)
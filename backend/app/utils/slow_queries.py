@@ -0,0 +1,257 @@
+"""
+느린 쿼리 기록
+SLOW_QUERY_MS보다 오래 걸린 SQL을 문장, 가린 파라미터, 요청 라우트와 함께 최근 N건만 메모리에
+보관하고 (프로세스 단위, /api/v1/metrics/slow-queries), 실행 계획(EXPLAIN)은 요청을 붙잡지 않도록
+별도 연결에서 나중에 채웁니다.
+
+- 파라미터 값은 숫자/불리언/날짜만 남기고 문자열/바이너리는 길이만 기록 (이름, 전화번호, 비밀번호 해시 등)
+- SLOW_QUERY_EXPLAIN_ANALYZE=true면 PostgreSQL에서 SELECT만 EXPLAIN ANALYZE (쿼리를 한 번 더 실행)
+- 같은 문장의 실행 계획은 SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS에 한 번만 수집
+- 항목 크기 제한: 문장/실행 계획은 SLOW_QUERY_MAX_TEXT자, 파라미터는 SLOW_QUERY_MAX_PARAMETERS개까지,
+  executemany(일괄 INSERT)는 앞의 몇 벌과 전체 벌 수만 기록
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context, ContextVar
+from datetime import date, datetime, time as dt_time, timezone
+from decimal import Decimal
+from itertools import count
+from threading import Lock
+from typing import Deque, Dict, List, Optional, Set
+import asyncio
+import json
+import logging
+import os
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.utils.query_stats import current_query_stats
+
+logger = logging.getLogger(__name__)
+
+# 0이면 기록하지 않음
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_BUFFER_SIZE = int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "100"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true"
+SLOW_QUERY_EXPLAIN_ANALYZE = os.getenv("SLOW_QUERY_EXPLAIN_ANALYZE", "false").lower() == "true"
+SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS = float(os.getenv("SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS", "60"))
+# 항목 하나의 크기 상한 (버퍼 항목 수만이 아니라 메모리/로그 크기도 일정하게)
+SLOW_QUERY_MAX_TEXT = int(os.getenv("SLOW_QUERY_MAX_TEXT", "4000"))
+SLOW_QUERY_MAX_PARAMETERS = int(os.getenv("SLOW_QUERY_MAX_PARAMETERS", "50"))
+# executemany에서 남길 파라미터 벌 수
+EXECUTEMANY_SAMPLE_SIZE = 3
+
+# 실행 계획 수집 중인 연결의 SQL은 다시 기록하지 않음
+_explaining: ContextVar[bool] = ContextVar("slow_query_explaining", default=False)
+
+_SAFE_PARAMETER_TYPES = (bool, int, float, Decimal, date, datetime, dt_time, type(None))
+
+
+def redact_value(value):
+    """기록해도 되는 값(숫자/날짜 등)만 남기고 나머지는 타입과 길이로 대체"""
+    if isinstance(value, _SAFE_PARAMETER_TYPES):
+        return value if not isinstance(value, (date, dt_time, Decimal)) else str(value)
+    if isinstance(value, (str, bytes, bytearray, memoryview)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    if isinstance(value, (list, tuple)):
+        return [redact_value(item) for item in value]
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters, max_parameters: int = SLOW_QUERY_MAX_PARAMETERS):
+    """파라미터 한 벌 (IN 목록처럼 많으면 앞의 max_parameters개와 나머지 개수만)"""
+    if isinstance(parameters, dict):
+        redacted = {key: redact_value(value) for key, value in list(parameters.items())[:max_parameters]}
+        if len(parameters) > max_parameters:
+            redacted["..."] = f"{len(parameters) - max_parameters} more"
+        return redacted
+    if isinstance(parameters, (list, tuple)):
+        redacted = [redact_value(value) for value in parameters[:max_parameters]]
+        if len(parameters) > max_parameters:
+            redacted.append(f"... {len(parameters) - max_parameters} more")
+        return redacted
+    return redact_value(parameters)
+
+
+def redact_executemany(parameters) -> dict:
+    """executemany 파라미터 (앞의 몇 벌과 전체 벌 수)"""
+    return {
+        "sample": [redact_parameters(item) for item in parameters[:EXECUTEMANY_SAMPLE_SIZE]],
+        "count": len(parameters),
+    }
+
+
+def truncate_text(text: str, limit: int = SLOW_QUERY_MAX_TEXT) -> str:
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... ({len(text)}자 중 {limit}자)"
+
+
+def _explain_sql(dialect_name: str, statement: str) -> Optional[str]:
+    """실행 계획 조회 SQL (지원하지 않는 데이터베이스면 None)"""
+    if dialect_name == "sqlite":
+        return f"EXPLAIN QUERY PLAN {statement}"
+    if dialect_name == "postgresql":
+        # ANALYZE는 실제로 실행하므로 조회만 (INSERT/UPDATE/DELETE를 다시 실행하지 않음)
+        if SLOW_QUERY_EXPLAIN_ANALYZE and statement.lstrip().upper().startswith("SELECT"):
+            return f"EXPLAIN (ANALYZE, BUFFERS) {statement}"
+        return f"EXPLAIN {statement}"
+    return None
+
+
+def _format_plan(dialect_name: str, rows) -> str:
+    if dialect_name == "sqlite":
+        # (id, parent, notused, detail)
+        return "\n".join(str(row[-1]) for row in rows)
+    return "\n".join(str(row[0]) for row in rows)
+
+
+class SlowQueryLog:
+    """최근 느린 쿼리 링 버퍼"""
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_MS, max_entries: int = SLOW_QUERY_BUFFER_SIZE):
+        self.threshold_ms = threshold_ms
+        self._entries: Deque[dict] = deque(maxlen=max_entries)
+        self._lock = Lock()
+        self._ids = count(1)
+        self._explained_at: Dict[str, float] = {}
+        self._async_engines: Dict[int, AsyncEngine] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.total = 0
+
+    def watch(self, engine) -> None:
+        """엔진 SQL 감시 (비동기 엔진은 AsyncEngine 그대로 넘김 - 실행 계획도 같은 드라이버로 조회)"""
+        sync_engine = engine
+        if isinstance(engine, AsyncEngine):
+            sync_engine = engine.sync_engine
+            self._async_engines[id(sync_engine)] = engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            starts = conn.info.get("slow_query_start")
+            if not starts:
+                return
+            elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+            if self.threshold_ms > 0 and elapsed_ms >= self.threshold_ms and not _explaining.get():
+                self.record(sync_engine, statement, parameters, elapsed_ms, executemany)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _handle_error(exception_context):
+            connection = exception_context.connection
+            starts = connection.info.get("slow_query_start") if connection is not None else None
+            if starts:
+                starts.pop()
+
+    def record(self, engine: Engine, statement: str, parameters, elapsed_ms: float, executemany: bool = False) -> dict:
+        stats = current_query_stats()
+        request = stats.request if stats is not None else None
+        entry = {
+            "id": next(self._ids),
+            "at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed_ms, 1),
+            "method": request.method if request is not None else None,
+            "route": stats.route if stats is not None else None,
+            "statement": truncate_text(statement),
+            "parameters": redact_executemany(parameters) if executemany else redact_parameters(parameters),
+            "explain": None,
+            "explain_error": None,
+        }
+        with self._lock:
+            self._entries.append(entry)
+            self.total += 1
+
+        logger.warning("slow query %s", json.dumps(
+            {key: entry[key] for key in ("duration_ms", "method", "route", "statement", "parameters")},
+            ensure_ascii=False, default=str,
+        ))
+
+        # executemany(일괄 INSERT)는 파라미터가 여러 벌이라 실행 계획을 만들 수 없음
+        if SLOW_QUERY_EXPLAIN and not executemany and self._should_explain(statement):
+            self._schedule_explain(engine, entry, statement, parameters)
+        return entry
+
+    def _should_explain(self, statement: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            last = self._explained_at.get(statement)
+            if last is not None and now - last < SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS:
+                return False
+            self._explained_at[statement] = now
+            # 문장 수가 버퍼보다 훨씬 많아지지 않도록 오래된 것부터 정리
+            if len(self._explained_at) > self._entries.maxlen * 10:
+                for key, at in list(self._explained_at.items()):
+                    if now - at >= SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS:
+                        del self._explained_at[key]
+        return True
+
+    def _schedule_explain(self, engine: Engine, entry: dict, statement: str, parameters) -> None:
+        explain_sql = _explain_sql(engine.dialect.name, statement)
+        if explain_sql is None:
+            entry["explain_error"] = f"지원하지 않는 데이터베이스: {engine.dialect.name}"
+            return
+
+        async_engine = self._async_engines.get(id(engine))
+        if async_engine is not None:
+            # 비동기 엔진의 SQL은 같은 이벤트 루프에서 비동기로 수집 (요청 컨텍스트와 분리)
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                entry["explain_error"] = "이벤트 루프 없음"
+                return
+            task = loop.create_task(
+                self._explain_async(async_engine, entry, explain_sql, parameters), context=Context()
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        self._executor.submit(self._explain_sync, engine, entry, explain_sql, parameters)
+
+    def _explain_sync(self, engine: Engine, entry: dict, explain_sql: str, parameters) -> None:
+        _explaining.set(True)
+        try:
+            with engine.connect() as connection:
+                rows = connection.exec_driver_sql(explain_sql, parameters).all()
+                connection.rollback()
+            entry["explain"] = truncate_text(_format_plan(engine.dialect.name, rows))
+        except Exception as e:
+            entry["explain_error"] = truncate_text(str(e))
+
+    async def _explain_async(self, async_engine: AsyncEngine, entry: dict, explain_sql: str, parameters) -> None:
+        _explaining.set(True)
+        try:
+            async with async_engine.connect() as connection:
+                rows = (await connection.exec_driver_sql(explain_sql, parameters)).all()
+                await connection.rollback()
+            entry["explain"] = truncate_text(_format_plan(async_engine.dialect.name, rows))
+        except asyncio.CancelledError:
+            # 서버 종료 등으로 이벤트 루프가 멈춤
+            entry["explain_error"] = "실행 계획 수집 취소"
+            raise
+        except Exception as e:
+            entry["explain_error"] = truncate_text(str(e))
+
+    def entries(self, limit: Optional[int] = None) -> List[dict]:
+        """최근 항목부터"""
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._explained_at.clear()
+
+
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,70 @@
+"""
+SQLite 연결 튜닝
+DATABASE_URL이 sqlite:/// 이면 데이터베이스 서버 없이 한 대에서 앱/벤치마크를 돌릴 수 있습니다.
+연결마다 아래 PRAGMA를 적용해 동시 읽기/쓰기와 처리량을 PostgreSQL 실행과 비슷하게 맞춥니다.
+
+- journal_mode=WAL: 쓰는 동안에도 다른 연결이 읽을 수 있음 (동기/비동기 엔진이 같은 파일 사용)
+- synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 손상되지 않음 (전원 장애 시 마지막 커밋만 유실 가능)
+- mmap_size: 파일을 메모리 매핑해 읽기 시스템 호출을 줄임
+- busy_timeout: 다른 연결이 쓰는 중이면 바로 실패하지 않고 기다림
+- foreign_keys=ON: SQLite는 기본으로 외래 키를 검사하지 않으므로 PostgreSQL과 같은 제약 적용
+
+SQLITE_TUNING=false 이면 외래 키만 켜고 드라이버 기본값 그대로 사용 (튜닝 전후 비교용).
+"""
+
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+SQLITE_TUNING = os.getenv("SQLITE_TUNING", "true").lower() == "true"
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+# 바이트 (기본 256MB, 파일이 더 작으면 파일 크기만큼만 매핑됨)
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# 음수는 KB 단위 (기본 64MB 페이지 캐시)
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+
+def is_sqlite_url(database_url) -> bool:
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+
+def _is_memory_database(database_url) -> bool:
+    database = make_url(database_url).database
+    return not database or database == ":memory:" or "mode=memory" in database
+
+
+def sqlite_pragmas(database_url) -> list:
+    """연결마다 실행할 PRAGMA 목록"""
+    pragmas = [("foreign_keys", "ON")]
+    if not SQLITE_TUNING:
+        return pragmas
+    # 메모리 데이터베이스는 WAL을 쓸 수 없음 (memory 저널 유지)
+    if not _is_memory_database(database_url):
+        pragmas.append(("journal_mode", SQLITE_JOURNAL_MODE))
+    pragmas += [
+        ("synchronous", SQLITE_SYNCHRONOUS),
+        ("mmap_size", SQLITE_MMAP_SIZE),
+        ("cache_size", SQLITE_CACHE_SIZE),
+        ("busy_timeout", SQLITE_BUSY_TIMEOUT_MS),
+        ("temp_store", "MEMORY"),
+    ]
+    return pragmas
+
+
+def apply_sqlite_tuning(engine: Engine) -> None:
+    """SQLite 엔진이면 새 연결마다 PRAGMA 적용 (비동기 엔진은 sync_engine을 넘김)"""
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas(engine.url)
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+선수 명단 크기별 라인업 카드 이미지 벤치마크
+활성 선수 20/200/2000명일 때 이미지 크기, 바이트, 렌더링 시간을 출력하고
+명단이 MAX_CARD_ROSTER_ROWS를 넘어도 높이가 늘지 않는지 확인합니다 (늘면 종료 코드 1).
+
+사용법: python -m benchmarks.card_size [--repeat 5] [--width 1080]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from io import BytesIO
+
+from PIL import Image
+
+from app.services.lineup_card import DEFAULT_CARD_WIDTH, MAX_CARD_ROSTER_ROWS, render_lineup_card
+from benchmarks.fixtures import make_document
+
+ROSTER_SIZES = [20, 200, 2000]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="선수 명단 크기별 카드 이미지 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--width", type=int, default=DEFAULT_CARD_WIDTH, help="이미지 폭 (px)")
+    args = parser.parse_args()
+
+    # 명단이 상한을 꽉 채운 카드의 높이가 기준 (이보다 높으면 상한이 적용되지 않은 것)
+    full_card = render_lineup_card(make_document(MAX_CARD_ROSTER_ROWS), width=args.width)
+    max_height = Image.open(BytesIO(full_card)).height
+
+    print(f"{'roster':>8}{'size':>12}{'bytes':>10}{'p50 ms':>10}{'max ms':>10}")
+    unbounded = []
+    for roster_size in ROSTER_SIZES:
+        document = make_document(roster_size)
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            content = render_lineup_card(document, width=args.width)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        width, height = Image.open(BytesIO(content)).size
+        print(f"{roster_size:>8}{f'{width}x{height}':>12}{len(content):>10}"
+              f"{statistics.median(timings):>10.1f}{max(timings):>10.1f}")
+        if height > max_height:
+            unbounded.append(roster_size)
+
+    if unbounded:
+        print(f"높이 상한({max_height}px) 초과: 명단 {unbounded}명")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
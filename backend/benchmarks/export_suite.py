@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+PDF/엑셀 내보내기 엔드포인트 벤치마크
+임시 SQLite 데이터베이스에 선수 명단 크기별 라인업을 만들고, 엔드포인트마다
+지연 시간(p50/p95), 최대 메모리, 출력 크기를 측정해 기준값과 비교합니다.
+기준값보다 threshold 이상 나빠진 항목이 있으면 종료 코드 1로 끝납니다.
+
+PDF 크기는 임베딩한 한글 폰트에 따라 크게 달라지므로, 기준값을 만든 환경과 폰트가 같을 때만
+크기를 비교합니다. 미들웨어처럼 요청마다 드는 비용이 바뀌는 변경 뒤에는 기준값을 다시 저장합니다.
+
+사용법:
+    python -m benchmarks.export_suite                   # 기준값과 비교
+    python -m benchmarks.export_suite --save-baseline   # 현재 결과를 기준값으로 저장
+    python -m benchmarks.export_suite --repeat 30 --threshold 0.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+# 실제 데이터베이스를 건드리지 않도록 app을 import하기 전에 전용 SQLite로 고정
+BENCH_DATABASE_PATH = os.path.join(tempfile.gettempdir(), "lineup_export_bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{BENCH_DATABASE_PATH}"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.dependencies.auth import get_current_active_user
+from app.enums.player_role import PlayerRole
+from app.main import app
+from app.models.game import Game
+from app.models.lineup import Lineup
+from app.models.lineup_player import LineupPlayer
+from app.models.player import Player
+from app.models.team import Team
+from app.models.venue import Venue
+from app.services.export_service import export_cache
+from app.services.lineup_pdf import CID_FONT_NAME, HANGUL_FONT_PATHS
+from app.utils.database import Base, SessionLocal, engine
+from benchmarks.fixtures import player_name
+
+ROSTER_SIZES = [20, 200, 2000]
+ENDPOINTS = {
+    "pdf": "/api/v1/pdf/lineup/{lineup_id}/pdf",
+    "xlsx": "/api/v1/excel/lineup/{lineup_id}/excel",
+}
+LINEUP_POSITIONS = ["P", "C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH"]
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "export_suite.json")
+# 비교 항목 (작을수록 좋음, p95는 공유 환경에서 흔들림이 커서 출력만 함)
+COMPARED_METRICS = ("p50_ms", "peak_kb", "bytes")
+# 이보다 작은 시간 차이는 측정 잡음으로 보고 무시
+MIN_TIME_DELTA_MS = 10.0
+
+
+def pdf_font() -> str:
+    """PDF에 쓰이는 한글 폰트 (register_korean_font와 같은 순서로 탐색, 없으면 CID 폰트)"""
+    return next((os.path.basename(path) for path in HANGUL_FONT_PATHS if os.path.exists(path)), CID_FONT_NAME)
+
+
+def seed_database(roster_size: int) -> int:
+    """활성 선수 roster_size명, 라인업 1개를 만들고 라인업 ID 반환"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        db.add_all([Team(name="씨밀레", is_our_team=True), Team(name="상대팀")])
+        db.add(Venue(name="잠실 야구장"))
+        db.flush()
+        db.execute(insert(Player), [
+            {
+                "name": player_name(i),
+                "number": str(i),
+                "phone": "",
+                "role": PlayerRole.COACH if i == 0 else PlayerRole.PLAYER,
+            }
+            for i in range(roster_size)
+        ])
+        game = Game(game_date=datetime(2025, 9, 6, 14, 0), venue_id=1, opponent_team_id=2)
+        db.add(game)
+        db.flush()
+        lineup = Lineup(game_id=game.id, name="주말 리그")
+        db.add(lineup)
+        db.flush()
+        db.execute(insert(LineupPlayer), [
+            {"lineup_id": lineup.id, "player_id": order + 1, "position": position, "batting_order": order}
+            for order, position in enumerate(LINEUP_POSITIONS)
+        ])
+        db.commit()
+        return lineup.id
+    finally:
+        db.close()
+
+
+def _request(client: TestClient, url: str) -> bytes:
+    # 매번 실제 렌더링을 측정하도록 렌더링 캐시를 비움
+    export_cache.clear()
+    response = client.get(url)
+    response.raise_for_status()
+    return response.content
+
+
+def measure(client: TestClient, url: str, repeat: int) -> dict:
+    content = _request(client, url)  # 폰트 로딩 등 워밍업
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _request(client, url)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    # tracemalloc은 느려지므로 시간 측정과 분리해서 한 번만
+    tracemalloc.start()
+    _request(client, url)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "p50_ms": round(statistics.median(timings), 1),
+        "p95_ms": round(statistics.quantiles(timings, n=20)[18], 1),
+        "peak_kb": round(peak / 1024),
+        "bytes": len(content),
+    }
+
+
+def run_suite(repeat: int) -> dict:
+    client = TestClient(app)
+    app.dependency_overrides[get_current_active_user] = lambda: None
+    results = {}
+    try:
+        for roster_size in ROSTER_SIZES:
+            lineup_id = seed_database(roster_size)
+            for export_format, url in ENDPOINTS.items():
+                case = f"{export_format}/roster_{roster_size}"
+                results[case] = measure(client, url.format(lineup_id=lineup_id), repeat)
+                print(f"{case:<20}" + "".join(f"{results[case][m]:>12}" for m in ("p50_ms", "p95_ms", "peak_kb", "bytes")))
+    finally:
+        app.dependency_overrides.clear()
+    return results
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float, compare_pdf_bytes: bool = True) -> list:
+    regressions = []
+    for case, metrics in results.items():
+        expected = baseline.get(case)
+        if not expected:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric == "bytes" and case.startswith("pdf/") and not compare_pdf_bytes:
+                continue
+            limit = expected[metric] * (1 + threshold)
+            if metric.endswith("_ms"):
+                limit = max(limit, expected[metric] + MIN_TIME_DELTA_MS)
+            if metrics[metric] > limit:
+                regressions.append(f"{case} {metric}: {metrics[metric]} > {expected[metric]} (+{threshold:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF/엑셀 내보내기 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+    parser.add_argument("--threshold", type=float, default=0.3, help="허용 악화 비율 (0.3 = 30%%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    args = parser.parse_args()
+
+    print(f"{'case':<20}{'p50 ms':>12}{'p95 ms':>12}{'peak KB':>12}{'bytes':>12}")
+    results = run_suite(args.repeat)
+    font = pdf_font()
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"pdf_font": font, "results": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"기준값 저장: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"기준값 없음: {args.baseline} (--save-baseline으로 생성)")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    compare_pdf_bytes = baseline.get("pdf_font") == font
+    if not compare_pdf_bytes:
+        print(f"PDF 폰트가 기준값과 달라 PDF 크기는 비교하지 않음 (기준 {baseline.get('pdf_font')}, 현재 {font})")
+    regressions = find_regressions(results, baseline.get("results", {}), args.threshold, compare_pdf_bytes)
+    if regressions:
+        print("성능 저하:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"기준값 대비 이상 없음 (허용 {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+벤치마크용 합성 데이터
+데이터베이스 없이 LineupDocument를 만듭니다.
+"""
+
+from datetime import datetime
+
+from app.services.lineup_document import LineupDocument, LineupRow, RosterEntry, POSITION_NAMES
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["민준", "서준", "도윤", "예준", "시우", "하준", "주원", "지호", "지후", "준서"]
+
+
+def player_name(index: int) -> str:
+    return SURNAMES[index % len(SURNAMES)] + GIVEN_NAMES[(index // len(SURNAMES)) % len(GIVEN_NAMES)]
+
+
+def make_document(roster_size: int = 25, lineup_id: int = 1) -> LineupDocument:
+    """타순 9명 + 투수, 활성 선수 roster_size명인 라인업 문서"""
+    positions = [code for code in POSITION_NAMES if code != "P"]
+    rows = [
+        LineupRow(str(order), POSITION_NAMES[positions[order - 1]], player_name(order), str(order))
+        for order in range(1, 10)
+    ]
+    rows.append(LineupRow("P", "투수", player_name(0), "0"))
+    roster = tuple(RosterEntry(str(i), player_name(i)) for i in range(roster_size))
+    return LineupDocument(
+        lineup_id=lineup_id,
+        lineup_name="주말 리그",
+        team_name="씨밀레",
+        coach_name="홍길동",
+        game_date=datetime(2025, 9, 6, 14, 0),
+        venue_name="잠실 야구장",
+        opponent_name="상대팀",
+        lineup_rows=tuple(rows),
+        roster=roster,
+    )
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+자주 쓰는 조회의 실행 계획 점검
+큰 테이블을 만들어 놓고 라우터/내보내기의 주요 조회를 EXPLAIN 해서,
+인덱스 대신 테이블 전체를 읽는(sequential scan) 조회가 있으면 종료 코드 1로 끝납니다.
+
+기본은 임시 SQLite, PostgreSQL 계획을 보려면 빈 점검용 데이터베이스를 지정합니다
+(테이블을 지우고 다시 만드므로 운영/개발 데이터베이스에는 쓰지 마세요).
+
+사용법:
+    python -m benchmarks.index_check
+    INDEX_CHECK_DATABASE_URL=postgresql://.../lineup_index_check python -m benchmarks.index_check
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+# 실제 데이터베이스를 건드리지 않도록 app을 import하기 전에 점검용 데이터베이스로 고정
+CHECK_DATABASE_PATH = os.path.join(tempfile.gettempdir(), "lineup_index_check.db")
+os.environ["DATABASE_URL"] = os.getenv("INDEX_CHECK_DATABASE_URL", f"sqlite:///{CHECK_DATABASE_PATH}")
+
+from sqlalchemy import insert, select, text
+
+from app.enums.player_role import PlayerRole
+from app.models.game import Game
+from app.models.lineup import Lineup
+from app.models.lineup_player import LineupPlayer
+from app.models.player import Player
+from app.models.team import Team
+from app.models.venue import Venue
+from app.models import user, refresh_token  # noqa: F401 (메타데이터 등록)
+from app.utils.database import Base, engine
+from benchmarks.fixtures import player_name
+
+LINEUP_POSITIONS = ["P", "C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH"]
+
+
+def seed_database(players: int, games: int, teams: int) -> None:
+    """선수 players명, 경기/라인업 games개(라인업마다 10명), 팀 teams개"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    start = datetime(2020, 3, 1, 14, 0)
+    with engine.begin() as connection:
+        connection.execute(insert(Team), [
+            {"name": f"팀{i}", "is_our_team": i == 0, "is_active": True} for i in range(teams)
+        ])
+        connection.execute(insert(Venue), [{"name": f"경기장{i}"} for i in range(50)])
+        connection.execute(insert(Player), [
+            {
+                "name": player_name(i),
+                "number": str(i),
+                "phone": "",
+                "role": PlayerRole.COACH if i % 500 == 0 else PlayerRole.PLAYER,
+                "is_active": i % 10 != 0,
+                "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(players)
+        ])
+        connection.execute(insert(Game), [
+            {
+                "game_date": start + timedelta(days=i // 3, hours=i % 3),
+                "venue_id": i % 50 + 1,
+                "opponent_team_id": i % (teams - 1) + 2,
+                # 대부분 지난 경기, 예정 경기는 일부
+                "status": "SCHEDULED" if i >= games - 30 else "COMPLETED",
+            }
+            for i in range(games)
+        ])
+        connection.execute(insert(Lineup), [
+            {"game_id": i + 1, "name": f"라인업{i}"} for i in range(games)
+        ])
+        connection.execute(insert(LineupPlayer), [
+            {
+                "lineup_id": lineup_id,
+                "player_id": (lineup_id * 7 + order) % players + 1,
+                "position": position,
+                "batting_order": order,
+            }
+            for lineup_id in range(1, games + 1)
+            for order, position in enumerate(LINEUP_POSITIONS)
+        ])
+        connection.execute(text("ANALYZE"))
+
+
+def hot_queries() -> dict:
+    """점검할 조회 (라우터/서비스가 실제로 보내는 형태)"""
+    upcoming = datetime(2030, 1, 1)
+    return {
+        # 라인업 목록/생성 시 경기별 라인업, 경기의 라인업 수
+        "lineups_by_game": select(Lineup).where(Lineup.game_id == 1234),
+        # 라인업 상세/문서 로더의 선수 목록 (타순 정렬)
+        "lineup_players_by_lineup": (
+            select(LineupPlayer)
+            .where(LineupPlayer.lineup_id.in_([10, 20, 30]))
+            .order_by(LineupPlayer.lineup_id, LineupPlayer.batting_order)
+        ),
+        # 선수 추가 시 타순 교체 / 포지션 중복 확인
+        "lineup_batting_order_check": select(LineupPlayer).where(
+            LineupPlayer.lineup_id == 10, LineupPlayer.batting_order == 3
+        ),
+        "lineup_position_check": select(LineupPlayer).where(
+            LineupPlayer.lineup_id == 10,
+            LineupPlayer.position == "SS",
+            LineupPlayer.batting_order >= 1,
+            LineupPlayer.batting_order <= 9,
+        ).limit(1),
+        # 선수 삭제/출전 기록
+        "lineup_players_by_player": select(LineupPlayer).where(LineupPlayer.player_id == 77),
+        # 선수 목록 (필터 + 최신 등록순)
+        "players_recent": select(Player).order_by(Player.created_at.desc()).limit(20),
+        "players_active_recent": (
+            select(Player).where(Player.is_active == True).order_by(Player.created_at.desc()).limit(20)
+        ),
+        "players_role_recent": (
+            select(Player).where(Player.role == PlayerRole.COACH).order_by(Player.created_at.desc()).limit(20)
+        ),
+        # 경기 목록 (상태 필터), 다가오는 경기/시즌 범위
+        "games_by_status": select(Game).where(Game.status == "SCHEDULED").limit(20),
+        "games_in_range": select(Game).where(
+            Game.game_date >= datetime(2021, 1, 1), Game.game_date < datetime(2021, 2, 1)
+        ),
+        "games_upcoming": select(Game).where(Game.game_date >= upcoming).order_by(Game.game_date).limit(20),
+        # 우리 팀 조회
+        "our_team": select(Team).where(Team.is_our_team == True).limit(1),
+    }
+
+
+def _sqlite_plan(connection, sql: str) -> tuple:
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+    details = [row[-1] for row in rows]
+    # "SCAN players" = 전체 읽기, "SCAN players USING INDEX ..." / "SEARCH ..." = 인덱스 사용
+    scans = [
+        detail.split()[1] for detail in details
+        if detail.startswith("SCAN ") and "USING" not in detail and "SUBQUERY" not in detail
+    ]
+    return "; ".join(details), scans
+
+
+def _postgres_plan(connection, sql: str) -> tuple:
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes, scans = [], []
+
+    def walk(node):
+        nodes.append(node["Node Type"] + (f" on {node['Relation Name']}" if "Relation Name" in node else ""))
+        if node["Node Type"] == "Seq Scan":
+            scans.append(node["Relation Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan[0]["Plan"])
+    return " > ".join(nodes), scans
+
+
+def explain(connection, statement) -> tuple:
+    # 값을 SQL에 직접 넣어 컴파일 (EXPLAIN은 드라이버별 파라미터 형식을 거치지 않음)
+    sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    if engine.dialect.name == "postgresql":
+        return _postgres_plan(connection, sql)
+    return _sqlite_plan(connection, sql)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주요 조회 실행 계획 점검 (sequential scan 검출)")
+    parser.add_argument("--players", type=int, default=20000, help="선수 수")
+    parser.add_argument("--games", type=int, default=5000, help="경기 수 (경기마다 라인업 1개, 선수 10명)")
+    parser.add_argument("--teams", type=int, default=200, help="팀 수")
+    parser.add_argument("--verbose", action="store_true", help="실행 계획 전체 출력")
+    args = parser.parse_args()
+
+    print(f"데이터 생성: {engine.dialect.name}, 선수 {args.players}, 경기 {args.games}, 팀 {args.teams}")
+    seed_database(args.players, args.games, args.teams)
+
+    failures = []
+    with engine.connect() as connection:
+        for name, statement in hot_queries().items():
+            plan, scans = explain(connection, statement)
+            status = "OK" if not scans else f"SEQ SCAN ({', '.join(scans)})"
+            print(f"{name:<28}{status}")
+            if args.verbose or scans:
+                print(f"  {plan}")
+            if scans:
+                failures.append(name)
+
+    if failures:
+        print(f"인덱스를 쓰지 않는 조회 {len(failures)}개: {', '.join(failures)}")
+        sys.exit(1)
+    print("모든 조회가 인덱스를 사용합니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+동시 로그인 처리량 벤치마크
+임시 SQLite 데이터베이스에 사용자를 만들고 동시 접속 수별로 POST /auth/token의
+초당 처리량과 지연 시간을 측정합니다. 같은 시간 동안 /health를 계속 호출해
+bcrypt가 이벤트 루프를 막지 않는지(헬스 체크 지연)도 함께 출력합니다.
+
+사용법: python -m benchmarks.login_throughput [--logins 64] [--rounds 12]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+# 실제 데이터베이스를 건드리지 않도록 app을 import하기 전에 전용 SQLite로 고정
+BENCH_DATABASE_PATH = os.path.join(tempfile.gettempdir(), "lineup_login_bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{BENCH_DATABASE_PATH}"
+# 모든 로그인이 한 IP에서 오므로 IP별 인증 요청 제한을 사실상 끔 (bcrypt 처리량만 측정)
+os.environ.setdefault("AUTH_IP_LIMIT", "1000000")
+
+import httpx
+
+CONCURRENCY_LEVELS = [1, 8, 32]
+BENCH_USERS = 32
+BENCH_PASSWORD = "bench-password"
+HEALTH_PROBE_INTERVAL = 0.01
+
+
+def seed_users(count: int) -> None:
+    # 로그인 경로가 쓰는 테이블 (users, refresh_token_families) 등록
+    from app.models import refresh_token  # noqa: F401
+    from app.models.user import User
+    from app.utils.auth import pwd_context
+    from app.utils.database import Base, SessionLocal, engine
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    password_hash = pwd_context.hash(BENCH_PASSWORD)
+    db = SessionLocal()
+    try:
+        db.add_all([User(username=f"user{i}", password_hash=password_hash, role="감독") for i in range(count)])
+        db.commit()
+    finally:
+        db.close()
+
+
+def _p95(values):
+    return statistics.quantiles(values, n=20)[18] if len(values) > 1 else values[0]
+
+
+async def _probe_health(client: httpx.AsyncClient, stop: asyncio.Event, latencies: list) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/health")
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL)
+
+
+async def run_level(client: httpx.AsyncClient, concurrency: int, logins: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def login(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/v1/auth/token",
+                data={"username": f"user{i % BENCH_USERS}", "password": BENCH_PASSWORD},
+            )
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    stop = asyncio.Event()
+    health_latencies = []
+    probe = asyncio.create_task(_probe_health(client, stop, health_latencies))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login(i) for i in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+
+    return {
+        "per_sec": logins / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": _p95(latencies),
+        "health_p95_ms": _p95(health_latencies),
+    }
+
+
+async def run(logins: int) -> None:
+    from app.main import app
+    from app.utils.auth import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS
+
+    print(f"bcrypt rounds={BCRYPT_ROUNDS}, workers={PASSWORD_HASH_WORKERS}, logins={logins}")
+    print(f"{'concurrency':>12}{'logins/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'health p95':>12}")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await run_level(client, 1, 2)  # 워밍업
+        for concurrency in CONCURRENCY_LEVELS:
+            result = await run_level(client, concurrency, logins)
+            print(f"{concurrency:>12}{result['per_sec']:>10.1f}{result['p50_ms']:>10.1f}"
+                  f"{result['p95_ms']:>10.1f}{result['health_p95_ms']:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 로그인 처리량 벤치마크")
+    parser.add_argument("--logins", type=int, default=64, help="동시 접속 수별 로그인 횟수")
+    parser.add_argument("--rounds", type=int, help="bcrypt 작업 비용 (기본: BCRYPT_ROUNDS 환경 변수)")
+    args = parser.parse_args()
+
+    if args.rounds:
+        os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+
+    seed_users(BENCH_USERS)
+    asyncio.run(run(args.logins))
+
+
+if __name__ == "__main__":
+    main()
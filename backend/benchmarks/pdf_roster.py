@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+선수 명단 크기별 라인업 PDF 렌더링 벤치마크
+활성 선수 20/200/2000명일 때 페이지 수, 바이트, 렌더링 시간을 출력합니다.
+
+사용법: python -m benchmarks.pdf_roster [--repeat 5]
+"""
+
+import argparse
+import re
+import statistics
+import time
+
+from app.services.lineup_pdf import render_lineup_pdf
+from benchmarks.fixtures import make_document
+
+ROSTER_SIZES = [20, 200, 2000]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="선수 명단 크기별 PDF 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"{'roster':>8}{'pages':>8}{'bytes':>10}{'p50 ms':>10}{'max ms':>10}")
+    for roster_size in ROSTER_SIZES:
+        document = make_document(roster_size)
+        render_lineup_pdf(document)  # 폰트 로딩 등 워밍업
+
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            content = render_lineup_pdf(document)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        pages = len(re.findall(rb"/Type /Page\b(?!s)", content))
+        print(f"{roster_size:>8}{pages:>8}{len(content):>10}"
+              f"{statistics.median(timings):>10.1f}{max(timings):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+라인업 PDF 크기/렌더링 시간 벤치마크
+프로파일별 출력 바이트와 렌더링 시간을 출력합니다.
+
+사용법: python -m benchmarks.pdf_size [--repeat 20]
+"""
+
+import argparse
+import statistics
+import time
+
+from app.services.lineup_pdf import PDF_PROFILES, render_lineup_pdf, register_korean_font, KOREAN_FONT_NAME
+from benchmarks.fixtures import make_document
+
+# 일반적인 동호회 규모
+ROSTER_SIZES = [15, 20, 25]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라인업 PDF 크기 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    embedded = register_korean_font(embed=True)
+    print(f"임베딩 폰트: {'한글 TTF' if embedded == KOREAN_FONT_NAME else embedded + ' (TTF 없음)'}")
+    print(f"{'profile':<14}{'roster':>8}{'bytes':>10}{'p50 ms':>10}{'max ms':>10}")
+
+    for profile in PDF_PROFILES.values():
+        for roster_size in ROSTER_SIZES:
+            document = make_document(roster_size)
+            render_lineup_pdf(document, profile)  # 폰트 로딩 등 워밍업
+
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                content = render_lineup_pdf(document, profile)
+                timings.append((time.perf_counter() - started) * 1000)
+
+            print(f"{profile.name:<14}{roster_size:>8}{len(content):>10}"
+                  f"{statistics.median(timings):>10.1f}{max(timings):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+목록 응답 압축 전후 크기 비교
+임시 SQLite 데이터베이스에 선수/경기/라인업을 만들고 목록 엔드포인트를 압축 없이(identity),
+gzip, Brotli로 받아 실제 전송 바이트와 압축 시간을 출력합니다.
+
+사용법:
+    python -m benchmarks.response_compression
+    python -m benchmarks.response_compression --limit 100 --repeat 50
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# 실제 데이터베이스를 건드리지 않도록 app을 import하기 전에 전용 SQLite로 고정
+BENCH_DATABASE_PATH = os.path.join(tempfile.gettempdir(), "lineup_compression_bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{BENCH_DATABASE_PATH}"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.enums.player_role import PlayerRole
+from app.main import app
+from app.models.game import Game
+from app.models.lineup import Lineup
+from app.models.lineup_player import LineupPlayer
+from app.models.player import Player
+from app.models.team import Team
+from app.models.venue import Venue
+from app.utils.compression import BROTLI_QUALITY, GZIP_LEVEL, brotli, compress_body
+from app.utils.database import Base, engine
+from benchmarks.fixtures import player_name
+
+LINEUP_POSITIONS = ["P", "C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH"]
+ENDPOINTS = {
+    "players": "/api/v1/players/?limit={limit}",
+    "games": "/api/v1/games/?limit={limit}",
+    "lineups": "/api/v1/lineups/?limit={limit}",
+}
+
+
+def seed_database(players: int, games: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    start = datetime(2025, 3, 1, 14, 0)
+    with engine.begin() as connection:
+        connection.execute(insert(Team), [
+            {"name": f"팀{i}", "city": "서울", "league": "주말 리그", "is_our_team": i == 0, "is_active": True}
+            for i in range(20)
+        ])
+        connection.execute(insert(Venue), [
+            {"name": f"경기장{i}", "location": "서울시 송파구", "capacity": 500,
+             "surface_type": "인조잔디", "is_indoor": False}
+            for i in range(10)
+        ])
+        connection.execute(insert(Player), [
+            {
+                "name": player_name(i),
+                "number": str(i),
+                "phone": f"010-{1000 + i:04d}-{i % 10000:04d}",
+                "role": PlayerRole.PLAYER,
+                "position_preference": LINEUP_POSITIONS[i % len(LINEUP_POSITIONS)],
+                "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(players)
+        ])
+        connection.execute(insert(Game), [
+            {
+                "game_date": start + timedelta(days=i),
+                "venue_id": i % 10 + 1,
+                "opponent_team_id": i % 19 + 2,
+                "notes": "우천 시 취소" if i % 5 == 0 else None,
+            }
+            for i in range(games)
+        ])
+        connection.execute(insert(Lineup), [{"game_id": i + 1, "name": f"{i + 1}차전 라인업"} for i in range(games)])
+        connection.execute(insert(LineupPlayer), [
+            {
+                "lineup_id": lineup_id,
+                "player_id": (lineup_id * 7 + order) % players + 1,
+                "position": position,
+                "batting_order": order,
+            }
+            for lineup_id in range(1, games + 1)
+            for order, position in enumerate(LINEUP_POSITIONS)
+        ])
+
+
+def wire_size(client: TestClient, url: str, encoding: str) -> tuple:
+    """(전송 바이트, Content-Encoding) - 압축을 풀기 전의 원본 바이트"""
+    with client.stream("GET", url, headers={"Accept-Encoding": encoding}) as response:
+        response.raise_for_status()
+        raw = b"".join(response.iter_raw())
+        return len(raw), response.headers.get("content-encoding", "identity")
+
+
+def compress_ms(body: bytes, encoding: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        compress_body(body, encoding)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 압축 전후 크기 비교")
+    parser.add_argument("--limit", type=int, default=20, help="목록 limit (앱 기본값 20)")
+    parser.add_argument("--players", type=int, default=300, help="선수 수")
+    parser.add_argument("--games", type=int, default=100, help="경기 수 (경기마다 라인업 1개)")
+    parser.add_argument("--repeat", type=int, default=20, help="압축 시간 측정 반복 횟수")
+    args = parser.parse_args()
+
+    seed_database(args.players, args.games)
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+    print(f"gzip level {GZIP_LEVEL}, brotli quality {BROTLI_QUALITY if brotli is not None else '(brotli 미설치)'}")
+    print(f"{'endpoint':<12}{'identity':>10}" + "".join(f"{e:>10}{e + ' %':>8}{e + ' ms':>9}" for e in encodings))
+
+    client = TestClient(app)
+    for name, url in ENDPOINTS.items():
+        url = url.format(limit=args.limit)
+        body = client.get(url, headers={"Accept-Encoding": "identity"}).content
+        identity, _ = wire_size(client, url, "identity")
+        line = f"{name:<12}{identity:>10}"
+        for encoding in encodings:
+            size, applied = wire_size(client, url, encoding)
+            if applied != encoding:
+                line += f"{size:>10}{'-':>8}{'-':>9}"
+                continue
+            line += f"{size:>10}{size / identity:>8.0%}{compress_ms(body, encoding, args.repeat):>9.2f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
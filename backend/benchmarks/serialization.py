@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+목록 응답 직렬화 CPU 비교
+큰 목록 엔드포인트(라인업/경기/선수)의 핸들러를 직접 호출하면서 응답을 만드는 부분만 재서
+세 경로를 비교합니다. 세 경로의 JSON이 서로 다르면 종료 코드 1로 끝납니다.
+
+- validated: response_model 검증 -> jsonable_encoder -> 표준 json (이전 FastAPI 기본 경로)
+- dump_json: response_model 검증 -> pydantic JSON 직렬화 (최신 FastAPI의 기본 경로)
+- trusted:   검증 없이 스키마 필드만 골라 orjson (app/utils/responses.py)
+
+사용법:
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --limit 200 --repeat 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from functools import lru_cache
+from typing import List
+
+# 압축 벤치마크와 같은 데이터 (전용 SQLite로 고정하는 부분 포함)
+from benchmarks.response_compression import seed_database
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+from app.routers import games, lineups, players
+from app.utils.database import AsyncSessionLocal
+from app.utils.responses import trusted_response
+
+# 조건부 요청 헤더가 없는 요청 (ETag를 검사하는 핸들러용)
+PLAIN_REQUEST = Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []})
+
+HANDLERS = {
+    "lineups": (lineups, lineups.get_lineups, {"skip": 0, "game_id": None}),
+    "games": (games, games.get_games, {"skip": 0, "status": None}),
+    "players": (players, players.get_players, {"request": PLAIN_REQUEST, "skip": 0, "active": None, "role": None}),
+}
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def validated_response(model, content, **kwargs) -> Response:
+    adapter = _list_adapter(model)
+    value = adapter.validate_python(content, from_attributes=True)
+    return JSONResponse(jsonable_encoder(adapter.dump_python(value, mode="json")), **kwargs)
+
+
+def dump_json_response(model, content, **kwargs) -> Response:
+    adapter = _list_adapter(model)
+    value = adapter.validate_python(content, from_attributes=True)
+    return Response(adapter.dump_json(value), media_type="application/json", **kwargs)
+
+
+PATHS = {
+    "validated": validated_response,
+    "dump_json": dump_json_response,
+    "trusted": trusted_response,
+}
+
+
+async def measure(module, handler, kwargs: dict, build, repeat: int) -> tuple:
+    """(응답 생성 ms 목록, 마지막 응답 본문) - 핸들러 중 응답을 만드는 부분만 잼"""
+    timings = []
+    body = None
+
+    def timed_build(model, content, **response_kwargs):
+        started = time.perf_counter()
+        response = build(model, content, **response_kwargs)
+        timings.append((time.perf_counter() - started) * 1000)
+        return response
+
+    original = module.trusted_response
+    module.trusted_response = timed_build
+    try:
+        async with AsyncSessionLocal() as db:
+            for _ in range(repeat + 1):
+                body = (await handler(db=db, **kwargs)).body
+    finally:
+        module.trusted_response = original
+    return timings[1:], body  # 첫 호출(스키마 준비)은 제외
+
+
+async def run(limit: int, repeat: int) -> list:
+    mismatches = []
+    print(f"{'endpoint':<10}{'bytes':>9}" + "".join(f"{path + ' ms':>14}" for path in PATHS) + f"{'saved':>8}")
+    for name, (module, handler, kwargs) in HANDLERS.items():
+        results = {}
+        bodies = {}
+        for path, build in PATHS.items():
+            timings, bodies[path] = await measure(module, handler, {**kwargs, "limit": limit}, build, repeat)
+            results[path] = statistics.median(timings)
+
+        expected = json.loads(bodies["validated"])
+        for path, body in bodies.items():
+            if json.loads(body) != expected:
+                mismatches.append(f"{name}: {path} 응답이 validated와 다름")
+
+        saved = 1 - results["trusted"] / results["validated"]
+        print(f"{name:<10}{len(bodies['trusted']):>9}"
+              + "".join(f"{results[path]:>14.2f}" for path in PATHS) + f"{saved:>8.0%}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 CPU 비교")
+    parser.add_argument("--limit", type=int, default=100, help="목록 limit")
+    parser.add_argument("--players", type=int, default=300, help="선수 수")
+    parser.add_argument("--games", type=int, default=200, help="경기 수 (경기마다 라인업 1개)")
+    parser.add_argument("--repeat", type=int, default=30, help="반복 횟수")
+    args = parser.parse_args()
+
+    seed_database(args.players, args.games)
+    mismatches = asyncio.run(run(args.limit, args.repeat))
+    if mismatches:
+        print("응답 불일치:")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        sys.exit(1)
+    print("세 경로의 응답이 같습니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,10 +34,13 @@ export const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
   const loginMutation = useMutation({
     mutationFn: loginWithToken,
     onSuccess: (data: LoginResponse) => {
-      const { access_token, user: userData } = data
+      const { access_token, refresh_token, user: userData } = data
       
       // 토큰과 사용자 정보를 localStorage에 저장
       localStorage.setItem('auth_token', access_token)
+      if (refresh_token) {
+        localStorage.setItem('auth_refresh_token', refresh_token)
+      }
       localStorage.setItem('auth_user', JSON.stringify(userData))
       
       // axios 기본 헤더에 토큰 설정
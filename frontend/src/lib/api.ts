@@ -84,6 +84,31 @@ api.interceptors.request.use(
   }
 )
 
+// 액세스 토큰 갱신 (동시에 여러 요청이 401을 받아도 갱신은 한 번만)
+let refreshPromise: Promise<string | null> | null = null
+
+const refreshAccessToken = (): Promise<string | null> => {
+  if (!refreshPromise) {
+    const refreshToken = localStorage.getItem('auth_refresh_token')
+    refreshPromise = (refreshToken
+      ? axios.post(`${FINAL_URL}/auth/refresh`, { refresh_token: refreshToken })
+          .then((response) => {
+            localStorage.setItem('auth_token', response.data.access_token)
+            localStorage.setItem('auth_refresh_token', response.data.refresh_token)
+            return response.data.access_token as string
+          })
+          .catch(() => {
+            localStorage.removeItem('auth_refresh_token')
+            return null
+          })
+      : Promise.resolve(null)
+    ).finally(() => {
+      refreshPromise = null
+    })
+  }
+  return refreshPromise
+}
+
 // 응답 인터셉터
 api.interceptors.response.use(
   (response) => {
@@ -92,7 +117,17 @@ api.interceptors.response.use(
     }
     return response
   },
-  (error) => {
+  async (error) => {
+    const config = error.config
+    // 액세스 토큰 만료 시 리프레시 토큰으로 갱신 후 한 번 재시도
+    if (error.response?.status === 401 && config && !config._retry && !config.url?.startsWith('/auth/')) {
+      config._retry = true
+      const accessToken = await refreshAccessToken()
+      if (accessToken) {
+        config.headers.Authorization = `Bearer ${accessToken}`
+        return api(config)
+      }
+    }
     console.error('API Response Error:', error.response?.data || error.message)
     return Promise.reject(error)
   }
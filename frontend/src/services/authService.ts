@@ -8,6 +8,8 @@ export interface PasswordChangeRequest {
 
 export interface PasswordChangeResponse {
   message: string
+  access_token?: string
+  refresh_token?: string
 }
 
 // 토큰 기반 로그인
@@ -30,7 +32,14 @@ export const getCurrentUser = async (): Promise<User> => {
 
 // 비밀번호 변경
 export const changePassword = async (passwordData: PasswordChangeRequest): Promise<PasswordChangeResponse> => {
-  const response = await api.post('/auth/change-password', passwordData)
+  const response = await api.post<PasswordChangeResponse>('/auth/change-password', passwordData)
+  // 비밀번호를 바꾸면 이전 토큰은 무효가 되므로 새로 받은 토큰으로 교체
+  if (response.data.access_token) {
+    localStorage.setItem('auth_token', response.data.access_token)
+  }
+  if (response.data.refresh_token) {
+    localStorage.setItem('auth_refresh_token', response.data.refresh_token)
+  }
   return response.data
 }
 
@@ -48,6 +57,12 @@ export const validateToken = async (token: string): Promise<boolean> => {
 
 // 로그아웃 (로컬 스토리지 정리)
 export const logout = (): void => {
+  // 서버의 리프레시 토큰 세션도 폐기 (실패해도 로컬 정리는 진행)
+  const refreshToken = localStorage.getItem('auth_refresh_token')
+  if (refreshToken) {
+    api.post('/auth/logout', { refresh_token: refreshToken }).catch(() => undefined)
+  }
   localStorage.removeItem('auth_token')
+  localStorage.removeItem('auth_refresh_token')
   localStorage.removeItem('auth_user')
 }
@@ -16,6 +16,7 @@ export interface LoginRequest {
 
 export interface LoginResponse {
   access_token: string
+  refresh_token?: string
   token_type: string
   user: User
 }